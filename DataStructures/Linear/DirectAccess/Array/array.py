@@ -1,7 +1,20 @@
+from array import array
+
+try:
+    import numpy as np
+except ImportError:  # NumPy is optional: only as_numpy() needs it
+    np = None
+
+
 # Array class to demonstrate array operations and their complexities
+#
+# By default the elements live in a Python list, which stores a pointer to a boxed object per element.
+# Passing an array-module typecode (e.g. 'i', 'q', 'd') stores the numbers unboxed in an array.array instead:
+# 4 or 8 bytes per element, one contiguous buffer that memoryview() and NumPy can read without copying.
 class Array:
-    def __init__(self):
-        self.array = []  # Initialize an empty array (Python list)
+    def __init__(self, typecode=None):
+        self.typecode = typecode  # None for a list of arbitrary objects, else the array.array typecode
+        self.array = self._new_storage()  # Initialize an empty array (Python list or array.array)
 
     # Time Complexity: O(1) - Accessing an element by its index
     def access_element(self, index):
@@ -9,12 +22,12 @@ class Array:
             raise IndexError("Index out of bounds")  # Raise error if index is invalid
         return self.array[index]  # Return the element at the specified index
 
-    # Time Complexity: O(n) - In the worst case, we traverse the entire array
+    # Time Complexity: O(n) - In the worst case, we traverse the entire array (in C, through list/array .index())
     def search_element(self, value):
-        for index, element in enumerate(self.array):
-            if element == value:  # If element is found
-                return index  # Return the index of the found element
-        return -1  # If element is not found, return -1
+        try:
+            return self.array.index(value)  # Return the index of the found element
+        except ValueError:
+            return -1  # If element is not found, return -1
 
     # Time Complexity: O(1) - Adding an element at the end of the array
     def insert_at_end(self, value):
@@ -37,6 +50,62 @@ class Array:
             raise IndexError("Index out of bounds")  # Raise error if index is invalid
         del self.array[index]  # Remove the element at the specified index
 
+    # Time Complexity: O(n + k log k) - One pass over the array for k insertions, plus sorting the positions
+    # Each value is inserted before the element currently at the matching position (len(array) appends),
+    # so positions always refer to the array as it was before the call. Values for the same position keep their order.
+    # Repeated insert_at_index calls would shift the array once per value: O(n * k).
+    def insert_many(self, positions, values):
+        positions = list(positions)
+        values = list(values)
+        if len(positions) != len(values):
+            raise ValueError("positions and values must have the same length")
+        for position in positions:
+            if position < 0 or position > len(self.array):
+                raise IndexError("Index out of bounds")  # Raise error if index is invalid
+
+        result = self._new_storage()
+        previous = 0
+        for i in sorted(range(len(positions)), key=positions.__getitem__):  # sorted() is stable
+            result.extend(self.array[previous:positions[i]])  # Copy the untouched run in one block
+            result.append(values[i])
+            previous = positions[i]
+        result.extend(self.array[previous:])
+        self.array[:] = result  # Replace the contents in place, so existing references see the new elements
+
+    # Time Complexity: O(n + k log k) - One pass over the array for k removals, plus sorting the indices
+    # Indices refer to the array as it was before the call; repeated indices are removed once.
+    def remove_many(self, indices):
+        indices = sorted(set(indices))
+        for index in indices:
+            if index < 0 or index >= len(self.array):
+                raise IndexError("Index out of bounds")  # Raise error if index is invalid
+
+        result = self._new_storage()
+        previous = 0
+        for index in indices:
+            result.extend(self.array[previous:index])  # Copy the kept run in one block
+            previous = index + 1
+        result.extend(self.array[previous:])
+        self.array[:] = result
+
+    # Time Complexity: O(1) - A view on the underlying buffer, no copy
+    # Other components can read (and write) the elements through it. While a view is alive,
+    # array.array refuses to resize, so operations that change the length raise BufferError.
+    def as_memoryview(self):
+        if self.typecode is None:
+            raise TypeError("Only typed arrays expose a buffer")
+        return memoryview(self.array)
+
+    # Buffer protocol (Python 3.12+): memoryview(Array(...)) and NumPy read the typed buffer directly
+    def __buffer__(self, flags):
+        return self.as_memoryview()
+
+    # Time Complexity: O(1) - A NumPy array sharing the typed buffer, no copy
+    def as_numpy(self):
+        if np is None:
+            raise ImportError("as_numpy() requires NumPy")
+        return np.frombuffer(self.as_memoryview(), dtype=self.typecode)
+
     # Time Complexity: O(n) - Traversing through each element to print it
     def print_array(self):
         for element in self.array:  # Iterate through each element
@@ -46,3 +115,7 @@ class Array:
     # Time Complexity: O(1) - Getting the length of the array
     def get_length(self):
         return len(self.array)  # Return the length of the array
+
+    # Helper method creating empty storage of the right kind: a list, or an array.array with the typecode
+    def _new_storage(self):
+        return [] if self.typecode is None else array(self.typecode)
@@ -0,0 +1,160 @@
+import mmap
+import os
+import struct
+
+try:
+    import numpy as np
+except ImportError:  # NumPy is optional: only as_numpy() needs it
+    np = None
+
+# File layout: a 16-byte header (magic, typecode, record size, record count) followed by fixed-width records.
+# The file is usually larger than the records it holds: the spare room lets insert_at_end() grow without remapping.
+# Record sizes of the array typecodes are those of the platform (e.g. 'l' is 4 bytes on Windows, 8 on Linux),
+# so the size is stored too and a file is refused on a platform where its typecode has another size.
+_MAGIC = b'MARR'
+_HEADER = struct.Struct('<4scB2xQ')  # magic, typecode, record size (0 in older files), padding, number of records
+_HEADER_SIZE = _HEADER.size  # 16 bytes
+
+
+# MappedArray is an Array of fixed-width numbers (array-module typecodes) stored in a memory-mapped file.
+# Only the pages that are touched are read from disk, so the array can be larger than RAM,
+# and reopening an existing file is instant whatever its size: nothing is loaded up front.
+# The records are read and written through a memoryview on the mapping, so slices are zero-copy views.
+class MappedArray:
+    INITIAL_CAPACITY = 1024  # Records allocated when a new file is created
+    DEFAULT_TYPECODE = 'q'  # Signed 64-bit integers
+
+    # Opens the array stored at 'path', or creates it if the file does not exist.
+    # 'typecode' picks the record type of a new file (default: DEFAULT_TYPECODE); for an existing file it is optional
+    # and, if given, must match the typecode stored in the file.
+    # An existing file that is not a MappedArray file raises ValueError and is left untouched.
+    def __init__(self, path, typecode=None):
+        self.path = path
+        exists = os.path.exists(path)
+        if not exists:
+            self.typecode = typecode if typecode is not None else self.DEFAULT_TYPECODE
+            self.itemsize = struct.calcsize(self.typecode)  # Checked before the file is created
+            self.length = 0
+        self._file = open(path, 'r+b' if exists else 'x+b')  # 'x': never truncate a file created meanwhile
+        if exists:
+            try:
+                self._read_header(typecode)
+            except ValueError:
+                self._file.close()
+                raise
+        if not exists:
+            self._file.truncate(_HEADER_SIZE + self.INITIAL_CAPACITY * self.itemsize)
+        self._map()
+        if not exists:
+            self._write_header()
+
+    # Helper method reading and checking the header of an existing file
+    def _read_header(self, typecode):
+        header = self._file.read(_HEADER_SIZE)
+        if len(header) < _HEADER_SIZE:
+            raise ValueError(f"{self.path} is not a MappedArray file")
+        magic, stored_typecode, stored_itemsize, self.length = _HEADER.unpack(header)
+        if magic != _MAGIC:
+            raise ValueError(f"{self.path} is not a MappedArray file")
+        self.typecode = stored_typecode.decode('ascii')
+        if typecode is not None and typecode != self.typecode:
+            raise ValueError(f"{self.path} holds typecode {self.typecode!r}, not {typecode!r}")
+        self.itemsize = struct.calcsize(self.typecode)
+        if stored_itemsize and stored_itemsize != self.itemsize:
+            raise ValueError(f"{self.path} holds {stored_itemsize}-byte {self.typecode!r} records, "
+                             f"but {self.typecode!r} is {self.itemsize} bytes on this platform")
+
+    # Time Complexity: O(1) - Accessing an element by its index
+    def access_element(self, index):
+        if index < 0 or index >= self.length:
+            raise IndexError("Index out of bounds")  # Raise error if index is invalid
+        return self._records[index]
+
+    # Time Complexity: O(1) - Overwriting an element by its index
+    def update_element(self, index, value):
+        if index < 0 or index >= self.length:
+            raise IndexError("Index out of bounds")  # Raise error if index is invalid
+        self._records[index] = value
+
+    # Time Complexity: O(1) amortized - Adding an element at the end of the array
+    # When the file is full it grows to twice its capacity (at least INITIAL_CAPACITY records, so a file with
+    # no room for records grows too) and is mapped again (O(1) in memory: nothing is copied).
+    def insert_at_end(self, value):
+        if self.length == self.capacity:
+            self._grow(max(2 * self.capacity, self.INITIAL_CAPACITY))
+        self._records[self.length] = value
+        self.length += 1
+        self._write_header()
+
+    # Time Complexity: O(1) - Removing the element at the end of the array (the file keeps its size)
+    def remove_at_end(self):
+        if self.length == 0:
+            raise IndexError("Array is empty")
+        self.length -= 1
+        self._write_header()
+
+    # Time Complexity: O(1) - Getting the length of the array
+    def get_length(self):
+        return self.length  # Return the length of the array
+
+    # Time Complexity: O(1) - A memoryview on records [start, stop), no copy
+    # While a slice (or anything made from it) is alive, the file cannot grow: insert_at_end() raises BufferError.
+    def slice(self, start=0, stop=None):
+        if stop is None:
+            stop = self.length
+        if start < 0 or stop > self.length or start > stop:
+            raise IndexError("Slice out of bounds")
+        return self._records[start:stop]
+
+    # Time Complexity: O(1) - A NumPy array on records [start, stop), sharing the mapping, no copy
+    def as_numpy(self, start=0, stop=None):
+        if np is None:
+            raise ImportError("as_numpy() requires NumPy")
+        return np.frombuffer(self.slice(start, stop), dtype=self.typecode)
+
+    # Writes the changes back to the file
+    def flush(self):
+        self._mmap.flush()
+
+    # Flushes and unmaps the file; the MappedArray cannot be used afterwards
+    def close(self):
+        if self._mmap is not None:
+            self._mmap.flush()
+            self._records.release()
+            self._mmap.close()
+            self._mmap = None
+            self._file.close()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc_info):
+        self.close()
+
+    # Helper method mapping the whole file and viewing everything after the header as typed records
+    def _map(self):
+        self._mmap = mmap.mmap(self._file.fileno(), 0)
+        self.capacity = (len(self._mmap) - _HEADER_SIZE) // self.itemsize
+        self._view_records()
+
+    # Helper method creating the typed memoryview on the records of the current mapping
+    def _view_records(self):
+        end = _HEADER_SIZE + self.capacity * self.itemsize
+        self._records = memoryview(self._mmap)[_HEADER_SIZE:end].cast(self.typecode)
+
+    # Helper method enlarging the file to 'capacity' records and mapping it again
+    def _grow(self, capacity):
+        self._mmap.flush()
+        self._records.release()
+        try:
+            self._mmap.close()
+        except BufferError:
+            # Slices of the old mapping are still alive: keep using it and let the caller release them first
+            self._view_records()
+            raise
+        self._file.truncate(_HEADER_SIZE + capacity * self.itemsize)
+        self._map()
+
+    # Helper method storing the typecode and the number of records in the header
+    def _write_header(self):
+        _HEADER.pack_into(self._mmap, 0, _MAGIC, self.typecode.encode('ascii'), self.itemsize, self.length)
@@ -1,5 +1,8 @@
 # Node class represents a single element in a circular linked list.
+# __slots__ stores the attributes in fixed slots instead of a per-instance __dict__, which saves memory per node.
 class Node:
+    __slots__ = ('data', 'next')
+
     def __init__(self, data=None):
         self.data = data  # 'data' stores the value of the node
         self.next = None  # 'next' is a reference to the next node in the list
@@ -9,6 +12,7 @@ class CircularLinkedList:
     def __init__(self):
         self.head = None  # 'head' points to the first node in the list
         self.tail = None  # 'tail' points to the last node in the list
+        self.size = 0  # Number of nodes, kept up to date by every insertion and removal
 
     # Time Complexity: O(n)
     # Prints the circular linked list
@@ -26,23 +30,20 @@ class CircularLinkedList:
                 break
         print(llstr)
 
-    # Time Complexity: O(n)
-    # Returns the number of nodes in the list
+    # Time Complexity: O(1)
+    # Returns the number of nodes in the list (the size counter is maintained by every insertion and removal)
     def get_length(self):
-        if self.head is None:
-            return 0  # If the list is empty
+        return self.size
 
-        count = 1  # Start with 1 to count the head
-        itr = self.head.next  # Start from the node after head
-        while itr != self.head:
-            count += 1
-            itr = itr.next
-        return count
+    # Time Complexity: O(1)
+    def __len__(self):
+        return self.size
 
     # Time Complexity: O(1)
     # Inserts a new node at the beginning of the list
     def insert_at_beginning(self, data):
         node = Node(data)
+        self.size += 1
         if self.head is None:
             self.head = node  # If the list is empty, set head to new node
             self.tail = node  # Set tail to new node
@@ -56,6 +57,7 @@ class CircularLinkedList:
     # Inserts a new node at the end of the list
     def insert_at_end(self, data):
         node = Node(data)
+        self.size += 1
         if self.head is None:
             self.head = node  # If the list is empty, set head to new node
             self.tail = node  # Set tail to new node
@@ -71,6 +73,7 @@ class CircularLinkedList:
         if self.head is None:
             raise Exception("List is empty")  # Raise exception if the list is empty
 
+        self.size -= 1
         if self.head == self.tail:  # If there's only one node
             self.head = None  # Set head to None
             self.tail = None  # Set tail to None
@@ -84,6 +87,7 @@ class CircularLinkedList:
         if self.head is None:
             raise Exception("List is empty")  # Raise exception if the list is empty
 
+        self.size -= 1
         if self.head == self.tail:  # If there's only one node
             self.head = None  # Set head to None
             self.tail = None  # Set tail to None
@@ -114,5 +118,6 @@ class CircularLinkedList:
     def insert_values(self, data_list):
         self.head = None  # Reset the linked list (make it empty)
         self.tail = None  # Reset the tail
+        self.size = 0
         for data in data_list:  # Iterate through each element in the data_list
             self.insert_at_end(data)  # Insert each element at the end of the circular linked list
@@ -0,0 +1,110 @@
+from DataStructures.Linear.Sequential.LinkedList.node_pool import NIL, NodePool
+
+
+# PooledCircularLinkedList is a circular linked list with the same methods as CircularLinkedList,
+# but its nodes live in a NodePool (parallel arrays) instead of one Node object per element.
+# 'head' and 'tail' are node indices (NIL when the list is empty); the tail links back to the head.
+class PooledCircularLinkedList:
+    def __init__(self):
+        self.pool = NodePool()  # Storage for the nodes
+        self.head = NIL  # Index of the first node
+        self.tail = NIL  # Index of the last node
+        self.size = 0  # Number of nodes in the list
+
+    # Time Complexity: O(n)
+    # Prints the circular linked list
+    def print_list(self):
+        if self.head == NIL:  # If the list is empty
+            print("Circular linked list is empty")
+            return
+        print(''.join(str(data) + ' --> ' for data in self.convert_to_array()))
+
+    # Time Complexity: O(1)
+    # Returns the number of nodes in the list (kept up to date by every insertion and removal)
+    def get_length(self):
+        return self.size
+
+    # Time Complexity: O(1)
+    def __len__(self):
+        return self.size
+
+    # Time Complexity: O(1)
+    # Inserts a new node at the beginning of the list
+    def insert_at_beginning(self, data):
+        if self.head == NIL:
+            node = self.pool.allocate(data)
+            self.pool.next[node] = node  # Point the new node to itself
+            self.head = self.tail = node
+        else:
+            node = self.pool.allocate(data, self.head)  # Link new node to the current head
+            self.pool.next[self.tail] = node  # The tail now points to the new node
+            self.head = node
+        self.size += 1
+
+    # Time Complexity: O(1)
+    # Inserts a new node at the end of the list
+    def insert_at_end(self, data):
+        if self.head == NIL:
+            node = self.pool.allocate(data)
+            self.pool.next[node] = node  # Point the new node to itself
+            self.head = self.tail = node
+        else:
+            node = self.pool.allocate(data, self.head)  # Link new node to the head
+            self.pool.next[self.tail] = node  # Link current tail to the new node
+            self.tail = node
+        self.size += 1
+
+    # Time Complexity: O(1)
+    # Removes the node at the beginning of the list
+    def remove_at_beginning(self):
+        if self.head == NIL:
+            raise Exception("List is empty")
+
+        removed = self.head
+        if self.head == self.tail:  # If there's only one node
+            self.head = self.tail = NIL
+        else:
+            self.head = self.pool.next[removed]  # Update head to the next node
+            self.pool.next[self.tail] = self.head  # Update tail to skip the removed head
+        self.pool.release(removed)
+        self.size -= 1
+
+    # Time Complexity: O(n)
+    # Removes the node at the end of the list
+    def remove_at_end(self):
+        if self.head == NIL:
+            raise Exception("List is empty")
+
+        removed = self.tail
+        if self.head == self.tail:  # If there's only one node
+            self.head = self.tail = NIL
+        else:
+            next = self.pool.next
+            itr = self.head
+            while next[itr] != self.tail:  # Find the second to last node
+                itr = next[itr]
+            next[itr] = self.head  # Update the second to last node to point to head
+            self.tail = itr
+        self.pool.release(removed)
+        self.size -= 1
+
+    # Time Complexity: O(n)
+    # Converts the circular linked list to a Python list (array)
+    def convert_to_array(self):
+        data, next = self.pool.data, self.pool.next
+        array = []
+        itr = self.head
+        for _ in range(self.size):
+            array.append(data[itr])
+            itr = next[itr]
+        return array
+
+    # Time Complexity: O(k)
+    # Inserts multiple values from a list into the circular linked list (replacing its contents)
+    def insert_values(self, data_list):
+        self.size = self.pool.load(data_list)
+        if self.size:
+            self.head, self.tail = 0, self.size - 1
+            self.pool.next[self.tail] = self.head  # Close the circle
+        else:
+            self.head = self.tail = NIL
@@ -1,5 +1,8 @@
 # Node class represents a single element in a doubly linked list.
+# __slots__ stores the attributes in fixed slots instead of a per-instance __dict__, which saves memory per node.
 class Node:
+    __slots__ = ('data', 'next', 'previous')
+
     def __init__(self, data=None, next=None, previous=None):
         self.data = data  # 'data' stores the value of the node
         self.next = next  # 'next' is a reference to the next node in the list
@@ -7,9 +10,16 @@ class Node:
 
 # DoublyLinkedList class manages the doubly linked list and supports various operations.
 class DoublyLinkedList:
-    def __init__(self):
+    def __init__(self, use_finger=False):
         self.head = None  # 'head' points to the first node in the list. Initially, the list is empty.
         self.tail = None  # 'tail' points to the last node in the list for efficient end operations.
+        self.size = 0  # Number of nodes, kept up to date by every insertion and removal.
+        # Optional "finger": the last node reached by index and its position.
+        # Indexed operations walk from whichever of head, tail or finger is closest,
+        # so sequential indexed access (0, 1, 2, ...) costs O(1) amortized per call.
+        self.use_finger = use_finger
+        self._finger = None
+        self._finger_index = 0
 
     # Prints the linked list in forward order
     # Time Complexity: O(n)
@@ -40,19 +50,27 @@ class DoublyLinkedList:
         print("Linked list in reverse: ", llstr)
 
     # Returns the number of nodes in the list
-    # Time Complexity: O(n)
+    # Time Complexity: O(1) - the size counter is maintained by every insertion and removal
     def get_length(self):
-        count = 0
-        itr = self.head
-        while itr:
-            count += 1
-            itr = itr.next
-        return count
+        return self.size
+
+    # Time Complexity: O(1)
+    def __len__(self):
+        return self.size
+
+    # Returns the value stored at a specific index
+    # Time Complexity: O(n) - at most n/2 steps from the closer end, O(1) amortized for sequential access with the finger
+    def get_at(self, index):
+        if index < 0 or index >= self.size:
+            raise Exception("Invalid Index")
+        return self._node_at(index).data
 
     # Inserts a new node at the beginning of the list
     # Time Complexity: O(1)
     def insert_at_beginning(self, data):
         node = Node(data, self.head, None)  # Create a new node with 'previous' as None
+        self.size += 1
+        self._finger_index += 1  # Every existing node moved one position to the right
         if self.head is None:
             self.head = self.tail = node  # If list is empty, head and tail are the same
         else:
@@ -63,6 +81,7 @@ class DoublyLinkedList:
     # Time Complexity: O(1)
     def insert_at_end(self, data):
         node = Node(data, None, self.tail)  # Create a new node with 'next' as None and 'previous' as the current tail
+        self.size += 1
         if self.tail is None:
             self.head = self.tail = node  # If the list is empty, both head and tail point to the new node
         else:
@@ -75,6 +94,10 @@ class DoublyLinkedList:
         if self.head is None:
             raise Exception("List is empty")  # Raise exception if the list is empty
 
+        if self._finger is self.head:
+            self._finger = None  # The finger pointed at the removed node
+        self.size -= 1
+        self._finger_index -= 1  # Every remaining node moved one position to the left
         if self.head == self.tail:  # If there's only one node
             self.head = self.tail = None  # Set both head and tail to None
         else:
@@ -87,6 +110,9 @@ class DoublyLinkedList:
         if self.tail is None:
             raise Exception("List is empty")  # Raise exception if the list is empty
 
+        if self._finger is self.tail:
+            self._finger = None  # The finger pointed at the removed node
+        self.size -= 1
         if self.head == self.tail:  # If there's only one node
             self.head = self.tail = None  # Set both head and tail to None
         else:
@@ -99,55 +125,45 @@ class DoublyLinkedList:
         return self.tail  # Return the tail, which is the last node in the list
 
     # Inserts a new node at a specific index
-    # Time Complexity: O(n)
+    # Time Complexity: O(n) - at most n/2 steps, walking from whichever end (or the finger) is closer
     def insert_at(self, index, data):
-        if index < 0 or index > self.get_length():
+        if index < 0 or index > self.size:
             raise Exception("Invalid Index")
 
         if index == 0:
             self.insert_at_beginning(data)
             return
 
-        if index == self.get_length():
+        if index == self.size:
             self.insert_at_end(data)
             return
 
-        count = 0
-        itr = self.head
-        while itr:
-            if count == index - 1:
-                node = Node(data, itr.next, itr)  # Create a new node with 'next' and 'previous' references
-                if node.next:
-                    node.next.previous = node  # Update the next node's previous pointer
-                itr.next = node  # Insert the new node after the current node
-                break
-            itr = itr.next
-            count += 1
+        itr = self._node_at(index - 1)  # Node just before the desired index
+        node = Node(data, itr.next, itr)  # Create a new node with 'next' and 'previous' references
+        node.next.previous = node  # Update the next node's previous pointer
+        itr.next = node  # Insert the new node after the current node
+        self.size += 1
 
     # Removes the node at a specific index
-    # Time Complexity: O(n)
+    # Time Complexity: O(n) - at most n/2 steps, walking from whichever end (or the finger) is closer
     def remove_at(self, index):
-        if index < 0 or index >= self.get_length():
+        if index < 0 or index >= self.size:
             raise Exception("Invalid Index")
 
         if index == 0:
             self.remove_at_beginning()  # Call the remove_at_beginning method
             return
 
-        if index == self.get_length() - 1:
+        if index == self.size - 1:
             self.remove_at_end()  # Call the remove_at_end method
             return
 
-        itr = self.head
-        count = 0
-        while itr:
-            if count == index:
-                itr.previous.next = itr.next  # Bypass the node to be removed
-                if itr.next:  # If it's not the last node, update the next node's previous pointer
-                    itr.next.previous = itr.previous
-                break
-            itr = itr.next
-            count += 1
+        itr = self._node_at(index)
+        itr.previous.next = itr.next  # Bypass the node to be removed
+        itr.next.previous = itr.previous  # Update the next node's previous pointer
+        self.size -= 1
+        if self.use_finger:
+            self._finger, self._finger_index = itr.previous, index - 1  # Keep the finger on a live node
 
     # Converts the linked list to a Python list (array)
     # Time Complexity: O(n)
@@ -163,5 +179,27 @@ class DoublyLinkedList:
     # Time Complexity: O(kn) - Where k is the length of the data_list and n is the length of the linked list.
     def insert_values(self, data_list):
         self.head = self.tail = None  # Reset the linked list
+        self.size = 0
+        self._finger = None
         for data in data_list:
             self.insert_at_end(data)  # Insert each element at the end of the list
+
+    # Helper method returning the node at a specific index (the index must be valid)
+    # Time Complexity: O(n) - walks from whichever of head, tail or finger is closest to 'index'
+    def _node_at(self, index):
+        itr, count = self.head, 0  # Walking forward from the head takes 'index' steps
+        distance = index
+        if self.size - 1 - index < distance:  # Walking backward from the tail is shorter
+            itr, count = self.tail, self.size - 1
+            distance = count - index
+        if self._finger is not None and abs(index - self._finger_index) < distance:  # The finger is closer still
+            itr, count = self._finger, self._finger_index
+        while count < index:
+            itr = itr.next
+            count += 1
+        while count > index:
+            itr = itr.previous
+            count -= 1
+        if self.use_finger:
+            self._finger, self._finger_index = itr, index  # Remember where we stopped
+        return itr
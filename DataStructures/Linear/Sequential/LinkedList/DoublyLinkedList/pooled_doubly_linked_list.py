@@ -0,0 +1,171 @@
+from DataStructures.Linear.Sequential.LinkedList.node_pool import NIL, NodePool
+
+
+# PooledDoublyLinkedList is a doubly linked list with the same methods as DoublyLinkedList,
+# but its nodes live in a NodePool (parallel 'next'/'previous' index arrays) instead of one Node object per element.
+# 'head' and 'tail' are node indices (NIL when the list is empty).
+class PooledDoublyLinkedList:
+    def __init__(self):
+        self.pool = NodePool(doubly=True)  # Storage for the nodes
+        self.head = NIL  # Index of the first node
+        self.tail = NIL  # Index of the last node
+        self.size = 0  # Number of nodes in the list
+
+    # Prints the linked list in forward order
+    # Time Complexity: O(n)
+    def print_forward(self):
+        if self.head == NIL:  # If the list is empty
+            print("Linked list is empty")
+            return
+        print(''.join(str(data) + ' --> ' for data in self._values(self.head, self.pool.next)))
+
+    # Prints the linked list in backward order
+    # Time Complexity: O(n)
+    def print_backward(self):
+        if self.tail == NIL:  # If the list is empty
+            print("Linked list is empty")
+            return
+        llstr = ''.join(str(data) + ' <-- ' for data in self._values(self.tail, self.pool.previous))
+        print("Linked list in reverse: ", llstr)
+
+    # Returns the number of nodes in the list
+    # Time Complexity: O(1) - the size is kept up to date by every insertion and removal
+    def get_length(self):
+        return self.size
+
+    # Time Complexity: O(1)
+    def __len__(self):
+        return self.size
+
+    # Inserts a new node at the beginning of the list
+    # Time Complexity: O(1)
+    def insert_at_beginning(self, data):
+        node = self.pool.allocate(data, self.head, NIL)
+        if self.head == NIL:
+            self.head = self.tail = node  # If list is empty, head and tail are the same
+        else:
+            self.pool.previous[self.head] = node  # Update the previous pointer of the current head
+            self.head = node
+        self.size += 1
+
+    # Inserts a new node at the end of the list
+    # Time Complexity: O(1)
+    def insert_at_end(self, data):
+        node = self.pool.allocate(data, NIL, self.tail)
+        if self.tail == NIL:
+            self.head = self.tail = node  # If the list is empty, head and tail are the same
+        else:
+            self.pool.next[self.tail] = node  # Update the next pointer of the current tail
+            self.tail = node
+        self.size += 1
+
+    # Removes the node at the beginning of the list
+    # Time Complexity: O(1)
+    def remove_at_beginning(self):
+        if self.head == NIL:
+            raise Exception("List is empty")
+
+        removed = self.head
+        if self.head == self.tail:  # If there's only one node
+            self.head = self.tail = NIL
+        else:
+            self.head = self.pool.next[removed]  # Move the head to the second node
+            self.pool.previous[self.head] = NIL
+        self.pool.release(removed)
+        self.size -= 1
+
+    # Removes the node at the end of the list
+    # Time Complexity: O(1)
+    def remove_at_end(self):
+        if self.tail == NIL:
+            raise Exception("List is empty")
+
+        removed = self.tail
+        if self.head == self.tail:  # If there's only one node
+            self.head = self.tail = NIL
+        else:
+            self.tail = self.pool.previous[removed]  # Move the tail back to the previous node
+            self.pool.next[self.tail] = NIL
+        self.pool.release(removed)
+        self.size -= 1
+
+    # Helper method to get the last node (its index in the pool, NIL if the list is empty)
+    # Time Complexity: O(1)
+    def get_last_node(self):
+        return self.tail
+
+    # Inserts a new node at a specific index
+    # Time Complexity: O(n) - at most n/2 steps, walking from whichever end is closer
+    def insert_at(self, index, data):
+        if index < 0 or index > self.size:
+            raise Exception("Invalid Index")
+
+        if index == 0:
+            self.insert_at_beginning(data)
+            return
+        if index == self.size:
+            self.insert_at_end(data)
+            return
+
+        next, previous = self.pool.next, self.pool.previous
+        itr = self._node_at(index - 1)  # Node just before the desired index
+        node = self.pool.allocate(data, next[itr], itr)
+        previous[next[itr]] = node  # Update the next node's previous pointer
+        next[itr] = node  # Insert the new node after the current node
+        self.size += 1
+
+    # Removes the node at a specific index
+    # Time Complexity: O(n) - at most n/2 steps, walking from whichever end is closer
+    def remove_at(self, index):
+        if index < 0 or index >= self.size:
+            raise Exception("Invalid Index")
+
+        if index == 0:
+            self.remove_at_beginning()
+            return
+        if index == self.size - 1:
+            self.remove_at_end()
+            return
+
+        next, previous = self.pool.next, self.pool.previous
+        itr = self._node_at(index)
+        next[previous[itr]] = next[itr]  # Bypass the node to be removed
+        previous[next[itr]] = previous[itr]
+        self.pool.release(itr)
+        self.size -= 1
+
+    # Converts the linked list to a Python list (array)
+    # Time Complexity: O(n)
+    def convert_to_array(self):
+        return list(self._values(self.head, self.pool.next))
+
+    # Inserts multiple values from a list into the doubly linked list (replacing its contents)
+    # Time Complexity: O(k) - all nodes are allocated in one bulk operation
+    def insert_values(self, data_list):
+        self.size = self.pool.load(data_list)
+        self.head = 0 if self.size else NIL
+        self.tail = self.size - 1 if self.size else NIL
+
+    # Helper generator yielding the values starting at node 'start' and following 'links' (next or previous)
+    # Time Complexity: O(n)
+    def _values(self, start, links):
+        data = self.pool.data
+        itr = start
+        while itr != NIL:
+            yield data[itr]
+            itr = links[itr]
+
+    # Helper returning the index of the node at position 'index', walking from whichever end is closer
+    # Time Complexity: O(n) - at most n/2 steps
+    def _node_at(self, index):
+        if index <= self.size // 2:
+            next = self.pool.next
+            itr = self.head
+            for _ in range(index):
+                itr = next[itr]
+        else:
+            previous = self.pool.previous
+            itr = self.tail
+            for _ in range(self.size - 1 - index):
+                itr = previous[itr]
+        return itr
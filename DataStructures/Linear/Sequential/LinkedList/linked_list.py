@@ -1,14 +1,25 @@
 # Node class represents a single element in a linked list.
+# __slots__ stores the two attributes in fixed slots instead of a per-instance __dict__,
+# which saves roughly 100 bytes per node.
 class Node:
+    __slots__ = ('data', 'next')
+
     def __init__(self, data, next):
         self.data = data  # 'data' stores the value of the node
         self.next = next  # 'next' is a reference to the next node in the list
 
 # LinkedList class manages the linked list and supports various operations.
 class LinkedList:
-    def __init__(self):
+    def __init__(self, use_finger=False):
         self.head = None  # 'head' points to the first node in the list. Initially, the list is empty, so it's None.
         self.tail = None  # 'tail' points to the last node in the list. Initially, the list is empty, so it's None.
+        self.size = 0  # Number of nodes, kept up to date by every insertion and removal.
+        # Optional "finger": the last node reached by index and its position.
+        # Indexed operations at or after the finger start walking from it instead of from the head,
+        # so sequential indexed access (0, 1, 2, ...) costs O(1) amortized per call.
+        self.use_finger = use_finger
+        self._finger = None
+        self._finger_index = 0
 
         # Prints the linked list
     def print(self):
@@ -23,19 +34,28 @@ class LinkedList:
         print(llstr)
 
     # Returns the number of nodes in the linked list
+    # Time Complexity: O(1) - the size counter is maintained by every insertion and removal.
     def get_length(self):
-        count = 0  # Initialize a counter.
-        itr = self.head  # Start from the head of the list.
-        while itr:  # Loop until 'itr' becomes None (end of the list).
-            count += 1  # Increment the count for each node.
-            itr = itr.next  # Move to the next node.
-        return count  # Return the total number of nodes.
+        return self.size
+
+    # Time Complexity: O(1)
+    def __len__(self):
+        return self.size
+
+    # Returns the value stored at a specific index (0-based index)
+    # Time Complexity: O(n) - O(1) amortized for sequential access when the finger is enabled.
+    def get_at(self, index):
+        if index < 0 or index >= self.size:  # Check if the index is valid.
+            raise Exception("Invalid Index")
+        return self._node_at(index).data
 
     # Inserts a new node at the beginning of the linked list
     # Time Complexity: O(1) - Insertion at the beginning is constant time since we only update the head pointer.
     def insert_at_beginning(self, data):
         node = Node(data, self.head)  # Create a new node with 'data', and its 'next' points to the current head.
         self.head = node  # Update the head to point to the new node, making it the first node in the list.
+        self.size += 1
+        self._finger_index += 1  # Every existing node moved one position to the right.
 
         # If the list was empty, then head and tail are the same node.
         if self.tail is None:
@@ -44,6 +64,7 @@ class LinkedList:
     # Inserts a new node at the end of the linked list
     # Time Complexity: O(1) - we reference the last node
     def insert_at_end(self, data):
+        self.size += 1
         if self.head is None:  # If the list is empty, set the new node as the head.
             self.head = Node(data, None)  # The new node has 'data' and 'next' is None since it's the only node.
             self.tail = self.head  # Set tail to the head since there's only one node.
@@ -58,47 +79,50 @@ class LinkedList:
     def insert_values(self, data_list):
         self.head = None  # Reset the linked list (make it empty).
         self.tail = None  # Reset the tail as well.
+        self.size = 0
+        self._finger = None
         for data in data_list:  # Iterate through each element in the data_list.
             self.insert_at_end(data)  # Insert each element at the end of the linked list.
 
     # Removes the node at a specific index (0-based index)
     # Time Complexity: O(n) - In the worst case, we may need to traverse the entire list to remove the node at index n-1.
     def remove_at(self, index):
-        if index < 0 or index >= self.get_length():  # Check if the index is valid.
+        if index < 0 or index >= self.size:  # Check if the index is valid (O(1) thanks to the size counter).
             raise Exception("Invalid Index")  # Raise an exception if the index is out of bounds.
 
         if index == 0:  # If the index is 0, remove the head node.
+            if self._finger is self.head:
+                self._finger = None  # The finger pointed at the removed node.
             self.head = self.head.next  # Make the second node (head.next) the new head.
+            if self.head is None:  # The list is now empty.
+                self.tail = None
+            self.size -= 1
+            self._finger_index -= 1  # Every remaining node moved one position to the left.
             return  # Exit after removing the node.
 
-        count = 0  # Initialize a counter.
-        itr = self.head  # Start from the head of the list.
-        while itr:  # Loop through the list.
-            if count == index - 1:  # Stop at the node just before the node to be removed.
-                itr.next = itr.next.next  # Remove the target node by bypassing it.
-                break  # Exit the loop after removing the node.
-            itr = itr.next  # Move to the next node.
-            count += 1  # Increment the counter.
+        itr = self._node_at(index - 1)  # Stop at the node just before the node to be removed.
+        if itr.next is self.tail:  # Removing the last node: the previous node becomes the tail.
+            self.tail = itr
+        itr.next = itr.next.next  # Remove the target node by bypassing it.
+        self.size -= 1
 
     # Inserts a new node at a specific index (0-based index)
     # Time Complexity: O(n) - In the worst case, we need to traverse the entire list to reach index n.
     def insert_at(self, index, data):
-        if index < 0 or index >= self.get_length():  # Check if the index is valid.
+        if index < 0 or index > self.size:  # Check if the index is valid (index == size appends at the end).
             raise Exception("Invalid Index")  # Raise an exception if the index is out of bounds.
 
         if index == 0:  # If the index is 0, insert at the beginning.
             self.insert_at_beginning(data)  # Use the existing insert_at_beginning method.
             return  # Exit after inserting the node.
 
-        count = 0  # Initialize a counter.
-        itr = self.head  # Start from the head of the list.
-        while itr:  # Loop through the list.
-            if count == index - 1:  # Stop at the node just before the desired index.
-                node = Node(data, itr.next)  # Create a new node with 'data'.
-                itr.next = node  # Link the previous node (at index-1) to the new node.
-                break  # Exit the loop after inserting the node.
-            itr = itr.next  # Move to the next node.
-            count += 1  # Increment the counter.
+        if index == self.size:  # If the index is the length, insert at the end in O(1).
+            self.insert_at_end(data)
+            return
+
+        itr = self._node_at(index - 1)  # Stop at the node just before the desired index.
+        itr.next = Node(data, itr.next)  # Link the previous node (at index-1) to the new node.
+        self.size += 1
 
     # Method to insert a new node with 'data_to_insert' after the first occurrence of 'data_after'
     # Time Complexity: O(n) - We may need to traverse the entire list to find 'data_after'.
@@ -106,16 +130,15 @@ class LinkedList:
         if self.head is None:  # If the list is empty, no insertion can happen
             return
 
-        if self.head.data == data_after:  # If the head node contains 'data_after'
-            # Insert the new node right after the head node
-            self.head.next = Node(data_to_insert, self.head.next)
-            return  # Exit after inserting the node
-
         itr = self.head  # Start traversing the list from the head
         while itr:  # Continue traversing until the end of the list
             if itr.data == data_after:  # When the node with 'data_after' is found
                 # Insert the new node after this node
                 itr.next = Node(data_to_insert, itr.next)
+                if itr is self.tail:  # Inserted after the last node: the new node is the tail.
+                    self.tail = itr.next
+                self.size += 1
+                self._finger = None  # Positions after 'itr' shifted, so forget the finger.
                 break  # Exit after insertion
             itr = itr.next  # Move to the next node
 
@@ -126,13 +149,17 @@ class LinkedList:
             return
 
         if data == self.head.data:  # If the head node contains the value 'data'
-            self.head = self.head.next  # Remove the head by making the second node the new head
+            self.remove_at(0)  # Remove the head by making the second node the new head
             return  # Exit after removal
 
         itr = self.head  # Start traversing the list from the head
         while itr.next:  # Continue until the second-to-last node (because we check 'itr.next')
             if itr.next.data == data:  # If the next node contains 'data'
+                if itr.next is self.tail:  # Removing the last node: 'itr' becomes the tail.
+                    self.tail = itr
                 itr.next = itr.next.next  # Bypass the node with 'data'
+                self.size -= 1
+                self._finger = None  # Positions after 'itr' shifted, so forget the finger.
                 break  # Exit after the node is removed
             itr = itr.next  # Move to the next node
 
@@ -146,3 +173,18 @@ class LinkedList:
             itr = itr.next  # Move to the next node.
         print(lista)  # Print the list that contains the linked list values.
 
+    # Helper method returning the node at a specific index (the index must be valid)
+    # Time Complexity: O(n) - O(1) for the last node, and O(distance) from the finger when it is enabled.
+    def _node_at(self, index):
+        if index == self.size - 1:  # The tail is referenced directly.
+            return self.tail
+        if self._finger is not None and self._finger_index <= index:
+            itr, count = self._finger, self._finger_index  # Resume walking from the finger.
+        else:
+            itr, count = self.head, 0  # Start from the head of the list.
+        while count < index:
+            itr = itr.next
+            count += 1
+        if self.use_finger:
+            self._finger, self._finger_index = itr, index  # Remember where we stopped.
+        return itr
@@ -0,0 +1,103 @@
+import gc
+import sys
+import time
+import tracemalloc
+
+from DataStructures.Linear.Sequential.LinkedList.linked_list import LinkedList
+from DataStructures.Linear.Sequential.LinkedList.pooled_linked_list import PooledLinkedList
+from DataStructures.Linear.Sequential.LinkedList.DoublyLinkedList.doubly_linked_list import DoublyLinkedList
+from DataStructures.Linear.Sequential.LinkedList.DoublyLinkedList.pooled_doubly_linked_list import PooledDoublyLinkedList
+from DataStructures.Linear.Sequential.LinkedList.CircularLinkedList.circular_linked_list import CircularLinkedList
+from DataStructures.Linear.Sequential.LinkedList.CircularLinkedList.pooled_circular_linked_list import PooledCircularLinkedList
+
+# Memory benchmark (tracemalloc) for the linked list node storage backends:
+#   - dict nodes:   plain Node classes with a per-instance __dict__ (how the nodes used to be defined)
+#   - slots nodes:  the current Node classes with __slots__
+#   - pooled:       NodePool, links stored in parallel array('l') index arrays
+# The payload values are created before measuring, so only the cost of the list structure itself is reported.
+# Run from the repository root:
+#   python -m DataStructures.Linear.Sequential.LinkedList.linked_list_memory_benchmark [num_elements]
+
+NUM_ELEMENTS = 1_000_000
+
+
+class DictNode:
+    def __init__(self, data=None, next=None):
+        self.data = data
+        self.next = next
+
+
+class DictDoublyNode:
+    def __init__(self, data=None, next=None, previous=None):
+        self.data = data
+        self.next = next
+        self.previous = previous
+
+
+def build_dict_singly(values):
+    head = tail = None
+    for value in values:
+        node = DictNode(value)
+        if head is None:
+            head = tail = node
+        else:
+            tail.next = node
+            tail = node
+    return head
+
+
+def build_dict_doubly(values):
+    head = tail = None
+    for value in values:
+        node = DictDoublyNode(value, None, tail)
+        if head is None:
+            head = tail = node
+        else:
+            tail.next = node
+            tail = node
+    return head
+
+
+def build_insert_values(cls):
+    def build(values):
+        linked_list = cls()
+        linked_list.insert_values(values)
+        return linked_list
+    return build
+
+
+def measure(build, values):
+    # Returns (bytes allocated by the structure, seconds to build it)
+    gc.collect()
+    tracemalloc.start()
+    start = time.perf_counter()
+    structure = build(values)
+    elapsed = time.perf_counter() - start
+    current, _ = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    del structure
+    return current, elapsed
+
+
+def run(num_elements=NUM_ELEMENTS):
+    values = list(range(num_elements))  # Payload created up front, outside the measurement
+    backends = [
+        ('singly', 'dict nodes', build_dict_singly),
+        ('singly', 'slots nodes', build_insert_values(LinkedList)),
+        ('singly', 'pooled', build_insert_values(PooledLinkedList)),
+        ('doubly', 'dict nodes', build_dict_doubly),
+        ('doubly', 'slots nodes', build_insert_values(DoublyLinkedList)),
+        ('doubly', 'pooled', build_insert_values(PooledDoublyLinkedList)),
+        ('circular', 'slots nodes', build_insert_values(CircularLinkedList)),
+        ('circular', 'pooled', build_insert_values(PooledCircularLinkedList)),
+    ]
+
+    print(f"{num_elements:,} elements")
+    print(f"{'list':<10}{'backend':<14}{'total (MB)':>12}{'bytes/element':>15}{'build (s)':>11}")
+    for kind, name, build in backends:
+        total, elapsed = measure(build, values)
+        print(f"{kind:<10}{name:<14}{total / 2 ** 20:>12.1f}{total / num_elements:>15.1f}{elapsed:>11.2f}")
+
+
+if __name__ == '__main__':
+    run(int(sys.argv[1]) if len(sys.argv) > 1 else NUM_ELEMENTS)
@@ -0,0 +1,57 @@
+from array import array
+
+# Index used as the "None" pointer of a pooled node
+NIL = -1
+
+
+# NodePool stores the nodes of a linked list in parallel arrays instead of one Python object per node.
+# A node is just an index i:
+#   data[i]      - the value of the node (a Python list, since values can be any object)
+#   next[i]      - index of the next node, or NIL
+#   previous[i]  - index of the previous node, or NIL (only for doubly linked lists)
+# The links are machine integers in array('l') (8 bytes each), not boxed objects.
+# Released indices are kept in a free list threaded through 'next', so they are reused by later allocations.
+class NodePool:
+    def __init__(self, doubly=False):
+        self.data = []  # Values of the nodes
+        self.next = array('l')  # 'next' links
+        self.previous = array('l') if doubly else None  # 'previous' links (doubly linked lists only)
+        self.free = NIL  # Head of the free list
+
+    # Time Complexity: O(1) amortized
+    # Returns the index of a new node, reusing a released one when possible
+    def allocate(self, data, next=NIL, previous=NIL):
+        index = self.free
+        if index != NIL:  # Reuse a released node
+            self.free = self.next[index]  # Pop it from the free list
+            self.data[index] = data
+            self.next[index] = next
+            if self.previous is not None:
+                self.previous[index] = previous
+        else:  # Grow the arrays by one node
+            index = len(self.data)
+            self.data.append(data)
+            self.next.append(next)
+            if self.previous is not None:
+                self.previous.append(previous)
+        return index
+
+    # Time Complexity: O(1)
+    # Gives a node back to the pool
+    def release(self, index):
+        self.data[index] = None  # Drop the reference so the value can be garbage collected
+        self.next[index] = self.free  # Push the node onto the free list
+        self.free = index
+
+    # Time Complexity: O(k), where k is the number of values
+    # Replaces the pool with a chain of nodes 0 -> 1 -> ... -> k-1 holding 'values' (one bulk allocation)
+    def load(self, values):
+        self.data = list(values)
+        count = len(self.data)
+        self.next = array('l', range(1, count + 1))
+        if count:
+            self.next[-1] = NIL
+        if self.previous is not None:
+            self.previous = array('l', range(-1, count - 1))
+        self.free = NIL
+        return count
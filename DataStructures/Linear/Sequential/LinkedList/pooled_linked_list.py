@@ -0,0 +1,151 @@
+from DataStructures.Linear.Sequential.LinkedList.node_pool import NIL, NodePool
+
+
+# PooledLinkedList is a singly linked list with the same methods as LinkedList,
+# but its nodes live in a NodePool (parallel arrays) instead of one Node object per element.
+# 'head' and 'tail' are node indices (NIL when the list is empty).
+class PooledLinkedList:
+    def __init__(self):
+        self.pool = NodePool()  # Storage for the nodes
+        self.head = NIL  # Index of the first node
+        self.tail = NIL  # Index of the last node
+        self.size = 0  # Number of nodes in the list
+
+    # Prints the linked list
+    # Time Complexity: O(n)
+    def print(self):
+        if self.head == NIL:
+            print("Linked list is empty")
+            return
+        print(''.join(str(data) + ' --> ' for data in self._values()))
+
+    # Returns the number of nodes in the linked list
+    # Time Complexity: O(1) - the size is kept up to date by every insertion and removal
+    def get_length(self):
+        return self.size
+
+    # Time Complexity: O(1)
+    def __len__(self):
+        return self.size
+
+    # Inserts a new node at the beginning of the linked list
+    # Time Complexity: O(1)
+    def insert_at_beginning(self, data):
+        self.head = self.pool.allocate(data, self.head)  # The new node points to the current head
+        if self.tail == NIL:  # If the list was empty, head and tail are the same node
+            self.tail = self.head
+        self.size += 1
+
+    # Inserts a new node at the end of the linked list
+    # Time Complexity: O(1) - we reference the last node
+    def insert_at_end(self, data):
+        node = self.pool.allocate(data)
+        if self.head == NIL:  # If the list is empty, the new node is both head and tail
+            self.head = self.tail = node
+        else:
+            self.pool.next[self.tail] = node  # Link the current tail to the new node
+            self.tail = node
+        self.size += 1
+
+    # Inserts multiple values from a list into the linked list (replacing its contents)
+    # Time Complexity: O(k) - all nodes are allocated in one bulk operation
+    def insert_values(self, data_list):
+        self.size = self.pool.load(data_list)
+        self.head = 0 if self.size else NIL
+        self.tail = self.size - 1 if self.size else NIL
+
+    # Removes the node at a specific index (0-based index)
+    # Time Complexity: O(n)
+    def remove_at(self, index):
+        if index < 0 or index >= self.size:
+            raise Exception("Invalid Index")
+
+        next = self.pool.next
+        if index == 0:  # Remove the head node
+            removed = self.head
+            self.head = next[removed]
+            if self.head == NIL:
+                self.tail = NIL
+        else:
+            itr = self._node_at(index - 1)  # Node just before the one to remove
+            removed = next[itr]
+            next[itr] = next[removed]  # Bypass the removed node
+            if removed == self.tail:
+                self.tail = itr
+        self.pool.release(removed)
+        self.size -= 1
+
+    # Inserts a new node at a specific index (0-based index)
+    # Time Complexity: O(n)
+    def insert_at(self, index, data):
+        if index < 0 or index > self.size:
+            raise Exception("Invalid Index")
+
+        if index == 0:
+            self.insert_at_beginning(data)
+            return
+        if index == self.size:
+            self.insert_at_end(data)
+            return
+
+        itr = self._node_at(index - 1)  # Node just before the desired index
+        self.pool.next[itr] = self.pool.allocate(data, self.pool.next[itr])
+        self.size += 1
+
+    # Inserts a new node with 'data_to_insert' after the first occurrence of 'data_after'
+    # Time Complexity: O(n)
+    def insert_after_value(self, data_after, data_to_insert):
+        data, next = self.pool.data, self.pool.next
+        itr = self.head
+        while itr != NIL:
+            if data[itr] == data_after:
+                node = self.pool.allocate(data_to_insert, next[itr])
+                next[itr] = node
+                if itr == self.tail:
+                    self.tail = node
+                self.size += 1
+                return
+            itr = next[itr]
+
+    # Removes the first occurrence of a node with the value 'data'
+    # Time Complexity: O(n)
+    def remove_value(self, data):
+        values, next = self.pool.data, self.pool.next
+        previous = NIL
+        itr = self.head
+        while itr != NIL:
+            if values[itr] == data:
+                if previous == NIL:
+                    self.head = next[itr]
+                else:
+                    next[previous] = next[itr]  # Bypass the node with 'data'
+                if itr == self.tail:
+                    self.tail = previous
+                self.pool.release(itr)
+                self.size -= 1
+                return
+            previous = itr
+            itr = next[itr]
+
+    # Converts the linked list to a Python list (array) and prints it
+    # Time Complexity: O(n)
+    def linked_list_to_array(self):
+        print(list(self._values()))
+
+    # Helper generator yielding the values from head to tail
+    # Time Complexity: O(n)
+    def _values(self):
+        data, next = self.pool.data, self.pool.next
+        itr = self.head
+        while itr != NIL:
+            yield data[itr]
+            itr = next[itr]
+
+    # Helper returning the index of the node at position 'index'
+    # Time Complexity: O(n)
+    def _node_at(self, index):
+        next = self.pool.next
+        itr = self.head
+        for _ in range(index):
+            itr = next[itr]
+        return itr
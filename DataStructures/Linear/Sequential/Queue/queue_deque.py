@@ -1,16 +1,19 @@
 from collections import deque
 
 class QueueDeque:
-    def __init__(self):
+    def __init__(self, trace=None):
         # Initialize an empty deque to represent the queue
         self.queue = deque()
+        # Optional callback trace(operation, item) called on every enqueue/dequeue (None = silent)
+        self.trace = trace
 
     def enqueue(self, item):
         """Adds an item to the end of the queue.
         Time Complexity: O(1) - appending to the end of a deque is a constant time operation.
         """
         self.queue.append(item)  # Add item to the end of the deque
-        print(f"Enqueued {item} to queue")
+        if self.trace is not None:
+            self.trace('enqueue', item)
 
     def dequeue(self):
         """Removes and returns the front item from the queue.
@@ -18,10 +21,10 @@ class QueueDeque:
         """
         if not self.is_empty():  # Check if the queue is not empty
             dequeued_item = self.queue.popleft()  # Remove and return the front element
-            print(f"Dequeued {dequeued_item} from queue")
+            if self.trace is not None:
+                self.trace('dequeue', dequeued_item)
             return dequeued_item
         else:
-            print("Queue is empty, cannot dequeue an element")
             return None
 
     def front(self):
@@ -30,10 +33,8 @@ class QueueDeque:
         """
         if not self.is_empty():  # Check if the queue is not empty
             front_item = self.queue[0]  # Get the first element in the deque
-            print(f"Front element is: {front_item}")
             return front_item
         else:
-            print("Queue is empty, no element to show at the front")
             return None
 
     def is_empty(self):
@@ -41,7 +42,6 @@ class QueueDeque:
         Time Complexity: O(1) - checking the length of a deque is a constant time operation.
         """
         empty = len(self.queue) == 0  # Check if deque length is zero
-        print(f"Is queue empty? {empty}")
         return empty
 
     def size(self):
@@ -49,7 +49,6 @@ class QueueDeque:
         Time Complexity: O(1) - getting the length of the deque is a constant time operation.
         """
         size = len(self.queue)  # Get the number of elements in the queue
-        print(f"Queue size is: {size}")
         return size
 
     def display(self):
@@ -1,16 +1,19 @@
 from collections import deque
 
 class StackDeque:
-    def __init__(self):
+    def __init__(self, trace=None):
         # Initialize an empty deque to represent the stack
         self.stack = deque()
+        # Optional callback trace(operation, item) called on every push/pop (None = silent)
+        self.trace = trace
 
     def push(self, item):
         """Adds an item to the top of the stack.
         Time Complexity: O(1) - appending to the end of a deque is a constant time operation.
         """
         self.stack.append(item)  # Append item to the end of the deque (top of the stack)
-        print(f"Pushed {item} onto stack")
+        if self.trace is not None:
+            self.trace('push', item)
 
     def pop(self):
         """Removes and returns the top item from the stack.
@@ -18,10 +21,10 @@ class StackDeque:
         """
         if not self.is_empty():  # Check if the stack is not empty
             popped_item = self.stack.pop()  # Remove and return the top element
-            print(f"Popped {popped_item} from stack")
+            if self.trace is not None:
+                self.trace('pop', popped_item)
             return popped_item
         else:
-            print("Stack is empty, cannot pop an element")
             return None
 
     def peek(self):
@@ -30,10 +33,8 @@ class StackDeque:
         """
         if not self.is_empty():  # Check if the stack is not empty
             top_item = self.stack[-1]  # Get the last element in the deque
-            print(f"Top element is: {top_item}")
             return top_item
         else:
-            print("Stack is empty, no element to peek")
             return None
 
     def is_empty(self):
@@ -41,7 +42,6 @@ class StackDeque:
         Time Complexity: O(1) - checking the length of a deque is a constant time operation.
         """
         empty = len(self.stack) == 0  # Check if deque length is zero
-        print(f"Is stack empty? {empty}")
         return empty
 
     def size(self):
@@ -49,7 +49,6 @@ class StackDeque:
         Time Complexity: O(1) - getting the length of the deque is a constant time operation.
         """
         size = len(self.stack)  # Get the number of elements in the stack
-        print(f"Stack size is: {size}")
         return size
 
     def display(self):
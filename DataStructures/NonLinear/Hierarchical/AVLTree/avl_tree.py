@@ -2,15 +2,115 @@
 
 # AVL Tree Node class
 class Node:
+    __slots__ = ('key', 'left', 'right', 'height', 'size')
+
     def __init__(self, key):
-        # Initialize a node with key, height, and left/right child as None
+        # Initialize a node with key, height, size, and left/right child as None
         self.key = key
         self.left = None
         self.right = None
         self.height = 1  # New node is initially added at leaf (height=1)
+        self.size = 1  # Number of nodes in the subtree rooted here (used by the order-statistics queries)
 
 # AVL Tree class
+# The tree owns its root and behaves like a sorted set: add(), discard(), 'in', len() and iteration.
+# Insert and delete are iterative: the path from the root is kept on an explicit stack and walked back up
+# to update heights and rotate, so the Python call stack stays flat however many keys the tree holds.
 class AVLTree:
+    def __init__(self, keys=None):
+        self.root = None  # Root node, None while the tree is empty
+        self.size = 0  # Number of keys in the tree
+        if keys is not None:
+            for key in keys:
+                self.add(key)
+
+    # Time complexity: O(1)
+    def __len__(self):
+        return self.size
+
+    # Time complexity: O(log n)
+    # Reason: The search follows a single root-to-leaf path of a balanced tree.
+    def __contains__(self, key):
+        node = self.root
+        while node is not None:
+            if key < node.key:
+                node = node.left
+            elif key > node.key:
+                node = node.right
+            else:
+                return True
+        return False
+
+    # Time complexity: O(n) for a full iteration, O(1) amortized per key
+    # Reason: Keys are yielded lazily in sorted order; only the current root-to-node path (O(log n)) is kept in memory.
+    def __iter__(self):
+        return self._iter_inorder(self.root)
+
+    # Adds a key to the tree (duplicate keys are ignored)
+    # Time complexity: O(log n)
+    def add(self, key):
+        self.root, inserted = self._insert(self.root, key)
+        if inserted:
+            self.size += 1
+
+    # Removes a key from the tree if it is present
+    # Time complexity: O(log n)
+    def discard(self, key):
+        self.root, deleted = self._delete(self.root, key)
+        if deleted:
+            self.size -= 1
+
+    # Returns the number of keys strictly smaller than 'key' (its 0-based position if it is in the tree)
+    # Time complexity: O(log n)
+    # Reason: One root-to-leaf path; whenever we go right, the whole left subtree and the node itself are smaller.
+    def rank(self, key):
+        return self._count_smaller(key, False)
+
+    # Returns the k-th smallest key (0-based)
+    # Time complexity: O(log n)
+    # Reason: The subtree sizes tell at every node whether the k-th key is on the left, here, or on the right.
+    def select(self, k):
+        if k < 0 or k >= self.size:
+            raise IndexError("select index out of range")
+        node = self.root
+        while True:
+            left_size = self.get_size(node.left)
+            if k < left_size:
+                node = node.left
+            elif k == left_size:
+                return node.key
+            else:
+                k -= left_size + 1  # Skip the left subtree and this node
+                node = node.right
+
+    # Returns how many keys fall between 'lo' and 'hi' (both inclusive; None means unbounded)
+    # Time complexity: O(log n)
+    # Reason: Two rank computations, each following a single path.
+    def count_range(self, lo=None, hi=None):
+        below_hi = self.size if hi is None else self._count_smaller(hi, True)
+        below_lo = 0 if lo is None else self._count_smaller(lo, False)
+        return max(0, below_hi - below_lo)
+
+    # Lazily yields the keys between 'lo' and 'hi' (both inclusive; None means unbounded) in sorted order
+    # Time complexity: O(log n + k), where k is the number of keys yielded
+    # Reason: Subtrees entirely below 'lo' are never entered and the iteration stops at the first key above 'hi'.
+    def irange(self, lo=None, hi=None):
+        stack = []
+        node = self.root
+        while stack or node is not None:
+            while node is not None:
+                if lo is not None and node.key < lo:
+                    node = node.right  # This node and its left subtree are below the range
+                else:
+                    stack.append(node)
+                    node = node.left
+            if not stack:
+                return  # Only keys below the range were left
+            node = stack.pop()
+            if hi is not None and node.key > hi:
+                return  # Every remaining key is above the range
+            yield node.key
+            node = node.right
 
     # Helper function to get the height of the node
     # Time complexity: O(1)
@@ -20,6 +120,14 @@ class AVLTree:
             return 0  # If node is None, height is 0
         return node.height  # Otherwise return node's height
 
+    # Helper function to get the number of nodes in the subtree rooted at 'node'
+    # Time complexity: O(1)
+    # Reason: Every node stores the size of its subtree, kept up to date by insertions, deletions and rotations.
+    def get_size(self, node):
+        if not node:
+            return 0  # Empty subtree
+        return node.size
+
     # Helper function to get the balance factor of the node
     # Time complexity: O(1)
     # Reason: This function just computes the difference in heights of left and right children, which are both accessed in constant time.
@@ -40,9 +148,11 @@ class AVLTree:
         x.right = y
         y.left = T2
 
-        # Update heights after rotation
+        # Update heights and subtree sizes after rotation (y is now below x, so it goes first)
         y.height = max(self.get_height(y.left), self.get_height(y.right)) + 1
         x.height = max(self.get_height(x.left), self.get_height(x.right)) + 1
+        y.size = self.get_size(y.left) + self.get_size(y.right) + 1
+        x.size = self.get_size(x.left) + self.get_size(x.right) + 1
 
         # Return the new root
         return x
@@ -58,149 +168,211 @@ class AVLTree:
         y.left = x
         x.right = T2
 
-        # Update heights after rotation
+        # Update heights and subtree sizes after rotation (x is now below y, so it goes first)
         x.height = max(self.get_height(x.left), self.get_height(x.right)) + 1
         y.height = max(self.get_height(y.left), self.get_height(y.right)) + 1
+        x.size = self.get_size(x.left) + self.get_size(x.right) + 1
+        y.size = self.get_size(y.left) + self.get_size(y.right) + 1
 
         # Return the new root
         return y
 
-    # Function to insert a node in the AVL tree
+    # Function to insert a key in the subtree rooted at 'root' and return the new subtree root
+    # (kept for callers that manage the root themselves; the container API is add()).
     # Time complexity: O(log n)
     # Reason: Insertion in a binary search tree takes O(log n) time in a balanced tree because we only visit one path from root to leaf.
     # After insertion, we perform at most O(1) rotations, each of which takes O(1) time. Hence, overall time is O(log n).
     def insert(self, root, key):
-        # Perform standard BST insert
-        if not root:
-            return Node(key)  # If root is None, create a new node with the key
-
-        if key < root.key:
-            root.left = self.insert(root.left, key)  # Insert in left subtree
-        elif key > root.key:
-            root.right = self.insert(root.right, key)  # Insert in right subtree
-        else:
-            return root  # Duplicate keys not allowed, return the root unchanged
-
-        # Update height of the current node
-        root.height = 1 + max(self.get_height(root.left), self.get_height(root.right))
-
-        # Get the balance factor to check if node is unbalanced
-        balance = self.get_balance(root)
-
-        # Left Left Case (LL Rotation)
-        if balance > 1 and key < root.left.key:
-            return self.right_rotate(root)
-
-        # Right Right Case (RR Rotation)
-        if balance < -1 and key > root.right.key:
-            return self.left_rotate(root)
-
-        # Left Right Case (LR Rotation)
-        if balance > 1 and key > root.left.key:
-            root.left = self.left_rotate(root.left)
-            return self.right_rotate(root)
-
-        # Right Left Case (RL Rotation)
-        if balance < -1 and key < root.right.key:
-            root.right = self.right_rotate(root.right)
-            return self.left_rotate(root)
-
-        # Return the (unchanged) root pointer
-        return root
+        return self._insert(root, key)[0]
 
     # Function to get the node with minimum key value found in the tree
     # Time complexity: O(log n)
     # Reason: This function traverses down the leftmost path of the tree, which in a balanced tree takes O(log n) time.
     def get_min_value_node(self, node):
-        if node is None or node.left is None:
-            return node  # Node with no left child is the smallest
-        return self.get_min_value_node(node.left)  # Recursively find the minimum value node
+        while node is not None and node.left is not None:
+            node = node.left  # Node with no left child is the smallest
+        return node
 
-    # Function to delete a node from the AVL tree
+    # Function to delete a key from the subtree rooted at 'root' and return the new subtree root
+    # (kept for callers that manage the root themselves; the container API is discard()).
     # Time complexity: O(log n)
     # Reason: Deletion involves a search for the node, which takes O(log n) in a balanced tree.
     # After the deletion, at most O(1) rotations are needed at each level up the tree, so the total complexity is O(log n).
     def delete(self, root, key):
-        # Perform standard BST delete
-        if not root:
-            return root  # If root is None, return None
-
-        if key < root.key:
-            root.left = self.delete(root.left, key)  # Recur in left subtree
-        elif key > root.key:
-            root.right = self.delete(root.right, key)  # Recur in right subtree
-        else:
-            # Node with only one child or no child
-            if root.left is None:
-                temp = root.right
-                root = None
-                return temp
-            elif root.right is None:
-                temp = root.left
-                root = None
-                return temp
-
-            # Node with two children: get the inorder successor (smallest in the right subtree)
-            temp = self.get_min_value_node(root.right)
-            root.key = temp.key  # Copy inorder successor's value to this node
-            root.right = self.delete(root.right, temp.key)  # Delete the inorder successor
-
-        if root is None:
-            return root  # If the tree had only one node, return None
-
-        # Update height of the current node
-        root.height = 1 + max(self.get_height(root.left), self.get_height(root.right))
-
-        # Get the balance factor of the node to check if it is unbalanced
-        balance = self.get_balance(root)
-
-        # Left Left Case (LL Rotation)
-        if balance > 1 and self.get_balance(root.left) >= 0:
-            return self.right_rotate(root)
-
-        # Left Right Case (LR Rotation)
-        if balance > 1 and self.get_balance(root.left) < 0:
-            root.left = self.left_rotate(root.left)
-            return self.right_rotate(root)
-
-        # Right Right Case (RR Rotation)
-        if balance < -1 and self.get_balance(root.right) <= 0:
-            return self.left_rotate(root)
-
-        # Right Left Case (RL Rotation)
-        if balance < -1 and self.get_balance(root.right) > 0:
-            root.right = self.right_rotate(root.right)
-            return self.left_rotate(root)
-
-        return root
+        return self._delete(root, key)[0]
 
     # Function to perform an in-order traversal of the tree (sorted order)
     # Time complexity: O(n)
     # Reason: In-order traversal visits every node in the tree exactly once, so its time complexity is proportional to the number of nodes, i.e., O(n).
     def inorder_traversal(self, root):
-        res = []
-        if root:
-            res = self.inorder_traversal(root.left)  # Traverse left subtree
-            res.append(root.key)  # Visit the node
-            res = res + self.inorder_traversal(root.right)  # Traverse right subtree
-        return res
+        return list(self._iter_inorder(root))
 
-        # Function for pre-order traversal
-        # Pre-order: root -> left -> right
+    # Function for pre-order traversal
+    # Pre-order: root -> left -> right
     def preorder_traversal(self, root):
         res = []
-        if root:
-            res.append(root.key)  # Visit root first
-            res = res + self.preorder_traversal(root.left)  # Then traverse left subtree
-            res = res + self.preorder_traversal(root.right)  # Then traverse right subtree
+        stack = [root] if root else []
+        while stack:
+            node = stack.pop()
+            res.append(node.key)  # Visit root first
+            if node.right:  # Push the right subtree first so the left subtree is visited first
+                stack.append(node.right)
+            if node.left:
+                stack.append(node.left)
         return res
 
     # Function for post-order traversal
     # Post-order: left -> right -> root
     def postorder_traversal(self, root):
+        # A root -> right -> left traversal, reversed, gives left -> right -> root
         res = []
-        if root:
-            res = self.postorder_traversal(root.left)  # Traverse left subtree first
-            res = res + self.postorder_traversal(root.right)  # Then traverse right subtree
-            res.append(root.key)  # Visit root last
-        return res
\ No newline at end of file
+        stack = [root] if root else []
+        while stack:
+            node = stack.pop()
+            res.append(node.key)
+            if node.left:
+                stack.append(node.left)
+            if node.right:
+                stack.append(node.right)
+        res.reverse()
+        return res
+
+    # Counts the keys smaller than 'key' (or smaller than or equal to it when 'inclusive' is True)
+    # Time complexity: O(log n)
+    def _count_smaller(self, key, inclusive):
+        count = 0
+        node = self.root
+        while node is not None:
+            if node.key < key or (inclusive and node.key == key):
+                count += self.get_size(node.left) + 1  # The left subtree and this node are all counted
+                node = node.right
+            else:
+                node = node.left
+        return count
+
+    # Generator for the in-order traversal of the subtree rooted at 'root'
+    # Time complexity: O(n) in total, O(log n) memory for the explicit stack
+    def _iter_inorder(self, root):
+        stack = []
+        node = root
+        while stack or node is not None:
+            while node is not None:  # Go as far left as possible, remembering the path
+                stack.append(node)
+                node = node.left
+            node = stack.pop()
+            yield node.key  # Visit the node
+            node = node.right  # Then traverse its right subtree
+
+    # Iterative insert: returns (new subtree root, whether the key was inserted)
+    # Time complexity: O(log n)
+    def _insert(self, root, key):
+        if root is None:
+            return Node(key), True
+
+        # Walk down to the insertion point, recording every node and the direction taken from it
+        path = []
+        node = root
+        while node is not None:
+            if key < node.key:
+                path.append((node, True))
+                node = node.left
+            elif key > node.key:
+                path.append((node, False))
+                node = node.right
+            else:
+                return root, False  # Duplicate keys not allowed, return the root unchanged
+
+        parent, went_left = path[-1]
+        if went_left:
+            parent.left = Node(key)
+        else:
+            parent.right = Node(key)
+        for node, _ in path:
+            node.size += 1  # Every subtree on the path gained one node
+        return self._rebalance_path(path), True
+
+    # Iterative delete: returns (new subtree root, whether the key was deleted)
+    # Time complexity: O(log n)
+    def _delete(self, root, key):
+        # Walk down to the node, recording every node and the direction taken from it
+        path = []
+        node = root
+        while node is not None and node.key != key:
+            went_left = key < node.key
+            path.append((node, went_left))
+            node = node.left if went_left else node.right
+        if node is None:
+            return root, False  # Key not found
+
+        if node.left is not None and node.right is not None:
+            # Node with two children: copy the inorder successor (smallest in the right subtree) into it,
+            # then remove the successor instead, which has no left child
+            path.append((node, False))
+            successor = node.right
+            while successor.left is not None:
+                path.append((successor, True))
+                successor = successor.left
+            node.key = successor.key
+            node = successor
+
+        # Node with only one child or no child: the child takes its place
+        child = node.left if node.left is not None else node.right
+        if not path:
+            return child, True  # The deleted node was the root
+        for ancestor, _ in path:
+            ancestor.size -= 1  # Every subtree on the path lost one node
+        parent, went_left = path[-1]
+        if went_left:
+            parent.left = child
+        else:
+            parent.right = child
+        return self._rebalance_path(path), True
+
+    # Walks the recorded path back up: updates heights, rotates unbalanced nodes and relinks each
+    # rebalanced subtree into its parent. Returns the (possibly new) root of the whole path.
+    # The walk stops early at the first node whose height does not change and that needs no rotation:
+    # nothing above it can be affected.
+    # Time complexity: O(log n)
+    def _rebalance_path(self, path):
+        for i in range(len(path) - 1, -1, -1):
+            node = path[i][0]
+            old_height = node.height
+            subtree = self._rebalance(node)
+            if subtree is node and node.height == old_height:
+                return path[0][0]  # The rest of the path is unchanged
+            if i == 0:
+                return subtree
+            parent, went_left = path[i - 1]
+            if went_left:
+                parent.left = subtree
+            else:
+                parent.right = subtree
+
+    # Updates the height of 'node' and restores its balance with at most two rotations.
+    # Returns the new root of the subtree.
+    # Time complexity: O(1)
+    def _rebalance(self, node):
+        left_height = node.left.height if node.left is not None else 0
+        right_height = node.right.height if node.right is not None else 0
+
+        # Update height of the current node
+        node.height = 1 + (left_height if left_height > right_height else right_height)
+
+        # Get the balance factor to check if node is unbalanced
+        balance = left_height - right_height
+
+        if balance > 1:
+            # Left Right Case (LR Rotation) first turns into the Left Left Case
+            if self.get_balance(node.left) < 0:
+                node.left = self.left_rotate(node.left)
+            # Left Left Case (LL Rotation)
+            return self.right_rotate(node)
+
+        if balance < -1:
+            # Right Left Case (RL Rotation) first turns into the Right Right Case
+            if self.get_balance(node.right) > 0:
+                node.right = self.right_rotate(node.right)
+            # Right Right Case (RR Rotation)
+            return self.left_rotate(node)
+
+        return node
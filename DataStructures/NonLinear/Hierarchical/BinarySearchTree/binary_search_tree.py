@@ -1,186 +1,309 @@
-class BinarySearchTree:
-    # The constructor initializes the node with a given value,
-    # and sets the left and right children to None.
-    def __init__(self, value):
+import random
+from collections import deque
+
+# Random number generator used for the treap priorities
+_random = random.Random()
+
+
+# Node class represents a single node of the binary search tree.
+# 'priority' is only used by the treap balancing mode.
+class Node:
+    __slots__ = ('value', 'left', 'right', 'priority')
+
+    def __init__(self, value, priority=0.0):
         self.value = value  # Set the value of the node
         self.left = None    # Left child of the node, initially None
         self.right = None   # Right child of the node, initially None
+        self.priority = priority  # Heap priority of the node (treap mode)
+
+
+# BinarySearchTree owns the root node and implements every operation iteratively,
+# so no operation is limited by Python's recursion limit, however deep the tree gets.
+#
+# Balancing modes:
+#   - None (default): a plain BST. Sorted inserts degrade it to a linked list (O(n) per operation).
+#   - 'treap': every node also gets a random priority and the tree is kept heap-ordered by priority
+#     with rotations. The shape is then that of a BST built from a random insertion order,
+#     so the expected depth is O(log n) whatever order the values arrive in.
+class BinarySearchTree:
+    BALANCING_MODES = (None, 'treap')
+
+    # The constructor optionally inserts a first value (the old node-as-tree constructor took the root value).
+    def __init__(self, value=None, balancing=None):
+        if balancing not in self.BALANCING_MODES:
+            raise ValueError(f"Unknown balancing mode: {balancing!r}")
+        self.balancing = balancing
+        self.root = None  # Root node, None while the tree is empty
+        self.size = 0  # Number of values in the tree
+        if value is not None:
+            self.insert(value)
+
+    # Time Complexity: O(n)
+    # Builds a perfectly balanced tree from an already-sorted iterable, without rotations or searching down the tree:
+    # the only comparisons are the n - 1 between neighbours that check the input is sorted.
+    # The middle value becomes the root, the middle of each half becomes its children, and so on.
+    @classmethod
+    def from_sorted(cls, values, balancing=None):
+        tree = cls(balancing=balancing)
+        values = list(values)
+        for i in range(1, len(values)):
+            if values[i] < values[i - 1]:
+                raise ValueError("from_sorted() requires values in ascending order")
+        if not values:
+            return tree
+
+        # Explicit stack of (low, high, parent, is_left_child) ranges still to be built
+        stack = [(0, len(values) - 1, None, False)]
+        while stack:
+            low, high, parent, is_left = stack.pop()
+            mid = (low + high) // 2
+            node = Node(values[mid])
+            if parent is None:
+                tree.root = node
+            elif is_left:
+                parent.left = node
+            else:
+                parent.right = node
+            if low < mid:
+                stack.append((low, mid - 1, node, True))
+            if mid < high:
+                stack.append((mid + 1, high, node, False))
+        tree.size = len(values)
+
+        if balancing == 'treap':
+            # Hand out random priorities in decreasing order level by level, so every parent outranks its children
+            priorities = sorted((_random.random() for _ in range(tree.size)), reverse=True)
+            queue = deque([tree.root])
+            for priority in priorities:
+                node = queue.popleft()
+                node.priority = priority
+                if node.left is not None:
+                    queue.append(node.left)
+                if node.right is not None:
+                    queue.append(node.right)
+        return tree
+
+    # Time Complexity: O(1)
+    def __len__(self):
+        return self.size
+
+    # Time Complexity: O(log n) on average (balanced tree), O(n) in the worst case (unbalanced tree)
+    def __contains__(self, value):
+        return self.find(value)
+
+    # Time Complexity: O(n) for a full iteration, O(h) extra memory where h is the height of the tree
+    # Lazily yields the values in increasing order (in-order traversal with an explicit stack).
+    def __iter__(self):
+        stack = []
+        current = self.root
+        while stack or current is not None:
+            while current is not None:  # Go as far left as possible, remembering the path
+                stack.append(current)
+                current = current.left
+            current = stack.pop()
+            yield current.value  # Visit the node
+            current = current.right  # Then traverse its right subtree
 
     # Time Complexity: O(log n) on average (balanced tree), O(n) in the worst case (unbalanced tree)
     # The insert method inserts a new value into the binary search tree.
+    # Values smaller than a node go to its left subtree, values greater than or equal to it go to its right subtree.
     def insert(self, value):
-        # If the value to insert is smaller than the current node's value, insert into the left subtree.
-        if value < self.value:
-            # If the left child is None, create a new node with the value.
-            if self.left is None:
-                self.left = BinarySearchTree(value)
+        treap = self.balancing == 'treap'
+        node = Node(value, _random.random() if treap else 0.0)
+        self.size += 1
+        if self.root is None:
+            self.root = node
+            return
+
+        path = []  # Nodes visited on the way down (only needed to rotate the new node up in treap mode)
+        current = self.root
+        while True:
+            if treap:
+                path.append(current)
+            if value < current.value:
+                if current.left is None:  # Free spot found: attach the new node as the left child
+                    current.left = node
+                    break
+                current = current.left
             else:
-                # Otherwise, recursively insert into the left subtree.
-                self.left.insert(value)
-        # If the value to insert is greater than or equal to the current node's value, insert into the right subtree.
-        else:
-            # If the right child is None, create a new node with the value.
-            if self.right is None:
-                self.right = BinarySearchTree(value)
+                if current.right is None:  # Free spot found: attach the new node as the right child
+                    current.right = node
+                    break
+                current = current.right
+
+        if treap:
+            # Rotate the new node up while it has a higher priority than its parent
+            while path and path[-1].priority < node.priority:
+                parent = path.pop()
+                if parent.left is node:  # Right rotation around the parent
+                    parent.left = node.right
+                    node.right = parent
+                else:  # Left rotation around the parent
+                    parent.right = node.left
+                    node.left = parent
+                self._replace_child(path[-1] if path else None, parent, node)
+
+    # Time Complexity: O(log n) on average (balanced tree), O(n) in the worst case (unbalanced tree)
+    # The find method searches for a value in the binary search tree.
+    def find(self, value):
+        current = self.root
+        while current is not None:
+            if value < current.value:  # Smaller values are in the left subtree
+                current = current.left
+            elif value > current.value:  # Greater values are in the right subtree
+                current = current.right
+            else:
+                return True  # The value matches the current node's value
+        return False
+
+    # Time Complexity: O(log n) on average (balanced tree), O(n) in the worst case (unbalanced tree)
+    # Deletes one occurrence of 'value'. Returns True if it was found.
+    # Handles three cases: leaf node, node with one child, node with two children.
+    def delete(self, value):
+        parent = None
+        current = self.root
+        while current is not None and current.value != value:  # Find the node and its parent
+            parent = current
+            current = current.left if value < current.value else current.right
+        if current is None:
+            return False  # Value not found
+
+        if self.balancing == 'treap':
+            # Rotate the node down (always lifting the child with the higher priority) until it has at most one child
+            while current.left is not None and current.right is not None:
+                if current.left.priority > current.right.priority:
+                    child = current.left
+                    current.left = child.right
+                    child.right = current
+                else:
+                    child = current.right
+                    current.right = child.left
+                    child.left = current
+                self._replace_child(parent, current, child)
+                parent = child
+            self._replace_child(parent, current, current.left if current.left is not None else current.right)
+        elif current.left is not None and current.right is not None:
+            # Case 3: Node has two children
+            # Find the in-order successor (smallest value in the right subtree) and its parent
+            successor_parent = current
+            successor = current.right
+            while successor.left is not None:
+                successor_parent = successor
+                successor = successor.left
+            # Replace the current node's value with the in-order successor's value
+            current.value = successor.value
+            # Unlink the successor (it has no left child)
+            if successor_parent is current:
+                successor_parent.right = successor.right
             else:
-                # Otherwise, recursively insert into the right subtree.
-                self.right.insert(value)
+                successor_parent.left = successor.right
+        else:
+            # Case 1 and 2: Node has at most one child, which takes its place
+            self._replace_child(parent, current, current.left if current.left is not None else current.right)
+
+        self.size -= 1
+        return True
 
     # Time Complexity: O(n), where n is the number of nodes in the tree.
     # In-order traversal visits nodes in increasing order of value.
     def inorder_traversal(self):
-        # Traverse the left subtree first.
-        if self.left:
-            self.left.inorder_traversal()
-        # Print the current node's value (middle node in in-order traversal).
-        print(self.value)
-        # Traverse the right subtree after.
-        if self.right:
-            self.right.inorder_traversal()
+        return list(self)
 
     # Time Complexity: O(n), where n is the number of nodes in the tree.
     # Pre-order traversal visits the current node before its subtrees.
     def preorder_traversal(self):
-        # Print the current node's value (root first in pre-order traversal).
-        print(self.value)
-        # Traverse the left subtree after printing the root.
-        if self.left:
-            self.left.preorder_traversal()
-        # Then traverse the right subtree.
-        if self.right:
-            self.right.preorder_traversal()
+        result = []
+        stack = [self.root] if self.root is not None else []
+        while stack:
+            node = stack.pop()
+            result.append(node.value)  # Visit the node first
+            if node.right is not None:  # Push right first so the left subtree is visited first
+                stack.append(node.right)
+            if node.left is not None:
+                stack.append(node.left)
+        return result
 
     # Time Complexity: O(n), where n is the number of nodes in the tree.
     # Post-order traversal visits the subtrees before the current node.
     def postorder_traversal(self):
-        # Traverse the left subtree first.
-        if self.left:
-            self.left.postorder_traversal()
-        # Then traverse the right subtree.
-        if self.right:
-            self.right.postorder_traversal()
-        # Print the current node's value (root last in post-order traversal).
-        print(self.value)
+        # A root -> right -> left traversal, reversed, gives left -> right -> root
+        result = []
+        stack = [self.root] if self.root is not None else []
+        while stack:
+            node = stack.pop()
+            result.append(node.value)
+            if node.left is not None:
+                stack.append(node.left)
+            if node.right is not None:
+                stack.append(node.right)
+        result.reverse()
+        return result
 
-    # Time Complexity: O(log n) on average (balanced tree), O(n) in the worst case (unbalanced tree)
-    # The find method searches for a value in the binary search tree.
-    def find(self, value):
-        # If the value is smaller than the current node's value, search the left subtree.
-        if value < self.value:
-            # If there's no left child, the value is not in the tree, return False.
-            if self.left is None:
-                return False
-            else:
-                # Otherwise, recursively search the left subtree.
-                return self.left.find(value)
-        # If the value is greater than the current node's value, search the right subtree.
-        elif self.value > value:
-            # If there's no right child, the value is not in the tree, return False.
-            if self.right is None:
-                return False
-            else:
-                # Otherwise, recursively search the right subtree.
-                self.right.find(value)
-        else:
-            # If the value matches the current node's value, return True.
-            return True
-
-        # New Method: Calculate the Depth of a node
-        # Time Complexity: O(log n) on average, O(n) in the worst case (unbalanced tree)
-        def get_depth(self, value, current_depth=0):
-            # If the current node contains the value we're looking for, return the current depth
-            if value == self.value:
-                return current_depth
-            # If the value is smaller, search in the left subtree and increment the depth
-            elif value < self.value:
-                # If there's no left child, return -1 (value not found)
-                if self.left is None:
-                    return -1  # Value not found
-                # Otherwise, recursively search in the left subtree, increasing the depth by 1
-                return self.left.get_depth(value, current_depth + 1)
-            # If the value is greater, search in the right subtree and increment the depth
-            else:
-                # If there's no right child, return -1 (value not found)
-                if self.right is None:
-                    return -1  # Value not found
-                # Otherwise, recursively search in the right subtree, increasing the depth by 1
-                return self.right.get_depth(value, current_depth + 1)
-
-        # New Method: Calculate the Height of the current node
-        # Height is defined as the number of edges on the longest path from this node to a leaf.
-        # Time Complexity: O(n) where n is the number of nodes (since every node is visited)
-        def get_height(self):
-            # If the node has no children, it is a leaf and has a height of 0.
-            # For leaves, the height is -1 when we reach a None (non-existent) node.
-            if self is None:
-                return -1  # Base case for null node
-            # Recursively calculate the height of the left and right subtrees
-            left_height = self.left.get_height() if self.left else -1
-            right_height = self.right.get_height() if self.right else -1
-            # The height of the current node is the maximum height of its children + 1 (for this node)
-            return max(left_height, right_height) + 1
-
-        # Method to find the minimum value node in the tree (used in deletion)
-        # Time Complexity: O(log n) on average, O(n) in worst case
-        def find_min(self):
-            current = self
-            # Traverse to the leftmost node
-            while current.left is not None:
+    # Calculate the Depth of a value (number of edges from the root), or -1 if it is not in the tree
+    # Time Complexity: O(log n) on average, O(n) in the worst case (unbalanced tree)
+    def get_depth(self, value):
+        depth = 0
+        current = self.root
+        while current is not None:
+            if value < current.value:
                 current = current.left
-            return current
-
-        # New Method: Delete a node from the Binary Search Tree
-        # Handles three cases: leaf node, node with one child, node with two children.
-        # Time Complexity: O(log n) on average, O(n) in the worst case (unbalanced tree)
-        def delete(self, value):
-            # If the value to be deleted is smaller than the root, look in the left subtree
-            if value < self.value:
-                if self.left:
-                    self.left = self.left.delete(value)
-            # If the value to be deleted is greater than the root, look in the right subtree
-            elif value > self.value:
-                if self.right:
-                    self.right = self.right.delete(value)
+            elif value > current.value:
+                current = current.right
             else:
-                # Node to be deleted found
-                # Case 1: Node has no children (leaf node)
-                if self.left is None and self.right is None:
-                    return None  # Return None to delete the node
-
-                # Case 2: Node has only one child (either left or right)
-                if self.left is None:  # If no left child, return right child
-                    return self.right
-                elif self.right is None:  # If no right child, return left child
-                    return self.left
-
-                # Case 3: Node has two children
-                # Find the in-order successor (smallest value in the right subtree)
-                min_right_subtree = self.right.find_min()
-                # Replace the current node's value with the in-order successor's value
-                self.value = min_right_subtree.value
-                # Delete the in-order successor from the right subtree
-                self.right = self.right.delete(min_right_subtree.value)
-
-            return self  # Return the (possibly updated) root node
-
-    ''' 
+                return depth
+            depth += 1
+        return -1  # Value not found
+
+    # Calculate the Height of the tree: the number of edges on the longest path from the root to a leaf
+    # (-1 for an empty tree). Computed level by level, without recursion.
+    # Time Complexity: O(n) where n is the number of nodes (since every node is visited)
+    def get_height(self):
+        height = -1
+        level = [self.root] if self.root is not None else []
+        while level:
+            height += 1
+            level = [child for node in level for child in (node.left, node.right) if child is not None]
+        return height
+
+    # Method to find the minimum value in the tree (None if it is empty)
+    # Time Complexity: O(log n) on average, O(n) in worst case
+    def find_min(self):
+        current = self.root
+        if current is None:
+            return None
+        # Traverse to the leftmost node
+        while current.left is not None:
+            current = current.left
+        return current.value
+
+    # Helper method to make 'parent' point to 'new' instead of its child 'old' (or the root if parent is None)
+    # Time Complexity: O(1)
+    def _replace_child(self, parent, old, new):
+        if parent is None:
+            self.root = new
+        elif parent.left is old:
+            parent.left = new
+        else:
+            parent.right = new
+
+    '''
     Example of inserting values into a Binary Search Tree
-    
+
      Let's say we insert the following values in this order:
      50, 30, 70, 20, 40, 60, 80
 
      The resulting tree structure will look like this:
 
                 50
-              /    \
+              /    \\
             30      70
-           /  \    /  \
+           /  \\    /  \\
          20   40  60   80
 
      In this example:
      - The root node is 50.
      - Values smaller than 50 (like 30 and 20) go to the left.
      - Values greater than 50 (like 70, 60, and 80) go to the right.
-     - For each node, the left subtree contains values smaller than the node, 
+     - For each node, the left subtree contains values smaller than the node,
        and the right subtree contains values greater than or equal to the node.
     '''
@@ -0,0 +1,69 @@
+import random
+import sys
+import time
+
+from DataStructures.NonLinear.Hierarchical.BinarySearchTree.binary_search_tree import BinarySearchTree
+
+# Benchmark for BinarySearchTree with sorted, reverse-sorted and random insertion orders.
+# For each balancing mode it reports the insert time, the average find() time and the tree height.
+# An unbalanced BST degrades to a linked list on sorted input (O(n^2) to build), so those two cases are
+# capped at UNBALANCED_SORTED_LIMIT keys and NUM_LOOKUPS // 100 lookups; the height column shows why.
+# Run from the repository root:
+#   python -m DataStructures.NonLinear.Hierarchical.BinarySearchTree.binary_search_tree_benchmark [num_keys]
+
+NUM_KEYS = 1_000_000
+NUM_LOOKUPS = 100_000
+UNBALANCED_SORTED_LIMIT = 10_000
+SEED = 7
+
+
+def bench_inserts(keys, balancing):
+    tree = BinarySearchTree(balancing=balancing)
+    start = time.perf_counter()
+    for key in keys:
+        tree.insert(key)
+    return tree, time.perf_counter() - start
+
+
+def bench_lookups(tree, queries):
+    start = time.perf_counter()
+    for query in queries:
+        tree.find(query)
+    return time.perf_counter() - start
+
+
+def report(label, mode, num_keys, build_time, tree, queries):
+    lookup_time = bench_lookups(tree, queries) / len(queries) * 1e6
+    print(f"{label:<16}{mode:<12}{num_keys:>11,}{build_time:>11.2f}{lookup_time:>14.2f}{tree.get_height():>8}")
+
+
+def run(num_keys=NUM_KEYS):
+    rng = random.Random(SEED)
+    random_keys = list(range(num_keys))
+    rng.shuffle(random_keys)
+    orders = {
+        'sorted': list(range(num_keys)),
+        'reverse-sorted': list(range(num_keys - 1, -1, -1)),
+        'random': random_keys,
+    }
+    queries = [rng.randrange(num_keys) for _ in range(NUM_LOOKUPS)]
+
+    print(f"{'insert order':<16}{'mode':<12}{'keys':>11}{'build (s)':>11}{'lookup (us)':>14}{'height':>8}")
+    for label, keys in orders.items():
+        for balancing in (None, 'treap'):
+            if balancing is None and label != 'random':
+                capped = keys[:UNBALANCED_SORTED_LIMIT]
+                tree, build_time = bench_inserts(capped, balancing)
+                capped_queries = [capped[query % len(capped)] for query in queries[:NUM_LOOKUPS // 100]]  # Keys in the tree
+                report(label, str(balancing), len(capped), build_time, tree, capped_queries)
+            else:
+                tree, build_time = bench_inserts(keys, balancing)
+                report(label, str(balancing), len(keys), build_time, tree, queries)
+
+    start = time.perf_counter()
+    tree = BinarySearchTree.from_sorted(range(num_keys))
+    report('from_sorted()', 'None', num_keys, time.perf_counter() - start, tree, queries)
+
+
+if __name__ == '__main__':
+    run(int(sys.argv[1]) if len(sys.argv) > 1 else NUM_KEYS)
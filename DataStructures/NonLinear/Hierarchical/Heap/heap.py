@@ -1,8 +1,36 @@
+import heapq
+
+# Python 3.14 added max-heap functions to heapq; older versions only have the min-heap ones
+HEAPQ_HAS_MAX = hasattr(heapq, 'heappush_max')
+
+
 # Heap Class that can work as both MaxHeap and MinHeap depending on the 'is_max' flag
+#
+# 'arity' is the number of children per node (2 for a binary heap). A d-ary heap is shallower (log_d n levels),
+# so insertions move fewer levels, and the d children of a node sit next to each other in the list:
+# a 4-ary heap touches about half as many cache lines per removal as a binary one.
+#
+# A binary min-heap has exactly the list layout of the C heapq module, so such heaps (and binary max-heaps,
+# when heapq provides max-heap functions) run on heapq instead of the Python loops below (use_heapq).
 class Heap:
-    def __init__(self, is_max=True):
+    _entry_key = None  # Function giving the priority of a list entry, for subclasses storing more than the priority
+
+    def __init__(self, is_max=True, arity=2):
+        if arity < 2:
+            raise ValueError("arity must be at least 2")
         self.heap = []  # The internal list representation of the heap
         self.is_max = is_max  # Flag to determine if it's a max heap or min heap
+        self.arity = arity  # Number of children per node
+        self.use_heapq = arity == 2 and (not is_max or HEAPQ_HAS_MAX)  # Fast path on the C heapq module
+        if self.use_heapq:
+            if is_max:
+                self._heappush, self._heappop, self._heapify = heapq.heappush_max, heapq.heappop_max, heapq.heapify_max
+            else:
+                self._heappush, self._heappop, self._heapify = heapq.heappush, heapq.heappop, heapq.heapify
+
+    # Time Complexity: O(1)
+    def __len__(self):
+        return len(self.heap)
 
     # Helper function to compare values depending on heap type
     def _compare(self, parent, child):
@@ -14,23 +42,41 @@ class Heap:
     # Why: Inserting into a heap involves placing the new element at the end and then "bubbling up" the element
     # to restore heap order, which takes log(n) time in the worst case (height of the tree).
     def insert(self, value):
+        if self.use_heapq:
+            self._heappush(self.heap, value)
+            return
         self.heap.append(value)  # Add the new value at the end
         self._bubble_up(len(self.heap) - 1)  # Restore the heap property by bubbling up
 
-    # Helper function to maintain heap property after insertion (bubbling up)
+    # Helper function to maintain heap property after insertion (bubbling up).
+    # The value is held aside while its ancestors move down into the hole, then written once at its final index.
+    # The comparison is written out for each heap type, so no method is called per level.
     def _bubble_up(self, index):
-        parent = (index - 1) // 2  # Parent index of the current node
-        while index > 0 and not self._compare(self.heap[parent], self.heap[index]):
-            # Swap with the parent if the heap property is violated
-            self.heap[parent], self.heap[index] = self.heap[index], self.heap[parent]
-            index = parent  # Move up to the parent's index
-            parent = (index - 1) // 2
+        heap, arity = self.heap, self.arity
+        value = heap[index]
+        if self.is_max:
+            while index > 0:
+                parent = (index - 1) // arity  # Parent index of the current node
+                if heap[parent] >= value:
+                    break
+                heap[index] = heap[parent]  # Move the parent down into the hole
+                index = parent
+        else:
+            while index > 0:
+                parent = (index - 1) // arity
+                if heap[parent] <= value:
+                    break
+                heap[index] = heap[parent]
+                index = parent
+        heap[index] = value
 
     # Time Complexity: O(log n)
     # Why: Removing the root involves replacing it with the last element and then "bubbling down" to restore the heap.
     def remove(self):
         if len(self.heap) == 0:
             return None  # Return None if heap is empty
+        if self.use_heapq:
+            return self._heappop(self.heap)
         if len(self.heap) == 1:
             return self.heap.pop()  # If only one element, just pop and return it
         root = self.heap[0]  # Save the root element to return it later
@@ -40,37 +86,135 @@ class Heap:
 
     # Helper function to maintain heap property after removal (bubbling down)
     def _bubble_down(self, index):
-        length = len(self.heap)
-        left_child = 2 * index + 1  # Left child index
-        right_child = 2 * index + 2  # Right child index
-
-        while left_child < length:
-            # Determine the index of the child to swap with
-            swap_index = left_child
-            if right_child < length and not self._compare(self.heap[left_child], self.heap[right_child]):
-                swap_index = right_child
-            if self._compare(self.heap[index], self.heap[swap_index]):
-                break
-            self.heap[index], self.heap[swap_index] = self.heap[swap_index], self.heap[index]
-            index = swap_index  # Move down to the child's index
-            left_child = 2 * index + 1
-            right_child = 2 * index + 2
+        self._sift_down(self.heap, index, len(self.heap))
+
+    # Helper function moving heap[index] down within heap[:length], with the same hole technique as _bubble_up.
+    # As there, the comparisons are written out for each heap type (plain while loops: no range object per level).
+    def _sift_down(self, heap, index, length):
+        arity = self.arity
+        value = heap[index]
+        first_child = arity * index + 1
+        if self.is_max:
+            while first_child < length:
+                # Find the largest of the (up to arity) children
+                child = first_child
+                child_value = heap[child]
+                end = first_child + arity
+                if end > length:
+                    end = length
+                other = first_child + 1
+                while other < end:
+                    if heap[other] > child_value:
+                        child = other
+                        child_value = heap[other]
+                    other += 1
+                if value >= child_value:
+                    break
+                heap[index] = child_value  # Move the child up into the hole
+                index = child
+                first_child = arity * index + 1
+        else:
+            while first_child < length:
+                # Find the smallest of the (up to arity) children
+                child = first_child
+                child_value = heap[child]
+                end = first_child + arity
+                if end > length:
+                    end = length
+                other = first_child + 1
+                while other < end:
+                    if heap[other] < child_value:
+                        child = other
+                        child_value = heap[other]
+                    other += 1
+                if value <= child_value:
+                    break
+                heap[index] = child_value
+                index = child
+                first_child = arity * index + 1
+        heap[index] = value
+
+    # Time Complexity: O(m) if the m values outnumber the heap about log n to 1, else O(m log(n + m))
+    # Why: Merging with a heapify pass over the whole list is linear; pushing one by one costs log(n + m) each,
+    # so whichever is cheaper for these sizes is used.
+    def push_many(self, values):
+        values = list(values)
+        total = len(self.heap) + len(values)
+        if len(values) * total.bit_length() > total:
+            self.heap.extend(values)
+            self._rebuild()
+        else:
+            for value in values:
+                self.insert(value)
+
+    # Time Complexity: O(k log n)
+    # Returns the first k elements that remove() would return, in that order (fewer if the heap runs out)
+    def pop_many(self, k):
+        k = min(k, len(self.heap))
+        if self.use_heapq:
+            heappop, heap = self._heappop, self.heap
+            return [heappop(heap) for _ in range(k)]
+        return [self.remove() for _ in range(k)]
+
+    # Time Complexity: O(k log k) for a max heap, O(n log k) for a min heap; the heap is left unchanged.
+    # Returns the k largest elements, largest first.
+    def nlargest(self, k):
+        if self.is_max:
+            return self._first_k(k)
+        return heapq.nlargest(k, self.heap, key=self._entry_key)  # Any element may be among the largest: scan all
+
+    # Time Complexity: O(k log k) for a min heap, O(n log k) for a max heap; the heap is left unchanged.
+    # Returns the k smallest elements, smallest first.
+    def nsmallest(self, k):
+        if not self.is_max:
+            return self._first_k(k)
+        return heapq.nsmallest(k, self.heap, key=self._entry_key)  # Any element may be among the smallest: scan all
+
+    # Helper function returning the first k elements in heap order without touching the heap.
+    # An element can only be next once its parent has been taken, so the candidates are the children of the
+    # elements taken so far: they are kept in a small heap of (priority, index) pairs, which never exceeds
+    # k * arity entries.
+    def _first_k(self, k):
+        heap, arity = self.heap, self.arity
+        key = self._entry_key or (lambda entry: entry)
+        result = []
+        if k <= 0 or not heap:
+            return result
+        candidates = Heap(self.is_max)
+        candidates.insert((key(heap[0]), 0))
+        while len(result) < k and candidates.heap:
+            _, index = candidates.remove()
+            result.append(heap[index])
+            first_child = arity * index + 1
+            for child in range(first_child, min(first_child + arity, len(heap))):
+                candidates.insert((key(heap[child]), child))
+        return result
 
     # Time Complexity: O(n log n)
-    # Why: Heapsort involves inserting all elements into a heap (O(n log n)) and then extracting them back (O(n log n)).
+    # Why: Heapsort repeatedly moves the root to the end of a copy of the heap and bubbles the new root down
+    # in the shrinking front part (O(log n) each); the heap itself is left unchanged.
     def heapsort(self):
-        sorted_list = []
-        original_heap = self.heap[:]  # Copy the original heap
-        while self.heap:
-            sorted_list.append(self.remove())  # Repeatedly remove the root element and store it in sorted_list
-        self.heap = original_heap  # Restore the original heap
-        return sorted_list if not self.is_max else sorted_list[::-1]  # Reverse if max heap for ascending order
+        if self.use_heapq and not self.is_max:
+            heappop, heap = self._heappop, self.heap[:]
+            return [heappop(heap) for _ in range(len(heap))]  # heapq pops in ascending order
+        sorted_list = self.heap[:]  # Copy the heap and sort the copy in place
+        for end in range(len(sorted_list) - 1, 0, -1):
+            sorted_list[0], sorted_list[end] = sorted_list[end], sorted_list[0]  # The root goes after the heap part
+            self._sift_down(sorted_list, 0, end)
+        return sorted_list if self.is_max else sorted_list[::-1]  # A min heap leaves the list in descending order
 
     # Time Complexity: O(n)
     # Why: Heapify processes all elements and organizes them into a valid heap in linear time.
     def heapify(self, array):
         self.heap = array[:]  # Copy the array into the heap
-        for i in reversed(range(len(self.heap) // 2)):
+        self._rebuild()
+
+    # Helper function restoring the heap property of the whole list, bottom-up
+    def _rebuild(self):
+        if self.use_heapq:
+            self._heapify(self.heap)
+            return
+        for i in reversed(range((len(self.heap) + self.arity - 2) // self.arity)):
             self._bubble_down(i)  # Rebuild the heap by bubbling down non-leaf nodes
 
     # Time Complexity: O(1)
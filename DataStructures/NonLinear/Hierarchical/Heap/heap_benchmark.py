@@ -0,0 +1,114 @@
+import random
+import sys
+import time
+
+from DataStructures.NonLinear.Hierarchical.Heap.heap import Heap
+
+# Benchmark of Heap operations per second for the binary min-heap (heapq fast path), binary and 4-ary max-heaps
+# (Python loops) and a 4-ary min-heap, against the previous implementation (LegacyHeap below: _compare called
+# on every step, swaps instead of a hole, heapsort by n remove() calls on a copy of the heap).
+# Each structure is first filled with NUM_ELEMENTS random floats; then every row times one kind of operation:
+#   insert / remove: NUM_OPERATIONS single operations,
+#   push_many / pop_many: the same number of elements in batches of BATCH_SIZE,
+#   top-10: nlargest(10) on max-heaps and nsmallest(10) on min-heaps (best-first walk, heap unchanged),
+#   heapsort: one sort of the whole heap (reported as elements per second).
+# Run from the repository root:
+#   python -m DataStructures.NonLinear.Hierarchical.Heap.heap_benchmark [num_elements]
+
+NUM_ELEMENTS = 1_000_000
+NUM_OPERATIONS = 200_000
+BATCH_SIZE = 1_000
+TOP = 10
+SEED = 7
+
+
+# The Heap before the d-ary and heapq changes, kept here as the baseline
+class LegacyHeap(Heap):
+    def __init__(self, is_max=True):
+        super().__init__(is_max)
+        self.use_heapq = False
+
+    def _bubble_up(self, index):
+        parent = (index - 1) // 2
+        while index > 0 and not self._compare(self.heap[parent], self.heap[index]):
+            self.heap[parent], self.heap[index] = self.heap[index], self.heap[parent]
+            index = parent
+            parent = (index - 1) // 2
+
+    def _bubble_down(self, index):
+        length = len(self.heap)
+        left_child = 2 * index + 1
+        right_child = 2 * index + 2
+        while left_child < length:
+            swap_index = left_child
+            if right_child < length and not self._compare(self.heap[left_child], self.heap[right_child]):
+                swap_index = right_child
+            if self._compare(self.heap[index], self.heap[swap_index]):
+                break
+            self.heap[index], self.heap[swap_index] = self.heap[swap_index], self.heap[index]
+            index = swap_index
+            left_child = 2 * index + 1
+            right_child = 2 * index + 2
+
+    def push_many(self, values):
+        for value in values:
+            self.insert(value)
+
+    def pop_many(self, k):
+        return [self.remove() for _ in range(min(k, len(self.heap)))]
+
+    def heapsort(self):
+        sorted_list = []
+        original_heap = self.heap[:]
+        while self.heap:
+            sorted_list.append(self.remove())
+        self.heap = original_heap
+        return sorted_list if not self.is_max else sorted_list[::-1]
+
+    def nlargest(self, k):
+        return self.heapsort()[::-1][:k]
+
+    def nsmallest(self, k):
+        return self.heapsort()[:k]
+
+
+def make_heaps():
+    return {
+        'LegacyHeap (max)': lambda: LegacyHeap(is_max=True),
+        'LegacyHeap (min)': lambda: LegacyHeap(is_max=False),
+        'Heap (max, binary)': lambda: Heap(is_max=True),
+        'Heap (max, 4-ary)': lambda: Heap(is_max=True, arity=4),
+        'Heap (min, binary, heapq)': lambda: Heap(is_max=False),
+        'Heap (min, 4-ary)': lambda: Heap(is_max=False, arity=4),
+    }
+
+
+def operations_per_second(operation, count):
+    start = time.perf_counter()
+    operation()
+    return count / (time.perf_counter() - start)
+
+
+def run(num_elements=NUM_ELEMENTS):
+    rng = random.Random(SEED)
+    data = [rng.random() for _ in range(num_elements)]
+    values = [rng.random() for _ in range(NUM_OPERATIONS)]
+    batches = [values[i:i + BATCH_SIZE] for i in range(0, NUM_OPERATIONS, BATCH_SIZE)]
+    print(f"{num_elements:,} elements; operations per second")
+    print(f"{'heap':<28}{'insert':>12}{'remove':>12}{'push_many':>12}{'pop_many':>12}{'top-10':>12}{'heapsort':>12}")
+    for name, make_heap in make_heaps().items():
+        heap = make_heap()
+        heap.heapify(data)
+        rates = [
+            operations_per_second(lambda: [heap.insert(value) for value in values], NUM_OPERATIONS),
+            operations_per_second(lambda: [heap.remove() for _ in values], NUM_OPERATIONS),
+            operations_per_second(lambda: [heap.push_many(batch) for batch in batches], NUM_OPERATIONS),
+            operations_per_second(lambda: [heap.pop_many(BATCH_SIZE) for _ in batches], NUM_OPERATIONS),
+            operations_per_second(lambda: heap.nlargest(TOP) if heap.is_max else heap.nsmallest(TOP), 1),
+            operations_per_second(heap.heapsort, num_elements),
+        ]
+        print(f"{name:<28}" + ''.join(f"{rate:>12,.0f}" for rate in rates))
+
+
+if __name__ == '__main__':
+    run(int(sys.argv[1]) if len(sys.argv) > 1 else NUM_ELEMENTS)
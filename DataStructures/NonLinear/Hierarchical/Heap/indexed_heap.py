@@ -0,0 +1,174 @@
+from operator import itemgetter
+
+from DataStructures.NonLinear.Hierarchical.Heap.heap import Heap
+
+_ROOT = object()  # Default argument of remove(): remove the root instead of a given item
+
+
+# IndexedHeap is a Heap of (item, priority) pairs that also remembers where every item sits in the heap list.
+# The position map is updated inside _bubble_up and _bubble_down whenever an entry moves, so an item can be found
+# in O(1) and its priority changed or the item removed in O(log n), without a linear search or a rebuild.
+# Items must be hashable and unique; priorities are compared, items never are.
+# The heap list holds (priority, item) tuples; the methods take and return items and priorities separately.
+# It is always a binary heap and never uses the heapq fast path, which cannot update the position map.
+class IndexedHeap(Heap):
+    _entry_key = itemgetter(0)  # Entries are compared by priority only
+
+    def __init__(self, is_max=True):
+        super().__init__(is_max)
+        self.use_heapq = False
+        self.position = {}  # item -> index of its entry in self.heap
+
+    # Time Complexity: O(1)
+    # Why: The position map is a dictionary.
+    def __contains__(self, item):
+        return item in self.position
+
+    # Time Complexity: O(log n)
+    # Why: Same as Heap.insert: append the entry and bubble it up.
+    def insert(self, item, priority):
+        if item in self.position:
+            raise ValueError("Item is already in the heap")
+        self.heap.append((priority, item))
+        self._bubble_up(len(self.heap) - 1)
+
+    # Time Complexity: O(log n)
+    # Why: Without an argument it removes the root, like Heap.remove. With an item, the position map gives
+    # the item's index; the last entry takes its place and moves up or down to restore the heap order.
+    # Returns (item, priority) for the root (None if the heap is empty) and the removed priority for a given item.
+    def remove(self, item=_ROOT):
+        if item is _ROOT:
+            if not self.heap:
+                return None  # Return None if heap is empty
+            priority, item = self.heap[0]
+            self.remove(item)
+            return item, priority
+        if item not in self.position:
+            raise KeyError(item)
+        index = self.position.pop(item)
+        priority = self.heap[index][0]
+        last = self.heap.pop()
+        if index < len(self.heap):  # The removed entry was not the last one: fill its slot with the last entry
+            self.heap[index] = last
+            self._bubble_up(index)
+            self._bubble_down(self.position[last[1]])
+        return priority
+
+    # Time Complexity: O(log n)
+    # Why: The entry is found through the position map and moves up or down from there.
+    def update_priority(self, item, priority):
+        if item not in self.position:
+            raise KeyError(item)
+        index = self.position[item]
+        self.heap[index] = (priority, item)
+        self._bubble_up(index)
+        self._bubble_down(self.position[item])
+
+    # Time Complexity: O(m) or O(m log(n + m)), as Heap.push_many
+    # Adds the (item, priority) pairs of 'pairs'
+    def push_many(self, pairs):
+        pairs = list(pairs)
+        items = {item for item, _ in pairs}
+        if len(items) != len(pairs) or any(item in self.position for item in items):
+            raise ValueError("Item is already in the heap")  # Checked first, so the heap is left unchanged
+        total = len(self.heap) + len(pairs)
+        if len(pairs) * total.bit_length() <= total:
+            for item, priority in pairs:
+                self.insert(item, priority)
+            return
+        for item, priority in pairs:
+            self.position[item] = len(self.heap)
+            self.heap.append((priority, item))
+        self._rebuild()
+
+    # Time Complexity: as Heap.nlargest; returns (item, priority) pairs, largest priority first
+    def nlargest(self, k):
+        return [entry[::-1] for entry in super().nlargest(k)]
+
+    # Time Complexity: as Heap.nsmallest; returns (item, priority) pairs, smallest priority first
+    def nsmallest(self, k):
+        return [entry[::-1] for entry in super().nsmallest(k)]
+
+    # Time Complexity: O(1)
+    def get_priority(self, item):
+        if item not in self.position:
+            raise KeyError(item)
+        return self.heap[self.position[item]][0]
+
+    # Helper function to maintain heap property after insertion (bubbling up).
+    # The entry is held aside while its ancestors move down into the hole, then written once at its final index;
+    # every entry that moves has its position updated.
+    def _bubble_up(self, index):
+        heap, position = self.heap, self.position
+        entry = heap[index]
+        priority = entry[0]
+        while index > 0:
+            parent = (index - 1) // 2  # Parent index of the current node
+            if self._compare(heap[parent][0], priority):
+                break
+            heap[index] = heap[parent]  # Move the parent down into the hole
+            position[heap[index][1]] = index
+            index = parent
+        heap[index] = entry
+        position[entry[1]] = index
+
+    # Helper function to maintain heap property after removal (bubbling down), with the same hole technique
+    def _bubble_down(self, index):
+        heap, position = self.heap, self.position
+        length = len(heap)
+        entry = heap[index]
+        priority = entry[0]
+        child = 2 * index + 1  # Left child index
+        while child < length:
+            # Determine the index of the child to swap with
+            if child + 1 < length and not self._compare(heap[child][0], heap[child + 1][0]):
+                child += 1
+            if self._compare(priority, heap[child][0]):
+                break
+            heap[index] = heap[child]  # Move the child up into the hole
+            position[heap[index][1]] = index
+            index = child
+            child = 2 * index + 1
+        heap[index] = entry
+        position[entry[1]] = index
+
+    # Time Complexity: O(n log n)
+    # Returns the (item, priority) pairs in ascending order of priority, leaving the heap unchanged
+    def heapsort(self):
+        sorted_list = []
+        original_heap = self.heap[:]  # Copy the original heap and positions
+        original_position = dict(self.position)
+        while self.heap:
+            sorted_list.append(self.remove())
+        self.heap = original_heap  # Restore the original heap
+        self.position = original_position
+        return sorted_list if not self.is_max else sorted_list[::-1]  # Reverse if max heap for ascending order
+
+    # Time Complexity: O(n)
+    # Why: Builds the heap from (item, priority) pairs by bubbling down the non-leaf nodes, like Heap.heapify.
+    def heapify(self, array):
+        self.heap = [(priority, item) for item, priority in array]
+        self.position = {item: index for index, (_, item) in enumerate(self.heap)}
+        if len(self.position) != len(self.heap):
+            raise ValueError("Items must be unique")
+        for i in reversed(range(len(self.heap) // 2)):
+            self._bubble_down(i)
+
+    # Time Complexity: O(1)
+    # Returns the (item, priority) pair at the root of a max heap
+    def find_largest(self):
+        return self.heap[0][::-1] if self.is_max and self.heap else None
+
+    # Time Complexity: O(1)
+    # Returns the (item, priority) pair at the root of a min heap
+    def find_smallest(self):
+        return self.heap[0][::-1] if not self.is_max and self.heap else None
+
+    # Time Complexity: O(log n)
+    def enqueue(self, item, priority):
+        self.insert(item, priority)
+
+    # Time Complexity: O(log n)
+    # Returns the (item, priority) pair with the highest priority (lowest for a min heap)
+    def dequeue(self):
+        return self.remove()
@@ -0,0 +1,253 @@
+import mmap
+import struct
+from array import array
+from bisect import bisect_left
+from collections import deque
+from heapq import heappop, heappush
+
+# File layout written by save(): a 24-byte header (magic, index typecode, number of nodes, number of label bytes),
+# then the arrays one after the other: scores, best, child_start, label_start, is_end, first_bytes, labels.
+# The 8-byte arrays come first so every array starts at an offset that is a multiple of its item size.
+_MAGIC = b'FTRI'
+_HEADER = struct.Struct('<4sc3xQQ')  # magic, index typecode, padding, number of nodes, number of label bytes
+_HEADER_SIZE = _HEADER.size  # 24 bytes
+
+
+# Helper function picking the smallest unsigned array typecode that can hold values up to 'max_value'
+def index_typecode(max_value):
+    return 'I' if max_value < 2 ** 32 else 'Q'
+
+
+# FrozenTrie is a read-only, compressed Trie packed into a few flat arrays instead of one object and dict per node.
+# It works on the UTF-8 bytes of the words: every edge label is a byte string and the children of a node
+# start with different bytes (byte order is the same as the order of the words).
+#
+# The nodes are numbered in breadth-first order, with the children of every node sorted by label. Then:
+#   - the children of node v are exactly the nodes child_start[v] .. child_start[v + 1] - 1
+#     (this is the degree sequence of a LOUDS encoding, stored as prefix sums so no rank query is needed);
+#   - node v's edge label is labels[label_start[v]:label_start[v + 1]] in one concatenated byte string,
+#     and first_bytes[v] is its first byte, so a child is found with a binary search over first_bytes;
+#   - is_end[v] is 1 if a word ends at node v, scores[v] is that word's score and best[v] the best score
+#     in the subtree of v (the same caches as the Trie, used by top_k).
+# Each node costs two 4-byte integers, two 8-byte scores, two bytes and its label bytes,
+# against a TrieNode object, a dict and a label string per node for the pointer-based Trie.
+#
+# The arrays are plain buffers, so save() writes them to a file as they are and load() maps that file back:
+# a saved FrozenTrie is queried straight from the page cache, without building any Python object per node.
+#
+# Nodes cannot be added; delete() only clears the word's end flag (the nodes stay until the Trie is frozen again).
+class FrozenTrie:
+    # Builds the packed arrays in one pass over 'words', which must be sorted (duplicates keep the last score).
+    # 'scores' gives the score of each word (default: 0 for every word).
+    # Time Complexity: O(total length of the words); no node object is created
+    def __init__(self, words=(), scores=None):
+        keys = []
+        values = []
+        for index, word in enumerate(words):
+            key = word.encode('utf-8')
+            score = scores[index] if scores is not None else 0
+            if keys and key <= keys[-1]:
+                if key < keys[-1]:
+                    raise ValueError("words must be sorted")
+                values[-1] = score  # Duplicate word: keep the last score
+                continue
+            keys.append(key)
+            values.append(score)
+
+        labels = []
+        ends = bytearray()
+        node_scores = array('d')
+        child_start = []
+        # Nodes in breadth-first order: the words keys[low:high] all start with the node's string of length 'depth'
+        queue = deque([(0, len(keys), 0, b'')])
+        num_nodes = 1
+        while queue:
+            low, high, depth, label = queue.popleft()
+            labels.append(label)
+            is_end = low < high and len(keys[low]) == depth  # The node's own word sorts before its extensions
+            ends.append(is_end)
+            node_scores.append(values[low] if is_end else 0)
+            if is_end:
+                low += 1
+            child_start.append(num_nodes)  # Children are numbered in the order they are queued
+            while low < high:
+                # The words going to the same child are contiguous: they continue with the same byte
+                key = keys[low]
+                byte = key[depth]
+                end = bisect_left(keys, key[:depth] + bytes([byte + 1]), low, high) if byte < 255 else high
+                # The child's edge runs to the end of the longest prefix shared by its first and last word
+                last = keys[end - 1]
+                child_depth = depth + 1
+                while child_depth < len(key) and child_depth < len(last) and key[child_depth] == last[child_depth]:
+                    child_depth += 1
+                queue.append((low, end, child_depth, key[depth:child_depth]))
+                num_nodes += 1
+                low = end
+        child_start.append(num_nodes)
+
+        # Best score of every subtree: children come after their parent, so go through the nodes backwards
+        best = array('d', (score if end else float('-inf') for score, end in zip(node_scores, ends)))
+        for node in range(num_nodes - 1, -1, -1):
+            for child in range(child_start[node], child_start[node + 1]):
+                if best[child] > best[node]:
+                    best[node] = best[child]
+
+        label_start = [0]
+        for label in labels:
+            label_start.append(label_start[-1] + len(label))
+
+        self.num_nodes = num_nodes
+        self.typecode = index_typecode(max(label_start[-1], num_nodes))
+        self.labels = b''.join(labels)
+        self.first_bytes = bytes(label[0] if label else 0 for label in labels)  # The root has no label
+        self.label_start = array(self.typecode, label_start)
+        self.child_start = array(self.typecode, child_start)
+        self.is_end = ends
+        self.scores = node_scores
+        self.best = best
+        self._mmap = None
+
+    # Writes the packed arrays to the file at 'path', to be opened again with load()
+    # Time Complexity: O(size of the arrays)
+    def save(self, path):
+        with open(path, 'wb') as file:
+            file.write(_HEADER.pack(_MAGIC, self.typecode.encode('ascii'), self.num_nodes, len(self.labels)))
+            for buffer in self._buffers():
+                file.write(buffer)
+
+    # Opens a FrozenTrie saved with save() by memory-mapping the file.
+    # Nothing is read up front: the pages holding the nodes a query visits are loaded on first use and shared
+    # with every other process mapping the same file. Changes made by delete() stay private to this FrozenTrie.
+    # Time Complexity: O(1)
+    @classmethod
+    def load(cls, path):
+        with open(path, 'rb') as file:
+            mapping = mmap.mmap(file.fileno(), 0, access=mmap.ACCESS_COPY)
+        if len(mapping) < _HEADER_SIZE or mapping[:len(_MAGIC)] != _MAGIC:
+            mapping.close()
+            raise ValueError(f"{path} is not a FrozenTrie file")
+        _, typecode, num_nodes, num_label_bytes = _HEADER.unpack_from(mapping)
+        typecode = typecode.decode('ascii')
+        index_size = struct.calcsize(typecode)
+        sizes = (8 * num_nodes, 8 * num_nodes, index_size * (num_nodes + 1), index_size * (num_nodes + 1),
+                 num_nodes, num_nodes, num_label_bytes)
+        if _HEADER_SIZE + sum(sizes) > len(mapping):
+            mapping.close()
+            raise ValueError(f"{path} is truncated")
+
+        # Views on the mapping, in the order of _buffers(): indexing and slicing them works like the arrays
+        views = []
+        offset = _HEADER_SIZE
+        with memoryview(mapping) as whole:
+            for size, item_format in zip(sizes, ('d', 'd', typecode, typecode, 'B', 'B', 'B')):
+                views.append(whole[offset:offset + size].cast(item_format))
+                offset += size
+        trie = cls.__new__(cls)
+        trie.num_nodes = num_nodes
+        trie.typecode = typecode
+        trie.scores, trie.best, trie.child_start, trie.label_start, trie.is_end, trie.first_bytes, trie.labels = views
+        trie._mmap = mapping
+        return trie
+
+    # Unmaps the file of a FrozenTrie opened with load(); the FrozenTrie cannot be used afterwards
+    def close(self):
+        if self._mmap is not None:
+            for view in self._buffers():
+                view.release()
+            self._mmap.close()
+            self._mmap = None
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc_info):
+        self.close()
+
+    # Time Complexity: O(m log k), where m is the length of the word and k the largest number of children
+    def search(self, word):
+        node, rest = self._find(word)
+        return node >= 0 and not rest and self.is_end[node] == 1  # True only at the end of a valid word
+
+    # Time Complexity: O(m log k), where m is the length of the prefix
+    def starts_with(self, prefix):
+        return self._find(prefix)[0] >= 0  # The prefix exists if it can be followed to the end
+
+    # Time Complexity: O(m log k), where m is the length of the word
+    # Clears the word's end flag; the packed nodes themselves are never removed. Returns True if the word was present.
+    # The cached best scores are not lowered, so top_k may open a subtree that no longer holds the best word.
+    def delete(self, word):
+        node, rest = self._find(word)
+        if node < 0 or rest or not self.is_end[node]:
+            return False  # Word doesn't exist
+        self.is_end[node] = 0  # Unmark the end of the word
+        return True
+
+    # Generator yielding the words that start with 'prefix', in sorted order, one at a time
+    # Time Complexity: O(m log k) to find the prefix, then O(length) per word
+    def iter_prefix(self, prefix):
+        node, rest = self._find(prefix)
+        if node < 0:
+            return
+        labels, label_start, child_start = self.labels, self.label_start, self.child_start
+        stack = [(node, prefix.encode('utf-8') + rest)]  # The prefix may end inside an edge: start after that edge
+        while stack:
+            node, word = stack.pop()
+            if self.is_end[node]:
+                yield word.decode('utf-8')  # A word comes before all of its extensions
+            for child in range(child_start[node + 1] - 1, child_start[node] - 1, -1):  # Smallest pops first
+                stack.append((child, word + labels[label_start[child]:label_start[child + 1]]))
+
+    # Returns the k highest-scoring words starting with 'prefix', as (word, score) pairs from the best down
+    # (equal scores in sorted order of the words). Same best-first search as Trie.top_k.
+    # Time Complexity: O(m log b + k h b log(k h b)) for words at most h nodes below the prefix and b children per node
+    def top_k(self, prefix, k):
+        results = []
+        node, rest = self._find(prefix)
+        if node < 0 or k <= 0:
+            return results
+        labels, label_start, child_start, is_end = self.labels, self.label_start, self.child_start, self.is_end
+        scores, best = self.scores, self.best
+        heap = [(-best[node], prefix.encode('utf-8') + rest, 1, node)]  # Entries (-score, word, is_subtree, node)
+        while heap and len(results) < k:
+            negative_score, word, is_subtree, node = heappop(heap)
+            if not is_subtree:
+                results.append((word.decode('utf-8'), -negative_score))
+                continue
+            if is_end[node]:
+                heappush(heap, (-scores[node], word, 0, node))
+            for child in range(child_start[node], child_start[node + 1]):
+                heappush(heap, (-best[child], word + labels[label_start[child]:label_start[child + 1]], 1, child))
+        return results
+
+    # Helper function to display all words in the FrozenTrie (in sorted order)
+    # Time Complexity: O(total length of the words)
+    def display(self):
+        return list(self.iter_prefix(''))
+
+    # Helper method returning the packed arrays, in file order
+    def _buffers(self):
+        return (self.scores, self.best, self.child_start, self.label_start, self.is_end, self.first_bytes,
+                self.labels)
+
+    # Helper method following the UTF-8 bytes of 'key' from the root.
+    # Returns (node, rest): the index of the node whose edge the key ends on (-1 if the key leaves the trie),
+    # and the rest of that node's label after the key (b'' when the key ends exactly at the node).
+    def _find(self, key):
+        key = key.encode('utf-8')
+        labels, first_bytes, label_start, child_start = self.labels, self.first_bytes, self.label_start, self.child_start
+        node = 0
+        i = 0
+        while i < len(key):
+            first, last = child_start[node], child_start[node + 1]
+            child = bisect_left(first_bytes, key[i], first, last)  # Children are sorted by their first byte
+            if child == last or first_bytes[child] != key[i]:
+                return -1, b''
+            start, end = label_start[child], label_start[child + 1]
+            segment = key[i:i + end - start]
+            if labels[start:start + len(segment)] != segment:
+                return -1, b''
+            if len(segment) < end - start:
+                return child, bytes(labels[start + len(segment):end])  # The key ends in the middle of this edge
+            node = child
+            i += len(segment)
+        return node, b''
@@ -1,70 +1,281 @@
+from heapq import heappop, heappush
+
+from DataStructures.NonLinear.Hierarchical.Tries.frozen_trie import FrozenTrie
+
+NO_SCORE = float('-inf')  # Best score of a subtree that holds no word
+
+
 class TrieNode:
-    def __init__(self):
-        self.children = {}  # Dictionary to hold children nodes (characters)
-        self.is_end_of_word = False  # True if the node represents the end of a word
+    __slots__ = ('label', 'children', 'is_end_of_word', 'score', 'best')
+
+    def __init__(self, label='', is_end_of_word=False):
+        self.label = label  # Characters on the edge from the parent to this node (one character unless compressed)
+        self.children = {}  # Dictionary to hold children nodes, keyed by the first character of their label
+        self.is_end_of_word = is_end_of_word  # True if the node represents the end of a word
+        self.score = 0  # Weight of the word ending at this node (used by top_k)
+        self.best = NO_SCORE  # Highest score of a word in this node's subtree (cached, kept up to date by the Trie)
+
 
+# Trie stores one character per node by default.
+# With compressed=True it is a radix (Patricia) trie: every chain of nodes with a single child and no word ending
+# is merged into one node whose label holds the whole chain, so a dictionary of n words needs at most 2n nodes
+# however long the words are. search, starts_with and delete work the same way in both modes.
+# from_sorted() builds either form in one pass from sorted words.
+# freeze() packs either form into a read-only FrozenTrie (flat arrays that can be saved and memory-mapped,
+# see frozen_trie.py).
+#
+# Every word has a score (0 unless given to insert()) and every node caches the best score found in its subtree.
+# top_k(prefix, k) uses the caches for a best-first search: it only opens the subtrees that can still hold
+# one of the k best words, instead of scanning every completion of the prefix.
 class Trie:
-    def __init__(self):
+    def __init__(self, compressed=False):
         self.root = TrieNode()  # Root node of the Trie
+        self.compressed = compressed
+
+    # Builds a Trie from 'words' sorted in increasing order (duplicates keep the last score), in one pass.
+    # Consecutive sorted words share their longest common prefix, so only the path of the previous word is kept:
+    # each word climbs back to the shared prefix and hangs its remaining characters below it.
+    # 'scores' gives the score of each word (default: 0 for every word).
+    # Time Complexity: O(total length of the words); the best-score caches are filled once per node
+    @classmethod
+    def from_sorted(cls, words, scores=None, compressed=False):
+        trie = cls(compressed)
+        path = [trie.root]  # Nodes on the path of the previous word
+        depths = [0]  # Length of the string ending at each node of the path
+        previous = None
+        for index, word in enumerate(words):
+            score = scores[index] if scores is not None else 0
+            common = 0
+            if previous is not None:
+                if word < previous:
+                    raise ValueError("words must be sorted")
+                limit = min(len(word), len(previous))
+                while common < limit and word[common] == previous[common]:
+                    common += 1
+
+            # Leave the nodes below the shared prefix: no later word enters their subtrees
+            child = None
+            while depths[-1] > common:
+                child = path.pop()
+                depths.pop()
+                child.best = trie._subtree_best(child)
+            node = path[-1]
+            if depths[-1] < common:
+                # The shared prefix ends inside the edge of the last node left (compressed mode): split that edge
+                cut = common - depths[-1]
+                middle = TrieNode(child.label[:cut])
+                child.label = child.label[cut:]
+                middle.children[child.label[0]] = child
+                node.children[middle.label[0]] = middle
+                path.append(middle)
+                depths.append(common)
+                node = middle
+
+            if common < len(word):  # Otherwise the word is the previous word again
+                if compressed:
+                    node.children[word[common]] = node = TrieNode(word[common:])  # The rest of the word is one edge
+                    path.append(node)
+                    depths.append(len(word))
+                else:
+                    for depth in range(common, len(word)):
+                        node.children[word[depth]] = node = TrieNode(word[depth])
+                        path.append(node)
+                        depths.append(depth + 1)
+            node.is_end_of_word = True  # Mark the end of the word
+            node.score = score
+            previous = word
+
+        while path:
+            node = path.pop()
+            node.best = trie._subtree_best(node)
+        return trie
 
     # Time Complexity: O(m), where m is the length of the word
     # Why: Inserting a word involves traversing its characters (m), and possibly creating new nodes along the way.
-    def insert(self, word):
+    # In compressed mode at most one edge is split and one node is added.
+    # Inserting a word again replaces its score.
+    def insert(self, word, score=0):
+        path = [self.root]  # Nodes from the root to the word's node, for updating the best-score caches
+        if not self.compressed:
+            node = self.root
+            for char in word:
+                if char not in node.children:
+                    node.children[char] = TrieNode(char)  # Create a new node if the character doesn't exist
+                node = node.children[char]  # Move to the next node
+                path.append(node)
+            node.is_end_of_word = True  # Mark the end of the word
+            node.score = score
+            self._update_best(path)
+            return
+
         node = self.root
-        for char in word:
-            if char not in node.children:
-                node.children[char] = TrieNode()  # Create a new node if the character doesn't exist
-            node = node.children[char]  # Move to the next node
+        i = 0
+        while i < len(word):
+            child = node.children.get(word[i])
+            if child is None:
+                leaf = TrieNode(word[i:], True)  # The rest of the word becomes one edge
+                leaf.score = score
+                node.children[word[i]] = leaf
+                path.append(leaf)
+                self._update_best(path)
+                return
+            label = child.label
+            common = 1  # The first character is known to match
+            while common < len(label) and i + common < len(word) and label[common] == word[i + common]:
+                common += 1
+            if common < len(label):
+                # The word leaves the edge (or ends) in the middle: split the edge at that point
+                middle = TrieNode(label[:common])
+                middle.best = child.best
+                child.label = label[common:]
+                middle.children[child.label[0]] = child
+                node.children[word[i]] = middle
+                child = middle
+            node = child
+            path.append(node)
+            i += common
         node.is_end_of_word = True  # Mark the end of the word
+        node.score = score
+        self._update_best(path)
 
     # Time Complexity: O(m), where m is the length of the word
     # Why: Searching a word involves traversing its characters (m).
     def search(self, word):
-        node = self.root
-        for char in word:
-            if char not in node.children:
-                return False  # If the character isn't in the Trie, return False
-            node = node.children[char]
-        return node.is_end_of_word  # Return True if it's the end of a valid word
+        node, rest = self._find(word)
+        return node is not None and not rest and node.is_end_of_word  # True only at the end of a valid word
 
     # Time Complexity: O(m), where m is the length of the prefix
     # Why: Checking if a prefix exists involves traversing the characters of the prefix.
     def starts_with(self, prefix):
-        node = self.root
-        for char in prefix:
-            if char not in node.children:
-                return False  # If the character isn't in the Trie, return False
-            node = node.children[char]
-        return True  # Return True if the prefix exists in the Trie
+        return self._find(prefix)[0] is not None  # The prefix exists if it can be followed to the end
 
     # Time Complexity: O(m), where m is the length of the word
-    # Why: Deleting a word involves traversing its characters and unmarking the end of word.
+    # Why: Deleting a word involves traversing its characters, unmarking the end of word and removing the nodes
+    # that no longer lead to any word. In compressed mode a node left with a single child is merged with it.
+    # Returns True if the word was in the Trie.
     def delete(self, word):
-        def _delete(node, word, depth):
-            if depth == len(word):
-                if not node.is_end_of_word:
-                    return False  # Word doesn't exist
-                node.is_end_of_word = False  # Unmark the end of the word
-                return len(node.children) == 0  # If the node has no children, it can be deleted
-            char = word[depth]
-            if char not in node.children:
+        path = [self.root]  # Nodes from the root to the word's node
+        i = 0
+        while i < len(word):
+            child = path[-1].children.get(word[i])
+            if child is None or not word.startswith(child.label, i):
                 return False  # Word doesn't exist
-            should_delete = _delete(node.children[char], word, depth + 1)
-            if should_delete:
-                del node.children[char]  # Delete the node if it can be removed
-                return len(node.children) == 0  # Return True if the parent node can also be deleted
-            return False
+            path.append(child)
+            i += len(child.label)
+        node = path[-1]
+        if not node.is_end_of_word:
+            return False  # Word doesn't exist
+        node.is_end_of_word = False  # Unmark the end of the word
 
-        _delete(self.root, word, 0)
+        # Remove the nodes that lead nowhere, from the bottom up
+        while len(path) > 1 and not node.children and not node.is_end_of_word:
+            path.pop()
+            del path[-1].children[node.label[0]]
+            node = path[-1]
 
-    # Helper function to display all words in the Trie
-    def display(self):
-        def _collect_words(node, prefix, words):
+        # A compressed trie keeps no chain nodes: merge a remaining single child into its parent
+        if self.compressed and len(path) > 1 and not node.is_end_of_word and len(node.children) == 1:
+            (child,) = node.children.values()
+            node.label += child.label
+            node.children = child.children
+            node.is_end_of_word = child.is_end_of_word
+            node.score = child.score
+        self._update_best(path)
+        return True
+
+    # Generator yielding the words that start with 'prefix', in sorted order, one at a time.
+    # Taking the first n completions only walks the part of the subtree that leads to them.
+    # Time Complexity: O(m) to find the prefix, then O(length + k log k) per word for nodes with k children
+    def iter_prefix(self, prefix):
+        for word, _ in self._walk(prefix):
+            yield word
+
+    # Returns the k highest-scoring words starting with 'prefix', as (word, score) pairs from the best down
+    # (equal scores in sorted order of the words).
+    # Time Complexity: O(m + k h b log(k h b)) for words at most h nodes below the prefix and nodes with b children:
+    # a best-first search over the cached subtree scores opens only the subtrees leading to the k results.
+    def top_k(self, prefix, k):
+        results = []
+        node, rest = self._find(prefix)
+        if node is None or k <= 0:
+            return results
+        # Entries (-score, word, is_subtree, node): a subtree is ranked by its best score, and its string is
+        # a prefix of all its words, so ties between a subtree and a word still pop in sorted order
+        heap = [(-node.best, prefix + rest, 1, node)]
+        while heap and len(results) < k:
+            negative_score, word, is_subtree, node = heappop(heap)
+            if not is_subtree:
+                results.append((word, -negative_score))
+                continue
             if node.is_end_of_word:
-                words.append(prefix)  # Add the word to the list if it's a valid word
-            for char, child_node in node.children.items():
-                _collect_words(child_node, prefix + char, words)
+                heappush(heap, (-node.score, word, 0, node))
+            for child in node.children.values():
+                heappush(heap, (-child.best, word + child.label, 1, child))
+        return results
+
+    # Helper function to display all words in the Trie (in sorted order)
+    # Time Complexity: O(total length of the words); iterative, so long words cannot hit the recursion limit
+    def display(self):
+        return list(self.iter_prefix(''))
 
+    # Packs the Trie into a read-only FrozenTrie (compressed, flat arrays) with the same words and scores
+    # Time Complexity: O(total length of the words + n log k) for n nodes with at most k children each
+    def freeze(self):
         words = []
-        _collect_words(self.root, '', words)  # Start collecting from the root node
-        return words
\ No newline at end of file
+        scores = []
+        for word, node in self._walk(''):
+            words.append(word)
+            scores.append(node.score)
+        return FrozenTrie(words, scores)
+
+    # Helper generator yielding (word, node) for the words starting with 'prefix', in sorted order
+    def _walk(self, prefix):
+        node, rest = self._find(prefix)
+        if node is None:
+            return
+        stack = [(node, prefix + rest)]  # The prefix may end inside an edge: start from the end of that edge
+        while stack:
+            node, word = stack.pop()
+            if node.is_end_of_word:
+                yield word, node  # A word comes before all of its extensions
+            for char in sorted(node.children, reverse=True):  # Reversed, so the smallest child pops first
+                child = node.children[char]
+                stack.append((child, word + child.label))
+
+    # Helper method recomputing the cached best scores of the nodes on 'path' (root first), from the bottom up.
+    # It stops at the first node whose best score does not change: the nodes above it are up to date.
+    def _update_best(self, path):
+        for node in reversed(path):
+            best = self._subtree_best(node)
+            if best == node.best:
+                return
+            node.best = best
+
+    # Helper method computing the best score in the subtree of 'node' from its own word and its children's caches
+    @staticmethod
+    def _subtree_best(node):
+        best = node.score if node.is_end_of_word else NO_SCORE
+        for child in node.children.values():
+            if child.best > best:
+                best = child.best
+        return best
+
+    # Helper method following 'key' from the root.
+    # Returns (node, rest): the node whose edge the key ends on (None if the key leaves the trie),
+    # and the rest of that node's label after the key ('' when the key ends exactly at the node).
+    # Time Complexity: O(m), where m is the length of the key
+    def _find(self, key):
+        node = self.root
+        i = 0
+        while i < len(key):
+            child = node.children.get(key[i])
+            if child is None:
+                return None, ''
+            label = child.label
+            if not key.startswith(label, i):
+                if label.startswith(key[i:]):
+                    return child, label[len(key) - i:]  # The key ends in the middle of this edge
+                return None, ''
+            node = child
+            i += len(label)
+        return node, ''
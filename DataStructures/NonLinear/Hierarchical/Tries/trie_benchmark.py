@@ -0,0 +1,105 @@
+import os
+import random
+import sys
+import tempfile
+import time
+from itertools import islice
+
+from DataStructures.NonLinear.Hierarchical.Tries.frozen_trie import FrozenTrie
+from DataStructures.NonLinear.Hierarchical.Tries.trie import Trie
+
+# Startup and autocomplete latency benchmark on a dictionary of random terms with Zipf-like scores.
+# Startup: building a compressed Trie with one insert() per term, with Trie.from_sorted() and as a FrozenTrie
+# straight from the sorted terms, then saving the FrozenTrie and opening the file again with FrozenTrie.load().
+# Latency: each query asks for the first / best RESULTS completions of a random 1 to 4 character prefix.
+# The table reports the median and 99th percentile latency per query for:
+#   - iter_prefix: the first RESULTS completions in sorted order (lazy walk of the subtree)
+#   - top_k: the RESULTS best-scoring completions (best-first search over the cached subtree scores)
+#   - full scan: every completion collected and sorted by score, which is what top_k avoids
+# The full scan reads the whole subtree of short prefixes, so it only runs on FULL_SCAN_QUERIES queries.
+# Run from the repository root:
+#   python -m DataStructures.NonLinear.Hierarchical.Tries.trie_benchmark [num_terms]
+
+NUM_TERMS = 1_000_000
+NUM_QUERIES = 2_000
+FULL_SCAN_QUERIES = 50
+RESULTS = 10
+ALPHABET = 'abcdefghijklmnopqrstuvwxyz'
+SEED = 7
+
+
+def percentiles(query, prefixes):
+    latencies = []
+    for prefix in prefixes:
+        start = time.perf_counter()
+        query(prefix)
+        latencies.append(time.perf_counter() - start)
+    latencies.sort()
+    return latencies[len(latencies) // 2] * 1e3, latencies[min(len(latencies) - 1, len(latencies) * 99 // 100)] * 1e3
+
+
+def queries(structure, scores):
+    def first_completions(prefix):
+        return list(islice(structure.iter_prefix(prefix), RESULTS))
+
+    def best_completions(prefix):
+        return structure.top_k(prefix, RESULTS)
+
+    def full_scan(prefix):
+        completions = [(word, scores[word]) for word in structure.iter_prefix(prefix)]
+        return sorted(completions, key=lambda pair: -pair[1])[:RESULTS]
+
+    return (('iter_prefix', first_completions, NUM_QUERIES), ('top_k', best_completions, NUM_QUERIES),
+            ('full scan', full_scan, FULL_SCAN_QUERIES))
+
+
+def timed(label, build):
+    start = time.perf_counter()
+    result = build()
+    print(f"{label:<44}{(time.perf_counter() - start) * 1e3:>12.1f} ms")
+    return result
+
+
+def insert_all(words, scores):
+    trie = Trie(compressed=True)
+    for word in words:
+        trie.insert(word, scores[word])
+    return trie
+
+
+def load_and_query(path):
+    trie = FrozenTrie.load(path)
+    trie.top_k('a', RESULTS)
+    return trie
+
+
+def run(num_terms=NUM_TERMS):
+    rng = random.Random(SEED)
+    scores = {}
+    while len(scores) < num_terms:
+        word = ''.join(rng.choice(ALPHABET) for _ in range(rng.randint(4, 12)))
+        scores[word] = 10 ** 6 // rng.randint(1, 10 ** 6)  # Zipf-like: a few terms score much higher than the rest
+    words = sorted(scores)
+    word_scores = [scores[word] for word in words]
+
+    print(f"{num_terms:,} terms")
+    trie = timed('Trie.insert() per term (compressed)', lambda: insert_all(words, scores))
+    timed('Trie.from_sorted() (compressed)', lambda: Trie.from_sorted(words, word_scores, compressed=True))
+    frozen = timed('FrozenTrie(sorted terms)', lambda: FrozenTrie(words, word_scores))
+    path = os.path.join(tempfile.mkdtemp(), 'dictionary.trie')
+    timed('FrozenTrie.save()', lambda: frozen.save(path))
+    loaded = timed('FrozenTrie.load() + first top_k', lambda: load_and_query(path))
+    print(f"{frozen.num_nodes:,} packed nodes, {os.path.getsize(path) / 2 ** 20:.1f} MB file")
+
+    prefixes = [''.join(rng.choice(ALPHABET) for _ in range(rng.randint(1, 4))) for _ in range(NUM_QUERIES)]
+    print(f"{'structure':<20}{'query':<14}{'p50 ms':>10}{'p99 ms':>10}")
+    for name, structure in (('Trie', trie), ('FrozenTrie', frozen), ('FrozenTrie (mmap)', loaded)):
+        for query_name, query, num_queries in queries(structure, scores):
+            p50, p99 = percentiles(query, prefixes[:num_queries])
+            print(f"{name:<20}{query_name:<14}{p50:>10.3f}{p99:>10.3f}")
+    loaded.close()
+    os.remove(path)
+
+
+if __name__ == '__main__':
+    run(int(sys.argv[1]) if len(sys.argv) > 1 else NUM_TERMS)
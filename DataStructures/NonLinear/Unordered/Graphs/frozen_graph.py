@@ -0,0 +1,258 @@
+from array import array
+from bisect import bisect_left
+from collections import deque
+from itertools import repeat
+from operator import itemgetter
+
+from DataStructures.NonLinear.Unordered.Graphs.parallel_graph import component_labels, iter_bfs_levels
+
+try:
+    import numpy as np
+except ImportError:  # NumPy is optional: only as_numpy() needs it
+    np = None
+
+
+# Helper function picking the smallest unsigned array typecode that can hold values up to 'max_value'
+def index_typecode(max_value):
+    return 'I' if max_value < 2 ** 32 else 'Q'
+
+
+class FrozenGraph:
+    # Read-only graph in CSR (compressed sparse row) form, produced by DirectedGraph.freeze() and
+    # UndirectedGraph.freeze(). The nodes are numbered 0..n-1 and all adjacency lists are stored back to back:
+    # the neighbors of node i are targets[offsets[i]:offsets[i + 1]], sorted, as node numbers.
+    # An edge costs one 4-byte integer (8 bytes past 2**32 nodes) instead of a pointer to a boxed node
+    # in a Python list or set, and a node costs one more integer in 'offsets'.
+    #
+    # If the nodes of the graph are the integers 0..n-1 they are their own numbers and get_neighbors()
+    # returns zero-copy memoryview slices of 'targets'. Any other node labels are kept in 'nodes' and 'index'
+    # and get_neighbors() maps the numbers back to labels.
+    # An undirected graph stores every edge in both directions, as the mutable graph does.
+    # Edge weights are kept in a 'weights' array parallel to 'targets', unless every weight is 1 (weights is None).
+
+    def __init__(self, adjacency, directed=True, trace=None, weights=None):
+        # Time Complexity: O(V + E log d) to number the nodes and sort every adjacency list (d = largest degree)
+        # Builds the CSR arrays from 'adjacency', a dictionary mapping every node to an iterable of its neighbors,
+        # and the optional 'weights', a dictionary mapping every node to the weights of those edges, in the same order
+        self.directed = directed
+        self.trace = trace  # Same callback as the mutable graphs: trace('visit', node) during traversals
+
+        labels = list(adjacency)
+        n = len(labels)
+        if all(type(node) is int for node in labels) and (n == 0 or (min(labels) == 0 and max(labels) == n - 1)):
+            self.nodes = None  # The nodes are already 0..n-1 (dictionary keys are unique)
+            self.index = None
+            labels = range(n)
+        else:
+            self.nodes = labels  # Node number -> label
+            self.index = {node: i for i, node in enumerate(labels)}  # Label -> node number
+
+        self.num_nodes = n
+        num_edges = sum(len(adjacency[node]) for node in labels)
+        self.offsets = array(index_typecode(num_edges), [0])
+        self.targets = array(index_typecode(max(n - 1, 0)))
+        if weights is not None and all(weight == 1 for node in labels for weight in weights[node]):
+            weights = None  # Unweighted graph: no need to store the weights
+        self.weights = array('d') if weights is not None else None
+        for node in labels:
+            neighbors = adjacency[node]
+            if self.index is not None:
+                neighbors = [self.index[v] for v in neighbors]
+            if weights is None:
+                self.targets.extend(sorted(neighbors))
+            else:
+                edges = sorted(zip(neighbors, weights[node]), key=itemgetter(0))
+                self.targets.extend(map(itemgetter(0), edges))
+                self.weights.extend(map(itemgetter(1), edges))
+            self.offsets.append(len(self.targets))
+        self.num_edges = len(self.targets)  # Number of stored (directed) edge entries
+        self._targets_view = memoryview(self.targets)
+
+    def has_edge(self, u, v):
+        # Time Complexity: O(log d) - binary search in the sorted neighbors of u
+        # Checks if there is an edge from node u to node v
+        i, j = self._number(u), self._number(v)
+        if i is None or j is None:
+            return False
+        start, end = self.offsets[i], self.offsets[i + 1]
+        position = bisect_left(self.targets, j, start, end)
+        return position < end and self.targets[position] == j
+
+    def get_neighbors(self, u):
+        # Time Complexity: O(1) for nodes 0..n-1 (a memoryview slice, no copy), O(d) to map other labels
+        # Returns the neighbors of node u, in increasing order of node number
+        i = self._number(u)
+        if i is None:
+            return self._targets_view[0:0]
+        neighbors = self._targets_view[self.offsets[i]:self.offsets[i + 1]]
+        if self.nodes is None:
+            return neighbors
+        return [self.nodes[j] for j in neighbors]
+
+    def get_weight(self, u, v):
+        # Time Complexity: O(log d) - binary search in the sorted neighbors of u
+        # Returns the weight of the edge from u to v
+        i, j = self._number(u), self._number(v)
+        if i is not None and j is not None:
+            start, end = self.offsets[i], self.offsets[i + 1]
+            position = bisect_left(self.targets, j, start, end)
+            if position < end and self.targets[position] == j:
+                return 1 if self.weights is None else self.weights[position]
+        raise ValueError("Edge not in graph")
+
+    def get_edges(self, u):
+        # Time Complexity: O(1) to create the iterable (plus O(d) to map non-integer labels)
+        # Returns an iterable of (neighbor, weight) pairs for the edges leaving node u
+        i = self._number(u)
+        if i is None:
+            return iter(())
+        start, end = self.offsets[i], self.offsets[i + 1]
+        weights = repeat(1) if self.weights is None else self.weights[start:end]
+        return zip(self.get_neighbors(u), weights)
+
+    def degree(self, u):
+        # Time Complexity: O(1)
+        # Returns the number of edges leaving node u
+        i = self._number(u)
+        return 0 if i is None else self.offsets[i + 1] - self.offsets[i]
+
+    def __iter__(self):
+        # Time Complexity: O(1) to create the iterator, O(V) to go through it
+        # Iterates over the nodes of the graph
+        return iter(range(self.num_nodes) if self.nodes is None else self.nodes)
+
+    def bfs(self, start):
+        # Time Complexity: O(V + E) where V is the number of vertices and E is the number of edges
+        # Performs a breadth-first search starting from node 'start'
+        # Returns the nodes in the order they were visited
+        return [node for node, _, _ in self.iter_bfs(start)]
+
+    def dfs(self, start):
+        # Time Complexity: O(V + E) where V is the number of vertices and E is the number of edges
+        # Performs a depth-first search starting from node 'start'
+        # Returns the nodes in the order they were visited
+        return [node for node, _, _ in self.iter_dfs(start)]
+
+    def iter_bfs(self, start, prune=None, max_depth=None):
+        # Time Complexity: O(V + E) for a full traversal; stopping early only costs the part already explored
+        # Generator yielding (node, depth, parent) in breadth-first order, as DirectedGraph.iter_bfs
+        # (one byte per node tracks the visited nodes)
+        first = self._number(start)
+        if first is None:
+            yield from self._visit_unknown(start)
+            return
+        offsets, targets = self.offsets, self.targets
+        visited = bytearray(self.num_nodes)
+        visited[first] = 1
+        queue = deque([(first, 0, None)])
+        while queue:
+            node, depth, parent = queue.popleft()
+            label = self._label(node)
+            if self.trace is not None:
+                self.trace('visit', label)
+            yield label, depth, parent
+            if (max_depth is not None and depth >= max_depth) or (prune is not None and prune(label, depth, parent)):
+                continue
+            for neighbor in targets[offsets[node]:offsets[node + 1]]:
+                if not visited[neighbor]:
+                    visited[neighbor] = 1  # Marked when queued, so no node is queued twice
+                    queue.append((neighbor, depth + 1, label))
+
+    def iter_dfs(self, start, prune=None, max_depth=None):
+        # Time Complexity: O(V + E) for a full traversal; stopping early only costs the part already explored
+        # Generator yielding (node, depth, parent) in depth-first preorder, as DirectedGraph.iter_dfs
+        # (explicit stack of neighbor iterators, one byte per node tracks the visited nodes)
+        first = self._number(start)
+        if first is None:
+            yield from self._visit_unknown(start)
+            return
+        offsets, targets = self.offsets, self._targets_view
+        visited = bytearray(self.num_nodes)
+        visited[first] = 1
+        if self.trace is not None:
+            self.trace('visit', start)
+        yield start, 0, None
+        if (max_depth is not None and max_depth <= 0) or (prune is not None and prune(start, 0, None)):
+            return
+        stack = [(start, iter(targets[offsets[first]:offsets[first + 1]]))]
+        while stack:
+            label, neighbors = stack[-1]
+            for neighbor in neighbors:  # Resume the neighbors of the node on top of the stack
+                if not visited[neighbor]:
+                    visited[neighbor] = 1
+                    depth = len(stack)
+                    neighbor_label = self._label(neighbor)
+                    if self.trace is not None:
+                        self.trace('visit', neighbor_label)
+                    yield neighbor_label, depth, label
+                    if (max_depth is None or depth < max_depth) and (
+                            prune is None or not prune(neighbor_label, depth, label)):
+                        stack.append((neighbor_label, iter(targets[offsets[neighbor]:offsets[neighbor + 1]])))
+                    break
+            else:
+                stack.pop()  # All neighbors explored: go back up
+
+    def multi_source_bfs(self, sources, max_depth=None, workers=None):
+        # Time Complexity: O(S (V + E)) for S sources, split over 'workers' processes (default: one per CPU)
+        # Runs one breadth-first search from every node in 'sources' (see parallel_graph.py)
+        # Returns a dictionary mapping every source to an array('i') of depths indexed by node number
+        # (the node labels are self.nodes when the nodes are not 0..n-1), -1 for the nodes not reached
+        return dict(self.iter_multi_source_bfs(sources, max_depth, workers))
+
+    def iter_multi_source_bfs(self, sources, max_depth=None, workers=None):
+        # Time Complexity: as multi_source_bfs()
+        # Generator yielding (source, depths) pairs in the order of 'sources', so the results can be reduced
+        # as they arrive instead of all being kept
+        sources = list(sources)
+        numbers = [self._number(source) for source in sources]
+        if None in numbers:
+            raise ValueError("Source not in graph")
+        return zip(sources, iter_bfs_levels(self.offsets, self.targets, numbers, max_depth, workers))
+
+    def connected_components(self, workers=None):
+        # Time Complexity: O((V + E) α(V)) with a union-find, split over 'workers' processes (default: one per CPU)
+        # Returns the connected components (weakly connected for a directed graph) as lists of nodes,
+        # ordered by their smallest node number
+        components = []
+        labels = component_labels(self.offsets, self.targets, workers, symmetric=not self.directed)
+        for i, label in enumerate(labels):
+            if label == len(components):
+                components.append([])  # Components are numbered in order of their first node
+            components[label].append(self._label(i))
+        return components
+
+    def nbytes(self):
+        # Time Complexity: O(1)
+        # Returns the size in bytes of the CSR arrays (not counting the label mapping of non-integer nodes)
+        size = self.offsets.itemsize * len(self.offsets) + self.targets.itemsize * len(self.targets)
+        return size if self.weights is None else size + self.weights.itemsize * len(self.weights)
+
+    def as_numpy(self):
+        # Time Complexity: O(1)
+        # Returns (offsets, targets) as NumPy arrays sharing the CSR buffers, no copy
+        if np is None:
+            raise ImportError("as_numpy() requires NumPy")
+        return (np.frombuffer(self.offsets, dtype=self.offsets.typecode),
+                np.frombuffer(self.targets, dtype=self.targets.typecode))
+
+    def display(self):
+        # Time Complexity: O(V + E) to display all nodes and edges
+        # Displays the adjacency list of every node
+        for i in range(self.num_nodes):
+            print(f"{self._label(i)}: {list(self.get_neighbors(self._label(i)))}")
+
+    def _number(self, node):
+        # Helper method returning the number of 'node', or None if it is not in the graph
+        if self.index is not None:
+            return self.index.get(node)
+        return node if type(node) is int and 0 <= node < self.num_nodes else None
+
+    def _label(self, i):
+        # Helper method returning the node with number i
+        return i if self.nodes is None else self.nodes[i]
+
+    def _visit_unknown(self, start):
+        # Helper generator: like the mutable graphs, a traversal from a node that is not in the graph visits only it
+        if self.trace is not None:
+            self.trace('visit', start)
+        yield start, 0, None
@@ -0,0 +1,69 @@
+import random
+import sys
+import time
+import tracemalloc
+
+from DataStructures.NonLinear.Unordered.Graphs.graphs_directed import DirectedGraph
+
+# Memory per edge and has_edge()/remove_edge() speed of the DirectedGraph storage backends:
+# 'list' (Python list per node), 'set' (insertion-ordered dictionary keys per node) and the CSR FrozenGraph
+# from freeze() (offsets + targets arrays). The graph has integer nodes 0..n-1 and random edges, so the
+# node objects themselves are small cached or shared ints; what is measured is the adjacency storage.
+# Memory is the traced allocation of building the structure (for freeze(), of the FrozenGraph alone).
+# has_edge() is timed on NUM_QUERIES random pairs (mostly misses) and remove_edge() on existing edges.
+# Run from the repository root:
+#   python -m DataStructures.NonLinear.Unordered.Graphs.graph_memory_benchmark [num_edges]
+
+NUM_EDGES = 2_000_000
+AVERAGE_DEGREE = 16
+NUM_QUERIES = 100_000
+SEED = 7
+
+
+def traced(build):
+    tracemalloc.start()
+    result = build()
+    size = tracemalloc.get_traced_memory()[0]
+    tracemalloc.stop()
+    return result, size
+
+
+def build_graph(backend, edges):
+    graph = DirectedGraph(backend=backend)
+    for u, v in edges:
+        graph.add_edge(u, v)
+    return graph
+
+
+def per_second(operation, pairs):
+    start = time.perf_counter()
+    for u, v in pairs:
+        operation(u, v)
+    return len(pairs) / (time.perf_counter() - start)
+
+
+def run(num_edges=NUM_EDGES):
+    rng = random.Random(SEED)
+    num_nodes = max(1, num_edges // AVERAGE_DEGREE)
+    edges = {(rng.randrange(num_nodes), rng.randrange(num_nodes)) for _ in range(num_edges)}  # No parallel edges
+    edges = sorted(edges, key=lambda edge: rng.random())
+    queries = [(rng.randrange(num_nodes), rng.randrange(num_nodes)) for _ in range(NUM_QUERIES)]
+    removals = edges[:NUM_QUERIES]
+
+    print(f"{num_nodes:,} nodes, {len(edges):,} edges")
+    print(f"{'backend':<16}{'bytes/edge':>12}{'has_edge/s':>14}{'remove_edge/s':>16}")
+    for backend in ('list', 'set'):
+        graph, size = traced(lambda: build_graph(backend, edges))
+        has_edge_rate = per_second(graph.has_edge, queries)
+        if backend == 'set':
+            frozen, frozen_size = traced(graph.freeze)
+        remove_rate = per_second(graph.remove_edge, removals)
+        print(f"{backend:<16}{size / len(edges):>12.1f}{has_edge_rate:>14,.0f}{remove_rate:>16,.0f}")
+        del graph
+    frozen_rate = per_second(frozen.has_edge, queries)
+    print(f"{'frozen (CSR)':<16}{frozen_size / len(edges):>12.1f}{frozen_rate:>14,.0f}{'read-only':>16}")
+    print(f"CSR arrays alone: {frozen.nbytes() / len(edges):.1f} bytes/edge")
+
+
+if __name__ == '__main__':
+    run(int(sys.argv[1]) if len(sys.argv) > 1 else NUM_EDGES)
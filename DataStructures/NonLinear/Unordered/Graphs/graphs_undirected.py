@@ -1,78 +1,206 @@
+from collections import deque
+from itertools import repeat
+
+from DataStructures.NonLinear.Unordered.Graphs.frozen_graph import FrozenGraph
+
+BACKENDS = ('list', 'set')
+
+
 class UndirectedGraph:
-    def __init__(self):
+    directed = False
+
+    def __init__(self, trace=None, backend='list'):
         # Initializes a new undirected graph with an empty dictionary to hold the adjacency list
+        # backend='list': every node's neighbors are a Python list (parallel edges allowed, has_edge/remove_edge O(d)),
+        #   with the edge weights in parallel lists in self.weights once an edge has a weight other than 1
+        #   (until then self.weights is None and every weight is 1, so unweighted graphs pay nothing for weights)
+        # backend='set': every node's neighbors are the keys of a dictionary, used as an insertion-ordered set
+        #   (no parallel edges, O(1) has_edge/remove_edge, traversals visit neighbors in the order they were added),
+        #   with the edge weights as the dictionary values
+        if backend not in BACKENDS:
+            raise ValueError(f"backend must be one of {BACKENDS}")
         self.graph = {}
+        self.weights = None  # node -> weights of its edges, in the order of self.graph[node] (list backend only)
+        self.backend = backend
+        self.use_sets = backend == 'set'
+        # Optional callback trace(operation, *details) called on edge changes and visited nodes (None = silent)
+        self.trace = trace
 
-    def add_edge(self, u, v):
+    def add_edge(self, u, v, weight=1):
         # Time Complexity: O(1) for adding an edge in both directions
-        # Adds an undirected edge between nodes u and v
-
-        if u not in self.graph:
-            self.graph[u] = []  # Initialize adjacency list for u if it doesn't exist
-        if v not in self.graph:
-            self.graph[v] = []  # Initialize adjacency list for v if it doesn't exist
-
-        self.graph[u].append(v)  # Add v to u's adjacency list
-        self.graph[v].append(u)  # Add u to v's adjacency list (undirected, so both ways)
+        # Adds an undirected edge between nodes u and v with the given weight (used by the shortest-path algorithms)
+
+        for node in (u, v):
+            if node not in self.graph:
+                # Initialize the adjacency list of the node if it doesn't exist
+                self.graph[node] = {} if self.use_sets else []
+                if self.weights is not None:
+                    self.weights[node] = []
+
+        if self.use_sets:
+            self.graph[u][v] = weight  # Add v to u's adjacency set; an existing edge gets the new weight
+            self.graph[v][u] = weight  # Add u to v's adjacency set (undirected, so both ways)
+        else:
+            if weight != 1 and self.weights is None:
+                self._store_weights()
+            self.graph[u].append(v)  # Add v to u's adjacency list
+            self.graph[v].append(u)  # Add u to v's adjacency list (undirected, so both ways)
+            if self.weights is not None:
+                self.weights[u].append(weight)
+                self.weights[v].append(weight)
+        if self.trace is not None:
+            self.trace('add_edge', u, v)
 
     def remove_edge(self, u, v):
-        # Time Complexity: O(E) where E is the number of edges
+        # Time Complexity: O(E) where E is the number of edges (O(1) with the set backend)
         # Removes an undirected edge between nodes u and v (removes both directions)
 
         if u in self.graph and v in self.graph:
-            if v in self.graph[u]:
-                self.graph[u].remove(v)  # Remove v from u's adjacency list
-            if u in self.graph[v]:
-                self.graph[v].remove(u)  # Remove u from v's adjacency list
+            if self.use_sets:
+                self.graph[u].pop(v, None)  # Remove v from u's adjacency set
+                self.graph[v].pop(u, None)  # Remove u from v's adjacency set
+            else:
+                if v in self.graph[u]:
+                    index = self.graph[u].index(v)
+                    del self.graph[u][index]  # Remove v from u's adjacency list
+                    if self.weights is not None:
+                        del self.weights[u][index]
+                if u in self.graph[v]:
+                    index = self.graph[v].index(u)
+                    del self.graph[v][index]  # Remove u from v's adjacency list
+                    if self.weights is not None:
+                        del self.weights[v][index]
+            if self.trace is not None:
+                self.trace('remove_edge', u, v)
 
     def has_edge(self, u, v):
-        # Time Complexity: O(V) where V is the number of vertices in the worst case
+        # Time Complexity: O(V) where V is the number of vertices in the worst case (O(1) with the set backend)
         # Checks if there is an undirected edge between u and v
         return u in self.graph and v in self.graph[u] and v in self.graph and u in self.graph[v]
 
     def get_neighbors(self, u):
-        # Time Complexity: O(1) for returning the list of neighbors
+        # Time Complexity: O(1) for returning the list of neighbors (a view of the dictionary keys with the set backend)
         # Returns the neighbors of node u (the nodes that are connected to u)
+        if self.use_sets:
+            return self.graph.get(u, {}).keys()
         return self.graph.get(u, [])
 
+    def get_weight(self, u, v):
+        # Time Complexity: O(d) where d is the degree of u (O(1) with the set backend)
+        # Returns the weight of the edge from u to v (the first one if there are parallel edges)
+        if u in self.graph and v in self.graph[u]:
+            if self.use_sets:
+                return self.graph[u][v]
+            if self.weights is None:
+                return 1
+            return self.weights[u][self.graph[u].index(v)]
+        raise ValueError("Edge not in graph")
+
+    def get_edges(self, u):
+        # Time Complexity: O(1) to create the iterable
+        # Returns an iterable of (neighbor, weight) pairs for the edges leaving node u
+        if self.use_sets:
+            return self.graph.get(u, {}).items()
+        if self.weights is None:
+            return zip(self.graph.get(u, ()), repeat(1))
+        return zip(self.graph.get(u, ()), self.weights.get(u, ()))
+
+    def freeze(self):
+        # Time Complexity: O(V + E log d) where d is the largest degree
+        # Returns a read-only FrozenGraph copy of the graph in CSR form (offsets + targets arrays, see frozen_graph.py)
+        weights = {node: edges.values() for node, edges in self.graph.items()} if self.use_sets else self.weights
+        return FrozenGraph(self.graph, directed=False, trace=self.trace, weights=weights)
+
+    def _store_weights(self):
+        # Helper method starting to store the weights (list backend): every edge added so far has weight 1
+        self.weights = {node: [1] * len(neighbors) for node, neighbors in self.graph.items()}
+
+    def __iter__(self):
+        # Time Complexity: O(1) to create the iterator, O(V) to go through it
+        # Iterates over the nodes of the graph
+        return iter(self.graph)
+
     def bfs(self, start):
         # Time Complexity: O(V + E) where V is the number of vertices and E is the number of edges
         # Performs a breadth-first search starting from node 'start'
-
-        visited = set()  # Set to track visited nodes
-        queue = [start]  # Initialize queue with the start node
-
-        while queue:  # While there are nodes to explore
-            node = queue.pop(0)  # Dequeue a node from the front of the queue
-            if node not in visited:  # If it hasn't been visited yet
-                visited.add(node)  # Mark it as visited
-                print(node, end=' ')  # Process the node (print it)
-
-                # Add all unvisited neighbors to the queue
-                for neighbor in self.graph.get(node, []):
-                    if neighbor not in visited:
-                        queue.append(neighbor)  # Enqueue the neighbor
+        # Returns the nodes in the order they were visited
+        return [node for node, _, _ in self.iter_bfs(start)]
 
     def dfs(self, start):
         # Time Complexity: O(V + E) where V is the number of vertices and E is the number of edges
         # Performs a depth-first search starting from node 'start'
-
-        visited = set()  # Set to track visited nodes
-        self._dfs_recursive(start, visited)  # Start the recursive DFS
-
-    def _dfs_recursive(self, node, visited):
-        # Helper method for DFS that performs the recursive call
-        if node not in visited:  # If the node hasn't been visited
-            visited.add(node)  # Mark it as visited
-            print(node, end=' ')  # Process the node (print it)
-
-            # Recursively visit all unvisited neighbors
-            for neighbor in self.graph.get(node, []):
-                self._dfs_recursive(neighbor, visited)  # Visit the neighbor
+        # Returns the nodes in the order they were visited
+        return [node for node, _, _ in self.iter_dfs(start)]
+
+    def iter_bfs(self, start, prune=None, max_depth=None):
+        # Time Complexity: O(V + E) for a full traversal; stopping early only costs the part already explored
+        # Generator yielding (node, depth, parent) for the nodes reachable from 'start' in breadth-first order
+        # (parent is None for 'start'). Nothing is computed before the first node is yielded, so the caller can
+        # stop at any time by leaving the loop.
+        # prune(node, depth, parent): optional function; when it returns True the node's neighbors are not explored
+        # max_depth: optional limit; nodes at this depth are yielded but their neighbors are not explored
+        # The graph must not change during the traversal.
+        visited = {start}  # Nodes already queued, so no node is queued twice
+        queue = deque([(start, 0, None)])
+        while queue:
+            node, depth, parent = queue.popleft()
+            if self.trace is not None:
+                self.trace('visit', node)
+            yield node, depth, parent
+            if (max_depth is not None and depth >= max_depth) or (prune is not None and prune(node, depth, parent)):
+                continue
+            for neighbor in self.graph.get(node, ()):
+                if neighbor not in visited:
+                    visited.add(neighbor)
+                    queue.append((neighbor, depth + 1, node))
+
+    def iter_dfs(self, start, prune=None, max_depth=None):
+        # Time Complexity: O(V + E) for a full traversal; stopping early only costs the part already explored
+        # Generator yielding (node, depth, parent) for the nodes reachable from 'start' in depth-first preorder,
+        # the same order as a recursive search. 'prune' and 'max_depth' work as in iter_bfs.
+        # An explicit stack holds one neighbor iterator per level of the current path, so deep graphs
+        # cannot overflow the recursion limit and memory stays proportional to the path length.
+        # The graph must not change during the traversal.
+        visited = {start}
+        if self.trace is not None:
+            self.trace('visit', start)
+        yield start, 0, None
+        if (max_depth is not None and max_depth <= 0) or (prune is not None and prune(start, 0, None)):
+            return
+        stack = [(start, iter(self.graph.get(start, ())))]
+        while stack:
+            node, neighbors = stack[-1]
+            for neighbor in neighbors:  # Resume the neighbors of the node on top of the stack
+                if neighbor not in visited:
+                    visited.add(neighbor)
+                    depth = len(stack)
+                    if self.trace is not None:
+                        self.trace('visit', neighbor)
+                    yield neighbor, depth, node
+                    if (max_depth is None or depth < max_depth) and (prune is None or not prune(neighbor, depth, node)):
+                        stack.append((neighbor, iter(self.graph.get(neighbor, ()))))  # Go down into the neighbor
+                    break
+            else:
+                stack.pop()  # All neighbors explored: go back up
+
+    def multi_source_bfs(self, sources, max_depth=None, workers=None):
+        # Time Complexity: O(S (V + E)) for S sources, split over 'workers' processes (default: one per CPU)
+        # Runs one breadth-first search from every node in 'sources' on the frozen graph (see parallel_graph.py)
+        # Returns a dictionary mapping every source to a dictionary {node: depth} of the nodes it reaches
+        # (FrozenGraph.multi_source_bfs returns compact depth arrays instead)
+        frozen = self.freeze()
+        nodes = list(frozen)
+        return {source: {node: depth for node, depth in zip(nodes, depths) if depth >= 0}
+                for source, depths in frozen.iter_multi_source_bfs(sources, max_depth, workers)}
+
+    def connected_components(self, workers=None):
+        # Time Complexity: O((V + E) α(V)) - union-find over the frozen graph (see FrozenGraph.connected_components)
+        # Returns the connected components as lists of nodes
+        return self.freeze().connected_components(workers)
 
     def display(self):
         # Time Complexity: O(V + E) to display all nodes and edges
         # Displays the entire undirected graph's adjacency list representation
 
         for node in self.graph:
-            print(f"{node}: {self.graph[node]}")  # Print each node and its neighbors
+            print(f"{node}: {list(self.graph[node])}")  # Print each node and its neighbors
@@ -0,0 +1,184 @@
+import os
+from array import array
+from bisect import bisect_left
+from concurrent.futures import ProcessPoolExecutor
+from contextlib import contextmanager
+from itertools import repeat
+from multiprocessing import shared_memory
+
+from DataStructures.NonLinear.Unordered.Graphs.union_find import UnionFind
+
+# Batch traversals over the CSR arrays of a FrozenGraph (offsets + targets, see frozen_graph.py), sharded across
+# a ProcessPoolExecutor. The two arrays are copied once into a multiprocessing.shared_memory block; every worker
+# process attaches to it by name when it starts and reads the graph through memoryviews, so the graph is never
+# pickled. Only the small jobs (lists of node numbers) and their results travel between the processes.
+# With workers=1 (or a single job) everything runs in the calling process, on the arrays themselves.
+# Nodes are node numbers 0..n-1 here; FrozenGraph maps them to and from its node labels.
+
+CHUNKS_PER_WORKER = 4  # Jobs per worker: smaller jobs even out the load when some sources reach more nodes
+ALIGNMENT = 8  # Byte alignment of the targets array in the shared memory block
+SHARD_EDGES_PER_NODE = 4  # component_labels() gives every shard at least this many edges per node of the graph
+
+# Graph of a worker process, set by _attach() when the process starts
+_shared = None
+_offsets = None
+_targets = None
+
+
+def bfs_levels(offsets, targets, source, max_depth=None):
+    # Time Complexity: O(V + E)
+    # Breadth-first search from node number 'source', one level at a time
+    # Returns an array('i') giving the depth of every node, -1 for the nodes not reached (or deeper than max_depth)
+    levels = array('i', [-1]) * (len(offsets) - 1)
+    levels[source] = 0
+    frontier = [source]
+    depth = 0
+    while frontier and (max_depth is None or depth < max_depth):
+        depth += 1
+        next_frontier = []
+        for node in frontier:
+            for neighbor in targets[offsets[node]:offsets[node + 1]]:
+                if levels[neighbor] < 0:
+                    levels[neighbor] = depth
+                    next_frontier.append(neighbor)
+        frontier = next_frontier
+    return levels
+
+
+def iter_bfs_levels(offsets, targets, sources, max_depth=None, workers=None):
+    # Time Complexity: O(S (V + E)) for S sources, split over the workers (default: one per CPU)
+    # Generator yielding bfs_levels() for every node number in 'sources', in the same order
+    sources = list(sources)
+    workers = workers or os.cpu_count() or 1
+    if workers == 1 or len(sources) <= 1:
+        targets = memoryview(targets)  # Slices of a memoryview are not copies
+        for source in sources:
+            yield bfs_levels(offsets, targets, source, max_depth)
+        return
+    size = -(-len(sources) // (workers * CHUNKS_PER_WORKER))  # Sources per job, rounded up
+    jobs = [sources[i:i + size] for i in range(0, len(sources), size)]
+    with _worker_pool(offsets, targets, min(workers, len(jobs))) as pool:
+        for results in pool.map(_bfs_job, jobs, repeat(max_depth)):
+            yield from results
+
+
+def component_labels(offsets, targets, workers=None, symmetric=False):
+    # Time Complexity: O((V + E) α(V)) in one process; with W shards, O((E / W + V log W) α(V)) on the longest path
+    # Labels the connected components (following the edges both ways, so a directed graph gets its weakly
+    # connected components): returns an array giving every node the number of its component, numbered 0, 1, ...
+    # in the order of their smallest node.
+    # 'symmetric' tells that every edge is stored both ways (an undirected graph): only one copy is then used.
+    # The edges are split into node ranges, one per shard; each shard runs a UnionFind over its edges and keeps
+    # the edges that merged two sets (a spanning forest, at most V - 1 edges). The forests are then merged two by two
+    # inside the pool, the last merge also computing the labels, so the calling process only receives the result.
+    # The number of shards is given by component_shards().
+    num_nodes = len(offsets) - 1
+    shards = component_shards(offsets, workers, symmetric)
+    if shards == 1:
+        union_find = UnionFind(num_nodes)
+        _union_edges(union_find, offsets, memoryview(targets), 0, num_nodes, symmetric)
+        return array('q', union_find.labels())
+    cuts = [bisect_left(offsets, offsets[-1] * k // shards, 0, num_nodes) for k in range(shards)] + [num_nodes]
+    with _worker_pool(offsets, targets, shards) as pool:
+        forests = list(pool.map(_forest_job, cuts[:-1], cuts[1:], repeat(symmetric)))
+        while len(forests) > 2:  # One round of pairwise merges halves the number of forests
+            merged = list(pool.map(_merge_job, forests[0:-1:2], forests[1::2]))
+            forests = merged + forests[-1:] if len(forests) % 2 else merged
+        return pool.submit(_labels_job, forests).result()
+
+
+def component_shards(offsets, workers=None, symmetric=False):
+    # Time Complexity: O(1)
+    # Returns the number of shards component_labels() splits the edges into: one per worker, but no more than
+    # keep SHARD_EDGES_PER_NODE * V edges per shard. A sparser shard gives a spanning forest almost as large as
+    # its edges, so merging the forests (O(V) per round) would cost more than splitting the edges saves:
+    # e.g. a graph of average degree 8 is labeled fastest in a single process.
+    num_nodes = len(offsets) - 1
+    num_edges = offsets[-1] // 2 if symmetric else offsets[-1]
+    workers = workers or os.cpu_count() or 1
+    return max(1, min(workers, num_edges // max(SHARD_EDGES_PER_NODE * num_nodes, 1)))
+
+
+def spanning_forest(offsets, targets, start, end, symmetric=False):
+    # Time Complexity: O(V + E α(V)) for the edges leaving the nodes start..end-1
+    # Returns the edges leaving nodes start..end-1 that join two different trees of a UnionFind over all nodes,
+    # flattened into an array as u, v, u, v, ...
+    return _union_edges(UnionFind(len(offsets) - 1), offsets, targets, start, end, symmetric)
+
+
+def merge_forests(num_nodes, forests):
+    # Time Complexity: O(V + F α(V)) for F forest edges in total
+    # Returns a spanning forest of the union of 'forests' (flattened edge arrays, as from spanning_forest())
+    return _union_forests(UnionFind(num_nodes), forests)
+
+
+def _union_forests(union_find, forests):
+    # Helper function uniting the ends of the edges of 'forests'; returns the edges that merged two sets, flattened
+    merged = array('q')
+    for forest in forests:
+        pairs = iter(forest)
+        for u, v in zip(pairs, pairs):
+            if union_find.union(u, v):
+                merged.append(u)
+                merged.append(v)
+    return merged
+
+
+def _union_edges(union_find, offsets, targets, start, end, symmetric):
+    # Helper function uniting the ends of the edges leaving nodes start..end-1 (for a symmetric graph, only the
+    # copy of every edge going to the larger node); returns the edges that merged two sets, flattened
+    forest = array('q')
+    for node in range(start, end):
+        for neighbor in targets[offsets[node]:offsets[node + 1]]:
+            if (not symmetric or node < neighbor) and union_find.union(node, neighbor):
+                forest.append(node)
+                forest.append(neighbor)
+    return forest
+
+
+@contextmanager
+def _worker_pool(offsets, targets, workers):
+    # Helper context manager: a process pool whose workers see the CSR arrays through a shared memory block,
+    # which is removed once the pool has shut down
+    offsets_bytes = memoryview(offsets).cast('B')
+    targets_bytes = memoryview(targets).cast('B')
+    targets_start = -(-offsets_bytes.nbytes // ALIGNMENT) * ALIGNMENT
+    block = shared_memory.SharedMemory(create=True, size=targets_start + targets_bytes.nbytes)
+    try:
+        block.buf[:offsets_bytes.nbytes] = offsets_bytes
+        block.buf[targets_start:targets_start + targets_bytes.nbytes] = targets_bytes
+        layout = ((0, offsets_bytes.nbytes, offsets.typecode), (targets_start, targets_bytes.nbytes, targets.typecode))
+        with ProcessPoolExecutor(workers, initializer=_attach, initargs=(block.name, layout)) as pool:
+            yield pool
+    finally:
+        block.close()
+        block.unlink()
+
+
+def _attach(name, layout):
+    # Helper function run when a worker process starts: attaches to the shared memory block and views the arrays
+    global _shared, _offsets, _targets
+    _shared = shared_memory.SharedMemory(name=name)
+    _offsets, _targets = (_shared.buf[start:start + size].cast(typecode) for start, size, typecode in layout)
+
+
+def _bfs_job(sources, max_depth):
+    # Helper function run by a worker: bfs_levels() for a list of sources
+    return [bfs_levels(_offsets, _targets, source, max_depth) for source in sources]
+
+
+def _forest_job(start, end, symmetric):
+    # Helper function run by a worker: spanning_forest() of a range of nodes
+    return spanning_forest(_offsets, _targets, start, end, symmetric)
+
+
+def _merge_job(first, second):
+    # Helper function run by a worker: merge_forests() of two forests
+    return merge_forests(len(_offsets) - 1, (first, second))
+
+
+def _labels_job(forests):
+    # Helper function run by a worker: the component labels given by the union of the last forests
+    union_find = UnionFind(len(_offsets) - 1)
+    _union_forests(union_find, forests)
+    return array('q', union_find.labels())
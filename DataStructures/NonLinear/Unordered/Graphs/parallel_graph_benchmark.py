@@ -0,0 +1,65 @@
+import os
+import random
+import sys
+import time
+
+from DataStructures.NonLinear.Unordered.Graphs.graphs_undirected import UndirectedGraph
+from DataStructures.NonLinear.Unordered.Graphs.parallel_graph import component_shards
+
+# Throughput of FrozenGraph.multi_source_bfs() (BFS sources per second) and time of connected_components()
+# for an increasing number of worker processes, on random UndirectedGraphs with NUM_NODES nodes and
+# AVERAGE_DEGREE (BFS) or COMPONENTS_DEGREE (components) neighbors per node on average.
+# The row 'one by one' is the previous way: iter_bfs() on the mutable graph for every source.
+# With workers > 1 the CSR arrays are shared with the pool through shared memory, so the time includes starting
+# the workers; the speed-up is bounded by the number of CPUs (printed first).
+# connected_components() only splits the edges into as many shards as component_shards() allows (printed),
+# so the components use the denser graph: at AVERAGE_DEGREE a single process is faster.
+# Run from the repository root:
+#   python -m DataStructures.NonLinear.Unordered.Graphs.parallel_graph_benchmark [num_nodes]
+
+NUM_NODES = 200_000
+AVERAGE_DEGREE = 8
+COMPONENTS_DEGREE = 32
+NUM_SOURCES = 64
+WORKERS = (1, 2, 4, 8)
+SEED = 7
+
+
+def timed(operation):
+    start = time.perf_counter()
+    operation()
+    return time.perf_counter() - start
+
+
+def random_graph(num_nodes, degree, rng):
+    graph = UndirectedGraph()
+    for _ in range(num_nodes * degree // 2):
+        graph.add_edge(rng.randrange(num_nodes), rng.randrange(num_nodes))
+    return graph
+
+
+def run(num_nodes=NUM_NODES):
+    rng = random.Random(SEED)
+    graph = random_graph(num_nodes, AVERAGE_DEGREE, rng)
+    frozen = graph.freeze()
+    sources = rng.sample(list(frozen), NUM_SOURCES)
+
+    print(f"{os.cpu_count()} CPUs; {frozen.num_nodes:,} nodes, {frozen.num_edges // 2:,} edges, {NUM_SOURCES} sources")
+    print(f"{'workers':<12}{'BFS sources/s':>16}")
+    seconds = timed(lambda: [sum(1 for _ in graph.iter_bfs(source)) for source in sources])
+    print(f"{'one by one':<12}{NUM_SOURCES / seconds:>16,.1f}")
+    for workers in WORKERS:
+        seconds = timed(lambda: frozen.multi_source_bfs(sources, workers=workers))
+        print(f"{workers:<12}{NUM_SOURCES / seconds:>16,.1f}")
+
+    dense = random_graph(num_nodes, COMPONENTS_DEGREE, rng).freeze()
+    print(f"\n{dense.num_nodes:,} nodes, {dense.num_edges // 2:,} edges")
+    print(f"{'workers':<12}{'shards':>8}{'components (s)':>16}")
+    for workers in WORKERS:
+        shards = component_shards(dense.offsets, workers, symmetric=True)
+        seconds = timed(lambda: dense.connected_components(workers=workers))
+        print(f"{workers:<12}{shards:>8}{seconds:>16.2f}")
+
+
+if __name__ == '__main__':
+    run(int(sys.argv[1]) if len(sys.argv) > 1 else NUM_NODES)
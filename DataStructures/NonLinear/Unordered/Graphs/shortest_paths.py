@@ -0,0 +1,273 @@
+import math
+from collections import OrderedDict
+from itertools import count
+from operator import sub
+
+from DataStructures.NonLinear.Hierarchical.Heap.heap import Heap
+from DataStructures.NonLinear.Hierarchical.Heap.indexed_heap import IndexedHeap
+
+# Shortest paths on weighted graphs: DirectedGraph, UndirectedGraph or FrozenGraph (anything with get_edges(u)
+# returning (neighbor, weight) pairs). All edge weights must be non-negative.
+#
+# dijkstra() settles the nodes in order of distance from the source with a min Heap. By default it is the "lazy"
+# version: an improved distance is pushed as a new entry and outdated entries are skipped when they come out,
+# which keeps the heap on the heapq fast path. decrease_key=True uses an IndexedHeap instead and updates the
+# entry of a node in place (update_priority), so the heap never holds more than one entry per node.
+# astar() and bidirectional_dijkstra() answer a single source -> target query while settling fewer nodes.
+# ShortestPaths keeps the single-source results of the most recently used sources in an LRU cache.
+#
+# Heap entries carry a running counter after the distance, so nodes themselves are never compared.
+
+METHODS = ('dijkstra', 'astar', 'bidirectional')  # Query methods of ShortestPaths.shortest_path()
+
+
+def dijkstra(graph, source, target=None, decrease_key=False):
+    # Time Complexity: O((V + E) log V)
+    # Computes the distances from 'source' to every reachable node (stopping once 'target' is settled, if given)
+    # Returns (distances, parents): dictionaries of the settled nodes, parents[source] being None
+    if decrease_key:
+        return _dijkstra_decrease_key(graph, source, target)
+    distances, parents = {}, {}
+    tentative = {source: 0}  # Best distance found so far for the nodes that are not settled yet
+    heap = Heap(is_max=False)
+    push, pop = heap.insert, heap.remove
+    tiebreak = count()
+    push((0, next(tiebreak), source, None))
+    while heap.heap:
+        distance, _, node, parent = pop()
+        if node in distances:
+            continue  # Outdated entry: the node was settled through a shorter path
+        distances[node] = distance
+        parents[node] = parent
+        if node == target:
+            break
+        for neighbor, weight in graph.get_edges(node):
+            if weight < 0:
+                raise ValueError("Edge weights must be non-negative")
+            new_distance = distance + weight
+            if neighbor not in distances and new_distance < tentative.get(neighbor, math.inf):
+                tentative[neighbor] = new_distance
+                push((new_distance, next(tiebreak), neighbor, node))
+    return distances, parents
+
+
+def _dijkstra_decrease_key(graph, source, target):
+    # Helper function: dijkstra() on an IndexedHeap, whose entry for a node is updated when its distance improves
+    distances, parents = {}, {}
+    via = {source: None}  # Parent of every node in the heap along its best known path
+    heap = IndexedHeap(is_max=False)
+    heap.insert(source, 0)
+    while heap.heap:
+        node, distance = heap.remove()
+        distances[node] = distance
+        parents[node] = via.pop(node)
+        if node == target:
+            break
+        for neighbor, weight in graph.get_edges(node):
+            if weight < 0:
+                raise ValueError("Edge weights must be non-negative")
+            if neighbor in distances:
+                continue
+            new_distance = distance + weight
+            if neighbor not in heap:
+                heap.insert(neighbor, new_distance)
+            elif new_distance < heap.get_priority(neighbor):
+                heap.update_priority(neighbor, new_distance)  # Decrease-key: the entry moves up in place
+            else:
+                continue
+            via[neighbor] = node
+    return distances, parents
+
+
+def reconstruct_path(parents, target):
+    # Time Complexity: O(L) where L is the number of nodes on the path
+    # Returns the path from the source to 'target' given the parents from dijkstra(), or [] if it was not reached
+    if target not in parents:
+        return []
+    path = []
+    node = target
+    while node is not None:
+        path.append(node)
+        node = parents[node]
+    path.reverse()
+    return path
+
+
+def astar(graph, source, target, heuristic):
+    # Time Complexity: O((V + E) log V) in the worst case; a good heuristic settles far fewer nodes
+    # Finds a shortest path from 'source' to 'target', exploring nodes in order of distance + heuristic(node, target).
+    # The heuristic must never overestimate the remaining distance (admissible); if it is not also consistent,
+    # nodes are reopened when a shorter path to them is found, so the result is still a shortest path.
+    # Returns (distance, path), or (math.inf, []) if 'target' cannot be reached
+    distances = {source: 0}  # Best distance found so far from the source
+    parents = {source: None}
+    heap = Heap(is_max=False)
+    push, pop = heap.insert, heap.remove
+    tiebreak = count()
+    # Entries are (estimate, -distance, counter, node): among equal estimates the node furthest along goes first
+    push((heuristic(source, target), 0, next(tiebreak), source))
+    while heap.heap:
+        _, distance, _, node = pop()
+        distance = -distance
+        if distance > distances[node]:
+            continue  # Outdated entry
+        if node == target:
+            return distance, reconstruct_path(parents, target)
+        for neighbor, weight in graph.get_edges(node):
+            if weight < 0:
+                raise ValueError("Edge weights must be non-negative")
+            new_distance = distance + weight
+            if new_distance < distances.get(neighbor, math.inf):
+                distances[neighbor] = new_distance
+                parents[neighbor] = node
+                push((new_distance + heuristic(neighbor, target), -new_distance, next(tiebreak), neighbor))
+    return math.inf, []
+
+
+def manhattan(position, scale=1):
+    # Returns an A* heuristic: the Manhattan (grid) distance between the positions of two nodes, times 'scale'.
+    # 'position' is a dictionary or a function giving the coordinates of a node. It is admissible when moving
+    # one unit along an axis never costs less than 'scale' (e.g. scale = smallest weight per unit of length).
+    locate = position if callable(position) else position.__getitem__
+
+    def heuristic(node, target):
+        return scale * sum(map(abs, map(sub, locate(node), locate(target))))
+    return heuristic
+
+
+def euclidean(position, scale=1):
+    # Returns an A* heuristic: the straight-line distance between the positions of two nodes, times 'scale'.
+    # Admissible whenever an edge never costs less than 'scale' times the straight-line length it covers.
+    locate = position if callable(position) else position.__getitem__
+
+    def heuristic(node, target):
+        return scale * math.dist(locate(node), locate(target))
+    return heuristic
+
+
+def reverse_edges(graph):
+    # Time Complexity: O(V + E)
+    # Returns a dictionary mapping every node to the (predecessor, weight) pairs of its incoming edges
+    reverse = {node: [] for node in graph}
+    for node in graph:
+        for neighbor, weight in graph.get_edges(node):
+            reverse[neighbor].append((node, weight))
+    return reverse
+
+
+def bidirectional_dijkstra(graph, source, target, reverse=None):
+    # Time Complexity: O((V + E) log V) in the worst case; on road-like graphs each search covers about
+    # a circle of half the radius, so roughly half as many nodes are settled as with dijkstra()
+    # Runs Dijkstra forward from 'source' and backward from 'target' (on 'reverse', the incoming edges, which are
+    # computed with reverse_edges() for a directed graph if not given), expanding the smaller frontier each step.
+    # Every edge reaching a node seen by the other search gives a candidate path; the search stops once the two
+    # smallest frontier distances add up to at least the best candidate, which is then a shortest path.
+    # Returns (distance, path), or (math.inf, []) if 'target' cannot be reached
+    if source == target:
+        return 0, [source]
+    if not graph.directed:
+        backward = graph.get_edges  # Every edge can be followed both ways
+    else:
+        if reverse is None:
+            reverse = reverse_edges(graph)
+        backward = lambda node: reverse.get(node, ())
+    edges = (graph.get_edges, backward)
+    distances = ({source: 0}, {target: 0})
+    parents = ({source: None}, {target: None})
+    settled = (set(), set())
+    heaps = (Heap(is_max=False), Heap(is_max=False))
+    tiebreak = count()
+    heaps[0].insert((0, next(tiebreak), source))
+    heaps[1].insert((0, next(tiebreak), target))
+    best, meeting = math.inf, None
+    while heaps[0].heap and heaps[1].heap:
+        if heaps[0].heap[0][0] + heaps[1].heap[0][0] >= best:
+            break  # No path through the unsettled nodes can be shorter than the best one found
+        side = 0 if len(heaps[0]) <= len(heaps[1]) else 1
+        distance, _, node = heaps[side].remove()
+        if node in settled[side]:
+            continue  # Outdated entry
+        settled[side].add(node)
+        ours, theirs = distances[side], distances[1 - side]
+        for neighbor, weight in edges[side](node):
+            if weight < 0:
+                raise ValueError("Edge weights must be non-negative")
+            new_distance = distance + weight
+            if new_distance < ours.get(neighbor, math.inf):
+                ours[neighbor] = new_distance
+                parents[side][neighbor] = node
+                heaps[side].insert((new_distance, next(tiebreak), neighbor))
+                if neighbor in theirs and new_distance + theirs[neighbor] < best:
+                    best, meeting = new_distance + theirs[neighbor], neighbor
+    if meeting is None:
+        return math.inf, []
+    path = reconstruct_path(parents[0], meeting)
+    node = parents[1][meeting]
+    while node is not None:  # The backward parents lead from the meeting node to the target
+        path.append(node)
+        node = parents[1][node]
+    return best, path
+
+
+class ShortestPaths:
+    # Shortest-path queries on one graph, with the single-source results (distances and parents) of the
+    # 'cache_size' most recently used sources kept in an LRU cache: repeated queries from a hot source are
+    # answered from its shortest-path tree instead of running a new search.
+    # The cache is not invalidated automatically: call clear_cache() after changing the graph.
+
+    def __init__(self, graph, cache_size=128, decrease_key=False):
+        if cache_size < 0:
+            raise ValueError("cache_size must be non-negative")
+        self.graph = graph
+        self.cache_size = cache_size
+        self.decrease_key = decrease_key  # Passed on to dijkstra()
+        self.cache = OrderedDict()  # source -> (distances, parents), least recently used first
+        self.hits = 0
+        self.misses = 0
+        self._reverse = None  # Incoming edges of a directed graph, built on the first bidirectional query
+
+    def single_source(self, source):
+        # Time Complexity: O(1) if 'source' is cached, else O((V + E) log V)
+        # Returns (distances, parents) from 'source' to every reachable node, as dijkstra()
+        # (the dictionaries are shared with the cache and must not be modified)
+        result = self.cache.get(source)
+        if result is not None:
+            self.hits += 1
+            self.cache.move_to_end(source)  # Now the most recently used
+            return result
+        self.misses += 1
+        result = dijkstra(self.graph, source, decrease_key=self.decrease_key)
+        if self.cache_size:
+            self.cache[source] = result
+            if len(self.cache) > self.cache_size:
+                self.cache.popitem(last=False)  # Evict the least recently used source
+        return result
+
+    def distance(self, source, target):
+        # Time Complexity: as single_source()
+        # Returns the distance from 'source' to 'target' (math.inf if it cannot be reached)
+        return self.single_source(source)[0].get(target, math.inf)
+
+    def shortest_path(self, source, target, method='dijkstra', heuristic=None):
+        # Time Complexity: O(L) if 'source' is cached, else that of the chosen method
+        # Returns (distance, path) from 'source' to 'target', or (math.inf, []) if it cannot be reached.
+        # method='dijkstra' computes (and caches) the whole shortest-path tree of 'source';
+        # 'astar' (which needs a heuristic) and 'bidirectional' answer only this query and cache nothing.
+        if method not in METHODS:
+            raise ValueError(f"method must be one of {METHODS}")
+        if method == 'astar' and heuristic is None:
+            raise ValueError("method='astar' requires a heuristic")
+        if source in self.cache or method == 'dijkstra':
+            distances, parents = self.single_source(source)
+            return distances.get(target, math.inf), reconstruct_path(parents, target)
+        if method == 'astar':
+            return astar(self.graph, source, target, heuristic)
+        if self.graph.directed and self._reverse is None:
+            self._reverse = reverse_edges(self.graph)
+        return bidirectional_dijkstra(self.graph, source, target, reverse=self._reverse)
+
+    def clear_cache(self):
+        # Time Complexity: O(1)
+        # Forgets all cached results (and the reversed edges), e.g. after the graph has changed
+        self.cache.clear()
+        self._reverse = None
@@ -0,0 +1,89 @@
+import random
+import sys
+import time
+
+from DataStructures.NonLinear.Unordered.Graphs.graphs_undirected import UndirectedGraph
+from DataStructures.NonLinear.Unordered.Graphs.shortest_paths import (
+    ShortestPaths, astar, bidirectional_dijkstra, dijkstra, manhattan, reconstruct_path)
+
+# Shortest-path queries on a synthetic road network: a SIDE x SIDE grid (1M nodes by default) where every node
+# is joined to its 4 neighbors by two-way roads. Ordinary roads cost a random SLOW_WEIGHTS travel time per block;
+# every HIGHWAY_SPACING-th row and column is a highway costing FAST_WEIGHTS, so shortest paths leave the local
+# streets for the highway grid, as on real road maps. The graph is built as an UndirectedGraph and frozen
+# (FrozenGraph, CSR arrays with a weight array) before the queries.
+# NUM_QUERIES random source -> target pairs are answered by every method; the distances are checked to agree.
+# A* uses the Manhattan distance times the smallest weight, which never overestimates the travel time.
+# The cached mode answers NUM_HOT_QUERIES queries from HOT_SOURCES sources through ShortestPaths: the first query
+# from a source computes its whole shortest-path tree, the others only walk back a path in it.
+# Run from the repository root:
+#   python -m DataStructures.NonLinear.Unordered.Graphs.shortest_paths_benchmark [side]
+
+SIDE = 1_000
+HIGHWAY_SPACING = 50
+SLOW_WEIGHTS = (4, 12)
+FAST_WEIGHTS = (1, 2)
+NUM_QUERIES = 5
+HOT_SOURCES = 3
+NUM_HOT_QUERIES = 3_000
+SEED = 7
+
+
+def road_grid(side, rng):
+    graph = UndirectedGraph()
+    for row in range(side):
+        for column in range(side):
+            node = row * side + column
+            if column + 1 < side:  # Road to the east, a highway if it runs along a highway row
+                weights = FAST_WEIGHTS if row % HIGHWAY_SPACING == 0 else SLOW_WEIGHTS
+                graph.add_edge(node, node + 1, rng.randint(*weights))
+            if row + 1 < side:  # Road to the south, a highway if it runs along a highway column
+                weights = FAST_WEIGHTS if column % HIGHWAY_SPACING == 0 else SLOW_WEIGHTS
+                graph.add_edge(node, node + side, rng.randint(*weights))
+    return graph.freeze()
+
+
+def timed(query):
+    start = time.perf_counter()
+    result = query()
+    return result, time.perf_counter() - start
+
+
+def run(side=SIDE):
+    rng = random.Random(SEED)
+    graph, build_time = timed(lambda: road_grid(side, rng))
+    print(f"{graph.num_nodes:,} nodes, {graph.num_edges // 2:,} roads, built and frozen in {build_time:.1f} s")
+
+    heuristic = manhattan(lambda node: divmod(node, side), scale=min(FAST_WEIGHTS))
+    methods = {
+        'dijkstra (Heap)': lambda s, t: dijkstra(graph, s, t),
+        'dijkstra (decrease-key)': lambda s, t: dijkstra(graph, s, t, decrease_key=True),
+        'bidirectional dijkstra': lambda s, t: bidirectional_dijkstra(graph, s, t),
+        'A* (manhattan)': lambda s, t: astar(graph, s, t, heuristic),
+    }
+    pairs = [(rng.randrange(graph.num_nodes), rng.randrange(graph.num_nodes)) for _ in range(NUM_QUERIES)]
+    print(f"{'method':<26}{'ms/query':>12}")
+    expected = None
+    for name, method in methods.items():
+        distances, total = [], 0
+        for source, target in pairs:
+            result, seconds = timed(lambda: method(source, target))
+            if name.startswith('dijkstra'):
+                result = result[0][target], reconstruct_path(result[1], target)
+            distances.append(result[0])
+            total += seconds
+        if expected is None:
+            expected = distances
+        elif distances != expected:
+            raise AssertionError(f"{name} disagrees: {distances} != {expected}")
+        print(f"{name:<26}{1000 * total / len(pairs):>12.1f}")
+
+    cache = ShortestPaths(graph, cache_size=HOT_SOURCES)
+    hot = [rng.randrange(graph.num_nodes) for _ in range(HOT_SOURCES)]
+    queries = [(rng.choice(hot), rng.randrange(graph.num_nodes)) for _ in range(NUM_HOT_QUERIES)]
+    _, seconds = timed(lambda: [cache.shortest_path(source, target) for source, target in queries])
+    print(f"{'cached (hot sources)':<26}{1000 * seconds / len(queries):>12.1f}"
+          f"   ({cache.misses} misses, {cache.hits} hits)")
+
+
+if __name__ == '__main__':
+    run(int(sys.argv[1]) if len(sys.argv) > 1 else SIDE)
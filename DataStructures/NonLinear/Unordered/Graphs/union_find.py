@@ -0,0 +1,50 @@
+class UnionFind:
+    # Disjoint-set forest over the elements 0..n-1, used to label the connected components of a graph.
+    # Every set is a tree given by 'parent' (a root is its own parent); union by size keeps the trees shallow and
+    # find() halves the path it walks, so any sequence of operations runs in nearly constant time per operation.
+
+    def __init__(self, n):
+        # Time Complexity: O(n)
+        # Creates n singleton sets
+        self.parent = list(range(n))
+        self.size = [1] * n  # Number of elements in the set of each root
+        self.num_sets = n
+
+    def __len__(self):
+        # Time Complexity: O(1)
+        # Returns the number of elements
+        return len(self.parent)
+
+    def find(self, x):
+        # Time Complexity: O(α(n)) amortized, where α is the inverse Ackermann function
+        # Returns the root of the set containing x, making every other node on the way point to its grandparent
+        parent = self.parent
+        while parent[x] != x:
+            parent[x] = parent[parent[x]]  # Path halving
+            x = parent[x]
+        return x
+
+    def union(self, x, y):
+        # Time Complexity: O(α(n)) amortized
+        # Merges the sets containing x and y; returns True if they were different sets
+        x, y = self.find(x), self.find(y)
+        if x == y:
+            return False
+        if self.size[x] < self.size[y]:
+            x, y = y, x
+        self.parent[y] = x  # The smaller tree goes under the root of the larger one
+        self.size[x] += self.size[y]
+        self.num_sets -= 1
+        return True
+
+    def connected(self, x, y):
+        # Time Complexity: O(α(n)) amortized
+        # Checks if x and y are in the same set
+        return self.find(x) == self.find(y)
+
+    def labels(self):
+        # Time Complexity: O(n α(n))
+        # Returns a list giving every element the number of its set, the sets being numbered 0, 1, ...
+        # in the order of their smallest element
+        numbers = {}
+        return [numbers.setdefault(self.find(x), len(numbers)) for x in range(len(self.parent))]
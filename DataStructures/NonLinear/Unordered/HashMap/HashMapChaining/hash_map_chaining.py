@@ -1,18 +1,21 @@
+from DataStructures.NonLinear.Unordered.HashMap.hashing import default_hash, index_for
+
+
 class HashMapChaining:
-    def __init__(self):
-        self.MAX = 10  # Set the size of the hash table
+    def __init__(self, capacity=10, hash_function=None, trace=None):
+        self.MAX = capacity  # Set the size of the hash table
+        # Function turning a key into an integer (Python's built-in hash() unless another one is plugged in)
+        self.hash_function = hash_function or default_hash
         # Initialize each index of the hash table as an empty list (to store chains)
         self.arr = [[] for _ in range(self.MAX)]
+        # Optional callback trace(operation, *details) called on every set/delete (None = silent)
+        self.trace = trace
 
         # Function to compute the hash value of a key
 
     def get_hash(self, key):
-        hash = 0  # Initialize hash value
-        # Sum the ASCII values of each character in the key
-        for char in key:
-            hash += ord(char)
-            # Return the hash value mod the size of the hash table (self.MAX)
-        return hash % self.MAX
+        # Hash the key (any hashable type), then reduce the hash value to an index in the hash table
+        return index_for(self.hash_function(key), self.MAX)
 
         # Function to retrieve a value by key (Time Complexity: O(n) in worst case, O(1) in best case)
 
@@ -31,10 +34,13 @@ class HashMapChaining:
         for idx, element in enumerate(self.arr[h]):
             if element[0] == key:  # If key exists, update the value
                 self.arr[h][idx] = (key, val)
+                if self.trace is not None:
+                    self.trace('set', key, val)
                 return
         # If key does not exist, append the new key-value pair to the chain at index 'h'
         self.arr[h].append((key, val))
-        print(self.arr)  # Optional: Print the hash table for debugging
+        if self.trace is not None:
+            self.trace('set', key, val)
 
     # Function to delete a key-value pair by key (Time Complexity: O(n) in worst case, O(1) in best case)
     def __delitem__(self, key):
@@ -43,5 +49,6 @@ class HashMapChaining:
         for idx, element in enumerate(self.arr[h]):
             if element[0] == key:  # If key is found, delete the key-value pair from the list
                 del self.arr[h][idx]
-                return
-        print(self.arr)  # Optional: Print the hash table for debugging
\ No newline at end of file
+                if self.trace is not None:
+                    self.trace('delete', key)
+                return
\ No newline at end of file
@@ -1,77 +1,149 @@
+from DataStructures.NonLinear.Unordered.HashMap.hashing import default_hash, index_for
+
+# Marker left behind in a slot whose key was deleted.
+# A plain None would cut the probe chain of every key that was placed after it,
+# so deleted slots are marked as "tombstones": lookups skip over them, inserts may reuse them.
+_TOMBSTONE = object()
+
+
 class HashMapLinearProbing:
-    def __init__(self):
-        self.MAX = 10  # Set the size of the hash table (low to demonstrate linear probing)
+    def __init__(self, capacity=8, max_load_factor=0.6, hash_function=None, trace=None):
+        if not 0 < max_load_factor < 1:
+            raise ValueError("max_load_factor must be between 0 and 1")
+        self.max_load_factor = max_load_factor  # Grow the table once this fraction of the slots is used
+        # Function turning a key into an integer (Python's built-in hash() unless another one is plugged in)
+        self.hash_function = hash_function or default_hash
+        self.MAX = self._capacity_for(capacity)  # Size of the hash table (always a power of two)
         # Initialize the array with None values (each index will hold a key-value pair)
-        self.arr = [None for _ in range(self.MAX)]
+        self.arr = [None] * self.MAX
+        self.size = 0  # Number of live key-value pairs
+        self.used = 0  # Number of occupied slots (live pairs + tombstones)
+        # Optional callback trace(operation, *details) called on every set/delete/resize (None = silent)
+        self.trace = trace
+
+    # Function to build a hash map from key-value pairs, sizing the table once up front (Time Complexity: O(n))
+    @classmethod
+    def from_items(cls, items, max_load_factor=0.6, hash_function=None):
+        hash_map = cls(max_load_factor=max_load_factor, hash_function=hash_function)
+        hash_map.update(items)
+        return hash_map
 
     # Function to compute the hash value of a key
     def get_hash(self, key):
-        hash = 0  # Initialize the hash value
-        # Loop through each character in the key and compute ASCII sum
-        for char in key:
-            hash += ord(char)
-            # Return the hash value mod the size of the hash table
-        return hash % self.MAX
-
-        # Function to retrieve a value by key (Time Complexity: O(n) in worst case, O(1) in best case)
+        # Hash the key (any hashable type), then reduce the hash value to an index in the hash table
+        return index_for(self.hash_function(key), self.MAX)
 
+    # Function to retrieve a value by key (Time Complexity: O(1) on average, O(n) in worst case)
     def __getitem__(self, key):
-        h = self.get_hash(key)  # Get the hash index for the key
-        # If no element exists at the hash index, return None (key not found)
-        if self.arr[h] is None:
-            return
-        # Get the range of probe indices for linear probing
-        prob_range = self.get_prob_range(h)
-        # Traverse the probing range to find the key
-        for prob_index in prob_range:
-            element = self.arr[prob_index]
-            if element is None:  # If an empty slot is found, return None (key not found)
-                return
-            if element[0] == key:  # If the key matches, return the associated value
-                return element[1]
-
-    # Function to insert or update a key-value pair (Time Complexity: O(n) in worst case, O(1) in best case)
+        index = self._lookup(key)  # Find the slot holding the key
+        if index is None:
+            return None  # Key not found
+        return self.arr[index][1]  # Return the associated value
+
+    # Function to insert or update a key-value pair (Time Complexity: O(1) amortized, O(n) in worst case)
     def __setitem__(self, key, val):
-        h = self.get_hash(key)  # Get the hash index for the key
-        # If no collision, insert key-value pair at hash index
-        if self.arr[h] is None:
-            self.arr[h] = (key, val)
-        else:
-            # If a collision occurs, find the next available slot using linear probing
-            new_h = self.find_slot(key, h)
-            # Insert the key-value pair at the new hash index
-            self.arr[new_h] = (key, val)
-        print(self.arr)  # Optional: Print the current state of the hash table
-
-    # Function to get the probing range for linear probing
-    def get_prob_range(self, index):
-        # Return a range of indices starting from 'index' to the end, then wrap around to the start
-        return [*range(index, len(self.arr))] + [*range(0, index)]
-
-    # Function to find the next available slot using linear probing (Time Complexity: O(n))
-    def find_slot(self, key, index):
-        prob_range = self.get_prob_range(index)  # Get the probing range starting from the hash index
-        # Traverse the probing range to find an empty slot or an existing key
-        for prob_index in prob_range:
-            # If an empty slot is found, return that index
-            if self.arr[prob_index] is None:
-                return prob_index
-            # If the key already exists, return its index (to update the value)
-            if self.arr[prob_index][0] == key:
-                return prob_index
-        # If no empty slot is found, raise an exception (hash table is full)
-        raise Exception("Hashmap full")
-
-    # Function to delete a key-value pair (Time Complexity: O(n) in worst case, O(1) in best case)
+        # Grow (or clean up) the table before the new pair pushes it past the load factor
+        if self.used + 1 > self.MAX * self.max_load_factor:
+            self._resize(self._capacity_for(2 * (self.size + 1)))
+        self._insert(key, val)
+        if self.trace is not None:
+            self.trace('set', key, val)
+
+    # Function to delete a key-value pair (Time Complexity: O(1) on average, O(n) in worst case)
     def __delitem__(self, key):
-        h = self.get_hash(key)  # Get the hash index for the key
-        prob_range = self.get_prob_range(h)  # Get the probing range starting from the hash index
-        # Traverse the probing range to find the key and delete it
-        for prob_index in prob_range:
-            # If an empty slot is found, stop searching (key not found)
-            if self.arr[prob_index] is None:
-                return  # Key not found, return without error (could throw exception if desired)
-            # If the key matches, set the slot to None (delete key-value pair)
-            if self.arr[prob_index][0] == key:
-                self.arr[prob_index] = None
-        print(self.arr)  # Optional: Print the current state of the hash table
\ No newline at end of file
+        index = self._lookup(key)  # Find the slot holding the key
+        if index is None:
+            return  # Key not found, return without error (could throw exception if desired)
+        # Leave a tombstone instead of None so the probe chains running through this slot stay intact
+        self.arr[index] = _TOMBSTONE
+        self.size -= 1
+        if self.trace is not None:
+            self.trace('delete', key)
+
+    # Time Complexity: O(1)
+    def __len__(self):
+        return self.size
+
+    # Time Complexity: O(1) on average
+    def __contains__(self, key):
+        return self._lookup(key) is not None
+
+    # Function to insert many key-value pairs at once (Time Complexity: O(n))
+    # Accepts a mapping or an iterable of (key, value) pairs. The table is resized at most once,
+    # before any pair is inserted, so loading a large data set does not trigger a cascade of resizes.
+    def update(self, items):
+        if hasattr(items, 'items'):
+            items = items.items()
+        if not hasattr(items, '__len__'):
+            items = list(items)  # Materialize generators so we know how many pairs are coming
+        # len(items) is an upper bound: some keys may already be present or repeated
+        needed = self.size + len(items)
+        if self.used + len(items) > self.MAX * self.max_load_factor:
+            self._resize(self._capacity_for(needed))
+        for key, val in items:
+            self._insert(key, val)
+        if self.trace is not None:
+            self.trace('update', len(items))
+
+    # Function to find the slot where 'key' lives, or where it should be inserted (Time Complexity: O(1) on average)
+    # Returns the slot of the existing key if present, otherwise the first tombstone seen along the probe chain
+    # (so deleted slots get reused), otherwise the empty slot that ended the chain.
+    def find_slot(self, key, index):
+        mask = self.MAX - 1
+        reusable = None  # First tombstone seen along the probe chain
+        while True:
+            element = self.arr[index]
+            if element is None:  # End of the probe chain: the key is not in the table
+                return index if reusable is None else reusable
+            if element is _TOMBSTONE:
+                if reusable is None:
+                    reusable = index
+            elif element[0] == key:  # The key already exists (update its value)
+                return index
+            index = (index + 1) & mask  # Move to the next slot, wrapping around to the start
+
+    # Helper function to find the slot holding 'key', or None if the key is absent (Time Complexity: O(1) on average)
+    def _lookup(self, key):
+        arr = self.arr
+        mask = self.MAX - 1
+        index = self.get_hash(key)
+        while True:
+            element = arr[index]
+            if element is None:  # An empty slot ends the probe chain (tombstones do not)
+                return None
+            if element is not _TOMBSTONE and element[0] == key:
+                return index
+            index = (index + 1) & mask
+
+    # Helper function to place a key-value pair, assuming the table has room for it (Time Complexity: O(1) on average)
+    def _insert(self, key, val):
+        index = self.find_slot(key, self.get_hash(key))
+        element = self.arr[index]
+        if element is None:
+            self.used += 1  # A fresh slot is taken
+            self.size += 1
+        elif element is _TOMBSTONE:
+            self.size += 1  # A tombstone is reused, 'used' does not change
+        self.arr[index] = (key, val)
+
+    # Helper function to rebuild the table with a new capacity (Time Complexity: O(n))
+    # Rehashing every live pair also drops all tombstones.
+    def _resize(self, capacity):
+        if self.trace is not None:
+            self.trace('resize', capacity)
+        old_arr = self.arr
+        self.MAX = capacity
+        self.arr = [None] * capacity
+        self.size = 0
+        self.used = 0
+        for element in old_arr:
+            if element is not None and element is not _TOMBSTONE:
+                self._insert(element[0], element[1])
+
+    # Helper function to get the smallest power-of-two capacity that holds 'count' pairs under the load factor
+    # Time Complexity: O(log n)
+    def _capacity_for(self, count):
+        capacity = 8
+        while count > capacity * self.max_load_factor:
+            capacity *= 2
+        return capacity
@@ -1,24 +1,28 @@
+from DataStructures.NonLinear.Unordered.HashMap.hashing import default_hash, index_for
+
+
 class BasicHashMap:
-    def __init__(self):
-        self.MAX = 10  # Set the size of the hash table
+    def __init__(self, capacity=10, hash_function=None, trace=None):
+        self.MAX = capacity  # Set the size of the hash table
+        # Function turning a key into an integer (Python's built-in hash() unless another one is plugged in)
+        self.hash_function = hash_function or default_hash
         # Initialize the array with None values (each index will hold a key-value pair)
         self.arr = [None for _ in range(self.MAX)]
+        # Optional callback trace(operation, *details) called on every set/delete (None = silent)
+        self.trace = trace
 
     # Function to compute the hash value of a key
     def get_hash(self, key):
-        hash = 0  # Initialize the hash value
-        # Loop through each character in the key and compute ASCII sum
-        for char in key:
-            hash += ord(char)
-        # Return the hash value mod the size of the hash table
-        return hash % self.MAX
+        # Hash the key (any hashable type), then reduce the hash value to an index in the hash table
+        return index_for(self.hash_function(key), self.MAX)
 
     # Function to insert or update a key-value pair (O(1))
     def __setitem__(self, key, val):
         h = self.get_hash(key)  # Get the hash index for the key
         # Insert or update the key-value pair at the computed hash index
         self.arr[h] = (key, val)
-        print(self.arr)  # Optional: Print the current state of the hash table
+        if self.trace is not None:
+            self.trace('set', key, val)
 
     # Function to retrieve a value by key (O(1))
     def __getitem__(self, key):
@@ -37,4 +41,5 @@ class BasicHashMap:
         # If the key exists, set the slot to None (delete key-value pair)
         if self.arr[h] is not None and self.arr[h][0] == key:
             self.arr[h] = None
-        print(self.arr)  # Optional: Print the current state of the hash table
+            if self.trace is not None:
+                self.trace('delete', key)
@@ -0,0 +1,63 @@
+from hashlib import blake2b
+
+# Hashing helpers shared by BasicHashMap, HashMapChaining and HashMapLinearProbing.
+#
+# A hash map needs two steps to place a key:
+#   1. A hash function turns the key into a (large) integer.
+#   2. That integer is reduced to a slot index in the table.
+# Every map takes an optional 'hash_function' for step 1 (Python's built-in hash() by default)
+# and uses index_for() for step 2.
+
+_MASK_64 = (1 << 64) - 1
+_GOLDEN_RATIO_64 = 0x9E3779B97F4A7C15  # 2^64 / phi, an odd constant with well-mixed bits
+
+
+# Time Complexity: O(1) for numbers, O(m) for a string/bytes of length m (then cached by Python for str)
+# Python's built-in hash() uses SipHash for str/bytes and works for any hashable key type.
+def default_hash(key):
+    return hash(key)
+
+
+# Time Complexity: O(m), where m is the length of the key
+# The original hash of this project: the sum of the character codes.
+# Kept for comparison only: every anagram ("listen", "silent") collides and it only accepts strings.
+def ascii_sum_hash(key):
+    hash = 0
+    for char in key:
+        hash += ord(char)
+    return hash
+
+
+# Builds a seeded hash function (keyed BLAKE2b, computed in C) for bytes keys.
+# Unlike hash(), whose str/bytes values change between runs (PYTHONHASHSEED), the result only depends on
+# the key and the seed, so it is stable across processes and hard to flood with collisions without the seed.
+# str keys are hashed as their UTF-8 bytes; any other key type falls back to the built-in hash().
+# Time Complexity: O(m), where m is the length of the key
+def make_seeded_hash(seed=0):
+    seed_bytes = seed.to_bytes(16, 'little')
+
+    def seeded_hash(key):
+        if isinstance(key, str):
+            key = key.encode('utf-8')
+        if isinstance(key, (bytes, bytearray, memoryview)):
+            return int.from_bytes(blake2b(key, digest_size=8, key=seed_bytes).digest(), 'little')
+        return hash(key)
+
+    return seeded_hash
+
+
+# Time Complexity: O(1)
+# Reduces a hash value to a slot index in a table of 'capacity' slots.
+# hash() of small integers is the integer itself, so a plain 'hash_value % capacity' would pile up keys that
+# share a stride with the table size (e.g. multiples of 1024 in a 1024-slot table).
+# Fibonacci hashing multiplies by 2^64/phi: bit j of the 64-bit product depends on input bits 0..j only,
+# so the top bits are the ones that depend on every bit of the input.
+# For a table of 2^k slots the index is the top k bits of the product. For any other size, the high half of the
+# hash is first folded into the low half, so that every input bit reaches the product bits 32..63 that are
+# then reduced modulo the capacity.
+def index_for(hash_value, capacity):
+    hash_value &= _MASK_64  # Negative hashes as their 64-bit two's complement
+    if capacity & (capacity - 1) == 0:
+        return ((hash_value * _GOLDEN_RATIO_64) & _MASK_64) >> (65 - capacity.bit_length())
+    hash_value ^= hash_value >> 32
+    return (((hash_value * _GOLDEN_RATIO_64) & _MASK_64) >> 32) % capacity
@@ -0,0 +1,86 @@
+import random
+import string
+import time
+from collections import Counter
+
+from DataStructures.NonLinear.Unordered.HashMap.HashMapChaining.hash_map_chaining import HashMapChaining
+from DataStructures.NonLinear.Unordered.HashMap.HashMapLinearProbing.hash_map_linear import HashMapLinearProbing
+from DataStructures.NonLinear.Unordered.HashMap.hashing import ascii_sum_hash, default_hash, make_seeded_hash
+
+# Collision-distribution benchmark for the hash functions in hashing.py.
+# For every key set and hash function it reports:
+#   - HashMapChaining: the average and longest chain (bucket) length
+#   - HashMapLinearProbing: the average and longest probe length (slots visited past the home slot)
+# Run from the repository root:  python -m DataStructures.NonLinear.Unordered.HashMap.hashing_benchmark
+
+NUM_KEYS = 50_000
+SEED = 42
+
+
+def make_words(count, rng):
+    # Random lowercase words of 4-10 characters
+    return list({''.join(rng.choices(string.ascii_lowercase, k=rng.randint(4, 10))) for _ in range(count)})
+
+
+def make_anagrams(count, rng):
+    # Groups of 20 anagrams of the same letters: the worst case for an ASCII-sum hash
+    words = set()
+    while len(words) < count:
+        letters = rng.choices(string.ascii_lowercase, k=8)
+        for _ in range(20):
+            rng.shuffle(letters)
+            words.add(''.join(letters))
+    return list(words)[:count]
+
+
+# Time Complexity: O(n)
+# Chain lengths of a chaining table are the number of keys that hash to each bucket
+def chain_stats(keys, hash_function):
+    hash_map = HashMapChaining(capacity=len(keys), hash_function=hash_function)
+    chains = Counter(hash_map.get_hash(key) for key in keys)
+    return sum(chains.values()) / len(chains), max(chains.values())
+
+
+# Time Complexity: O(n) on average
+def probe_stats(keys, hash_function):
+    hash_map = HashMapLinearProbing.from_items(((key, None) for key in keys), hash_function=hash_function)
+    mask = hash_map.MAX - 1
+    probes = [(slot - hash_map.get_hash(element[0])) & mask
+              for slot, element in enumerate(hash_map.arr) if element is not None]
+    return sum(probes) / len(probes), max(probes)
+
+
+def run():
+    rng = random.Random(SEED)
+    key_sets = {
+        'random words': make_words(NUM_KEYS, rng),
+        'anagrams': make_anagrams(NUM_KEYS, rng),
+    }
+    hash_functions = {
+        'ascii sum (before)': ascii_sum_hash,
+        'built-in hash()': default_hash,
+        'seeded blake2b': make_seeded_hash(SEED),
+    }
+
+    print(f"{'keys':<14}{'hash function':<20}{'avg chain':>10}{'max chain':>10}"
+          f"{'avg probe':>11}{'max probe':>11}{'time (s)':>10}")
+    for key_name, keys in key_sets.items():
+        for hash_name, hash_function in hash_functions.items():
+            start = time.perf_counter()
+            avg_chain, max_chain = chain_stats(keys, hash_function)
+            avg_probe, max_probe = probe_stats(keys, hash_function)
+            elapsed = time.perf_counter() - start
+            print(f"{key_name:<14}{hash_name:<20}{avg_chain:>10.2f}{max_chain:>10}"
+                  f"{avg_probe:>11.2f}{max_probe:>11}{elapsed:>10.2f}")
+
+    # Integer keys (not accepted at all by the ASCII-sum hash): hash(n) == n, so keys sharing a stride
+    # with the table size would all land in the same bucket without the index_for() mixing step
+    int_keys = [i * 1024 for i in range(NUM_KEYS)]
+    avg_chain, max_chain = chain_stats(int_keys, default_hash)
+    avg_probe, max_probe = probe_stats(int_keys, default_hash)
+    print(f"{'ints * 1024':<14}{'built-in hash()':<20}{avg_chain:>10.2f}{max_chain:>10}"
+          f"{avg_probe:>11.2f}{max_probe:>11}")
+
+
+if __name__ == '__main__':
+    run()
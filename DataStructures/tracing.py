@@ -0,0 +1,32 @@
+import logging
+
+# Ready-made trace hooks for the data structures in this package.
+#
+# Every structure accepts an optional 'trace' callback in its constructor (or as the 'trace' attribute).
+# When it is set, each mutating operation calls trace(operation, *details), e.g.
+#     trace('enqueue', item)        trace('set', key, value)        trace('visit', node)
+# When it is None (the default) the operation only pays for a single 'is not None' check:
+# no string formatting, no I/O.
+#
+# Example:
+#     queue = QueueDeque(trace=print_trace)
+#     graph = DirectedGraph(trace=logger_trace(logging.getLogger('graph')))
+
+
+# Time Complexity: O(k), where k is the size of the printed details
+# Prints every operation, like the structures used to do unconditionally.
+def print_trace(operation, *details):
+    print(operation, *details)
+
+
+# Builds a trace hook that forwards every operation to a logging.Logger.
+# The message is only formatted when the logger is enabled for 'level'.
+def logger_trace(logger=None, level=logging.DEBUG):
+    if logger is None:
+        logger = logging.getLogger('DataStructures')
+
+    def trace(operation, *details):
+        if logger.isEnabledFor(level):
+            logger.log(level, '%s %r', operation, details)
+
+    return trace
@@ -0,0 +1,47 @@
+'''
+Time Complexity of Binary Search:
+
+    Best Case:
+        The middle element of the range is already the boundary being searched for, but the search still narrows
+        the range down to a single position to return a bisect position.
+
+        Best-case time complexity: O(log n).
+
+    Average Case:
+        Every comparison halves the range that can contain the answer.
+
+        Average-case time complexity: O(log n).
+
+    Worst Case:
+        The range still has to be halved until it is empty.
+
+        Worst-case time complexity: O(log n).
+
+    Batched Search:
+        m queries are answered with one NumPy searchsorted call for NumPy arrays, or with a sweep over the queries
+        in sorted order where each search starts at the previous answer (see search_common.py).
+
+        Time complexity: O(m log n), plus O(m log m) to order unsorted queries.
+
+    Space Complexity of Binary Search:
+        The search is iterative and only keeps the bounds of the current range.
+
+        Space complexity: O(1) (O(m) for the batched results).
+'''
+
+from SearchingAlgorithms.search_common import SortedSearch
+
+
+# BinarySearch answers bisect queries on a sorted list; the shared methods (search, batched forms) come from SortedSearch.
+class BinarySearch(SortedSearch):
+    def _bisect(self, x, lo, hi, right):
+        # Halve [lo, hi) until it is empty, keeping the elements that go before x on the left of lo
+        arr, key = self.arr, self.key
+        while lo < hi:
+            mid = (lo + hi) // 2
+            value = arr[mid] if key is None else key(arr[mid])
+            if value <= x if right else value < x:
+                lo = mid + 1  # The answer is after mid
+            else:
+                hi = mid  # The answer is mid or before it
+        return lo
@@ -0,0 +1,58 @@
+'''
+Time Complexity of Exponential Search:
+
+    Best Case:
+        The answer is right at the start of the range: the first probe already passes x.
+
+        Best-case time complexity: O(1).
+
+    Average Case:
+        The search probes lo + 1, lo + 2, lo + 4, ... until it passes x, then binary searches the last gap.
+        Both phases take O(log d) steps, where d is the distance from lo to the answer.
+
+        Average-case time complexity: O(log d), at most O(log n).
+
+    Worst Case:
+        The answer is at the end of the range.
+
+        Worst-case time complexity: O(log n).
+
+    Batched Search:
+        Exponential search is the natural fit for the sorted-queries sweep: each search starts at the previous answer,
+        so it only pays for the distance between two consecutive answers.
+
+        Time complexity: O(m log(n / m)) for m sorted queries spread over the array.
+
+    Space Complexity of Exponential Search:
+        Only the probe bounds are kept.
+
+        Space complexity: O(1) (O(m) for the batched results).
+'''
+
+from SearchingAlgorithms.search_common import SortedSearch
+
+
+# ExponentialSearch answers bisect queries on a sorted list by galloping from lo with doubling steps.
+class ExponentialSearch(SortedSearch):
+    def _bisect(self, x, lo, hi, right):
+        arr, key = self.arr, self.key
+
+        # Gallop: find a bound such that the answer lies in (lo + bound // 2, lo + bound]
+        bound = 1
+        while lo + bound <= hi:
+            value = arr[lo + bound - 1] if key is None else key(arr[lo + bound - 1])
+            if not (value <= x if right else value < x):
+                break
+            bound *= 2
+        start = lo + bound // 2
+        end = min(lo + bound, hi)
+
+        # Binary search inside the last gap
+        while start < end:
+            mid = (start + end) // 2
+            value = arr[mid] if key is None else key(arr[mid])
+            if value <= x if right else value < x:
+                start = mid + 1
+            else:
+                end = mid
+        return start
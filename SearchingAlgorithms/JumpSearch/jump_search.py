@@ -0,0 +1,56 @@
+'''
+Time Complexity of Jump Search:
+
+    Best Case:
+        The answer lies in the first block: one jump test, then a scan of at most sqrt(n) elements.
+
+        Best-case time complexity: O(1) jumps, O(sqrt(n)) overall because the block is scanned.
+
+    Average Case:
+        The search jumps ahead sqrt(n) elements at a time until it passes x, then scans the block it jumped over.
+
+        Average-case time complexity: O(sqrt(n)).
+
+    Worst Case:
+        The answer lies in the last block: sqrt(n) jumps plus a scan of sqrt(n) elements.
+
+        Worst-case time complexity: O(sqrt(n)).
+
+    Batched Search:
+        With the queries in sorted order each search starts at the previous answer, so the jumps of all m queries
+        together cross the array only once.
+
+        Time complexity: O(n / sqrt(n) + m * sqrt(n)) = O(m sqrt(n)) in the worst case, far less for clustered queries.
+
+    Space Complexity of Jump Search:
+        Only the current block bounds are kept.
+
+        Space complexity: O(1) (O(m) for the batched results).
+'''
+
+from math import isqrt
+
+from SearchingAlgorithms.search_common import SortedSearch
+
+
+# JumpSearch answers bisect queries on a sorted list by jumping sqrt(n) elements at a time.
+class JumpSearch(SortedSearch):
+    def _bisect(self, x, lo, hi, right):
+        arr, key = self.arr, self.key
+        step = max(1, isqrt(hi - lo))
+
+        # Jump ahead while the last element of the next block still goes before x
+        while lo + step <= hi:
+            value = arr[lo + step - 1] if key is None else key(arr[lo + step - 1])
+            if not (value <= x if right else value < x):
+                break
+            lo += step
+
+        # Linear scan of the block that contains the answer
+        end = min(lo + step, hi)
+        while lo < end:
+            value = arr[lo] if key is None else key(arr[lo])
+            if not (value <= x if right else value < x):
+                break
+            lo += 1
+        return lo
@@ -1 +1,57 @@
+'''
+Time Complexity of Linear Search:
 
+    Best Case:
+        The element (or the bisect position) is the first one checked.
+
+        Best-case time complexity: O(1).
+
+    Average Case:
+        On average half of the range is checked before the answer is found.
+
+        Average-case time complexity: O(n).
+
+    Worst Case:
+        The element is the last one, or is not in the range at all, so every element is checked.
+
+        Worst-case time complexity: O(n).
+
+    Batched Search:
+        With the queries in sorted order each scan starts at the previous answer, so all m queries together
+        scan the array only once, like the merge step of merge sort.
+
+        Time complexity: O(n + m), plus O(m log m) to order unsorted queries.
+
+    Space Complexity of Linear Search:
+        Only the current index is kept.
+
+        Space complexity: O(1) (O(m) for the batched results).
+'''
+
+from SearchingAlgorithms.search_common import SortedSearch, check_bounds
+
+
+# LinearSearch checks the elements one after the other.
+# search() works on any list; the bisect methods (and the batched forms) need the list to be sorted.
+class LinearSearch(SortedSearch):
+    def search(self, x, lo=0, hi=None):
+        """
+        Method returning the index of the first element equal to x, or -1 if x is not in arr[lo:hi].
+        Unlike the other searches, the list does not have to be sorted.
+        """
+        lo, hi = check_bounds(self.arr, lo, hi)
+        arr, key = self.arr, self.key
+        for i in range(lo, hi):
+            if (arr[i] if key is None else key(arr[i])) == x:
+                return i
+        return -1
+
+    def _bisect(self, x, lo, hi, right):
+        # Skip every element that goes before x
+        arr, key = self.arr, self.key
+        while lo < hi:
+            value = arr[lo] if key is None else key(arr[lo])
+            if not (value <= x if right else value < x):
+                break
+            lo += 1
+        return lo
@@ -0,0 +1,75 @@
+import random
+import sys
+import time
+
+from DataStructures.Linear.DirectAccess.Array.array import Array
+from SearchingAlgorithms.BinarySearch.binary_search import BinarySearch
+from SearchingAlgorithms.StaticSearchIndex.static_search_index import BTreeSearch, EytzingerSearch
+
+try:
+    import numpy as np
+except ImportError:  # The vectorized rows are skipped without NumPy
+    np = None
+
+# Benchmark for the static search indexes against BinarySearch and the linear Array.search_element(),
+# on sorted int arrays from L1-cache-sized (8 KB of keys) to far beyond the L3 cache (128 MB of keys).
+# Each row reports the average time per lookup and the speedup over one-at-a-time BinarySearch.
+# The sorted array is a range object (no per-element memory), so only the index layouts take real memory.
+# Array.search_element() scans the array, so it only answers LINEAR_SCAN_BUDGET // n queries (at least one).
+# Run from the repository root:
+#   python -m SearchingAlgorithms.StaticSearchIndex.static_search_index_benchmark [max_log2_size]
+
+SIZES_LOG2 = (10, 14, 17, 20, 23, 24)
+NUM_QUERIES = 200_000
+LINEAR_SCAN_BUDGET = 20_000_000
+SEED = 7
+
+
+def time_per_query(lookup, queries):
+    start = time.perf_counter()
+    lookup(queries)
+    return (time.perf_counter() - start) / len(queries) * 1e6
+
+
+def one_at_a_time(search):
+    def lookup(queries):
+        for query in queries:
+            search(query)
+    return lookup
+
+
+def run(max_log2_size=SIZES_LOG2[-1]):
+    rng = random.Random(SEED)
+    print(f"{'keys':>12}  {'method':<34}{'us/query':>12}{'speedup':>10}")
+    for log2_size in (size for size in SIZES_LOG2 if size <= max_log2_size):
+        n = 1 << log2_size
+        arr = range(0, 2 * n, 2)  # Even numbers: half of the queries hit, half miss
+        queries = [rng.randrange(2 * n) for _ in range(NUM_QUERIES)]
+        rows = {}
+
+        linear = Array()
+        linear.array = arr
+        linear_queries = queries[:max(1, LINEAR_SCAN_BUDGET // n)]
+        rows['Array.search_element'] = time_per_query(one_at_a_time(linear.search_element), linear_queries)
+        rows['BinarySearch.bisect_left'] = time_per_query(one_at_a_time(BinarySearch(arr).bisect_left), queries)
+
+        for index_class in (EytzingerSearch, BTreeSearch):
+            index = index_class(arr)
+            rows[f'{index_class.__name__}.bisect_left'] = time_per_query(one_at_a_time(index.bisect_left), queries)
+            if np is not None:
+                query_array = np.array(queries)
+                rows[f'{index_class.__name__} (NumPy batch)'] = time_per_query(index.bisect_left_many, query_array)
+            del index
+
+        if np is not None:
+            sorted_keys = np.arange(0, 2 * n, 2)
+            query_array = np.array(queries)
+            rows['np.searchsorted (batch)'] = time_per_query(lambda q: np.searchsorted(sorted_keys, q), query_array)
+
+        baseline = rows['BinarySearch.bisect_left']
+        for method, per_query in rows.items():
+            print(f"{n:>12,}  {method:<34}{per_query:>12.3f}{baseline / per_query:>9.1f}x")
+
+
+if __name__ == '__main__':
+    run(int(sys.argv[1]) if len(sys.argv) > 1 else SIZES_LOG2[-1])
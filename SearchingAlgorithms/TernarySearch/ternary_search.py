@@ -0,0 +1,52 @@
+'''
+Time Complexity of Ternary Search:
+
+    Best Case:
+        The range still has to shrink down to a single position to return a bisect position.
+
+        Best-case time complexity: O(log n).
+
+    Average Case:
+        Two probes split the range into thirds and keep one of them, so the range shrinks by a factor of 3
+        every two comparisons. That is about 2 * log3(n) = 1.26 * log2(n) comparisons, more than binary search.
+
+        Average-case time complexity: O(log n).
+
+    Worst Case:
+        Same as the average case: the number of steps only depends on the size of the range.
+
+        Worst-case time complexity: O(log n).
+
+    Batched Search:
+        Same sweep as binary search (see search_common.py).
+
+        Time complexity: O(m log n), plus O(m log m) to order unsorted queries.
+
+    Space Complexity of Ternary Search:
+        The search is iterative and only keeps the bounds of the current range.
+
+        Space complexity: O(1) (O(m) for the batched results).
+'''
+
+from SearchingAlgorithms.search_common import SortedSearch
+
+
+# TernarySearch answers bisect queries on a sorted list by splitting the range into thirds.
+class TernarySearch(SortedSearch):
+    def _bisect(self, x, lo, hi, right):
+        # The answer always lies in [lo, hi]
+        arr, key = self.arr, self.key
+        while lo < hi:
+            third = (hi - lo) // 3
+            mid1 = lo + third
+            mid2 = hi - 1 - third
+            value = arr[mid1] if key is None else key(arr[mid1])
+            if not (value <= x if right else value < x):
+                hi = mid1  # The answer is in the first third
+                continue
+            value = arr[mid2] if key is None else key(arr[mid2])
+            if not (value <= x if right else value < x):
+                lo, hi = mid1 + 1, mid2  # The answer is in the middle third
+            else:
+                lo = mid2 + 1  # The answer is in the last third
+        return lo
@@ -0,0 +1,74 @@
+import bisect
+import random
+import sys
+import time
+
+from SearchingAlgorithms.BinarySearch.binary_search import BinarySearch
+from SearchingAlgorithms.ExponentialSearch.exponential_search import ExponentialSearch
+from SearchingAlgorithms.JumpSearch.jump_search import JumpSearch
+from SearchingAlgorithms.LinearSearch.linear_search import LinearSearch
+from SearchingAlgorithms.TernarySearch.ternary_search import TernarySearch
+
+try:
+    import numpy as np
+except ImportError:  # The NumPy row is skipped without NumPy
+    np = None
+
+# Benchmark for the searching algorithms on a sorted list of NUM_ELEMENTS integers with NUM_QUERIES random queries.
+# Every algorithm answers the queries one at a time with bisect_left() and all at once with bisect_left_many()
+# (sorted-queries sweep), next to the bisect module and, when NumPy is installed, np.searchsorted.
+# One-at-a-time linear and jump search cost O(n) and O(sqrt(n)) per query, so they only run the first
+# SINGLE_QUERY_LIMITS[name] queries; the us/query column stays comparable.
+# Run from the repository root:
+#   python -m SearchingAlgorithms.search_benchmark [num_elements] [num_queries]
+
+NUM_ELEMENTS = 10_000_000
+NUM_QUERIES = 1_000_000
+SINGLE_QUERY_LIMITS = {'LinearSearch': 20, 'JumpSearch': 20_000}
+SEED = 7
+
+ALGORITHMS = [BinarySearch, TernarySearch, ExponentialSearch, JumpSearch, LinearSearch]
+
+
+def bench_single(searcher, queries):
+    start = time.perf_counter()
+    for query in queries:
+        searcher.bisect_left(query)
+    return time.perf_counter() - start
+
+
+def bench_batched(searcher, queries):
+    start = time.perf_counter()
+    searcher.bisect_left_many(queries)
+    return time.perf_counter() - start
+
+
+def report(name, mode, num_queries, elapsed):
+    print(f"{name:<20}{mode:<10}{num_queries:>11,}{elapsed:>10.2f}{elapsed / num_queries * 1e6:>12.2f}")
+
+
+def run(num_elements=NUM_ELEMENTS, num_queries=NUM_QUERIES):
+    rng = random.Random(SEED)
+    arr = list(range(0, 2 * num_elements, 2))  # Even numbers: half of the queries hit, half miss
+    queries = [rng.randrange(2 * num_elements) for _ in range(num_queries)]
+
+    print(f"{'algorithm':<20}{'mode':<10}{'queries':>11}{'time (s)':>10}{'us/query':>12}")
+    for algorithm in ALGORITHMS:
+        searcher = algorithm(arr)
+        single_queries = queries[:SINGLE_QUERY_LIMITS.get(algorithm.__name__, num_queries)]
+        report(algorithm.__name__, 'single', len(single_queries), bench_single(searcher, single_queries))
+        report(algorithm.__name__, 'batched', num_queries, bench_batched(searcher, queries))
+
+    start = time.perf_counter()
+    for query in queries:
+        bisect.bisect_left(arr, query)
+    report('bisect module', 'single', num_queries, time.perf_counter() - start)
+
+    if np is not None:
+        searcher = BinarySearch(np.array(arr))
+        query_array = np.array(queries)
+        report('np.searchsorted', 'batched', num_queries, bench_batched(searcher, query_array))
+
+
+if __name__ == '__main__':
+    run(*(int(arg) for arg in sys.argv[1:3]))
@@ -0,0 +1,131 @@
+'''
+Code shared by the searching algorithms: the SortedSearch base class and batched searching.
+
+Every algorithm answers the same two questions about a sorted array, like the bisect module:
+bisect_left(x) is the first position where x could be inserted keeping the array sorted, bisect_right(x) the last one.
+Subclasses only implement _bisect(), the loop that finds that position; everything else is shared here.
+
+Answering m queries one by one costs m independent searches over the whole array.
+When the array is a NumPy array (and no key function is used), NumPy's searchsorted answers all the queries
+in one vectorized call. Otherwise the queries are visited in sorted order (a merge-style sweep):
+the answer for a query is never before the answer for the previous, smaller query, so every search starts
+where the previous one ended. For linear search this turns m scans of the array into a single one (O(n + m)),
+and jump and exponential search only skip over the part of the array between two consecutive answers.
+'''
+
+try:
+    import numpy as np
+except ImportError:  # NumPy is optional: without it every batch takes the sweep
+    np = None
+
+
+def check_bounds(arr, lo, hi):
+    """
+    Helper function validating the optional 'lo'/'hi' bounds of a search, like the bisect module does.
+
+    :return: The (lo, hi) pair to search, with hi defaulting to len(arr)
+    """
+    if lo < 0:
+        raise ValueError("lo must be non-negative")
+    if hi is None:
+        hi = len(arr)
+    return lo, hi
+
+
+def is_sorted(values):
+    """
+    Helper function checking whether 'values' is in non-decreasing order.
+
+    :return: True if every element is <= the next one
+    """
+    return all(not values[i + 1] < values[i] for i in range(len(values) - 1))
+
+
+def search_many(searcher, queries, right=False):
+    """
+    Answers many bisect queries against the sorted array of 'searcher' in one pass.
+
+    :param searcher: A search object with 'arr' and 'key' attributes and bisect_left/bisect_right(x, lo, hi) methods
+    :param queries: The values to look up (any order)
+    :param right: Return bisect-right positions instead of bisect-left positions
+    :return: List of positions, one per query in the order given (a NumPy array when NumPy did the search)
+    """
+    if np is not None and searcher.key is None and isinstance(searcher.arr, np.ndarray):
+        return np.searchsorted(searcher.arr, queries, side='right' if right else 'left')
+
+    bisect = searcher.bisect_right if right else searcher.bisect_left
+    if is_sorted(queries):
+        order = range(len(queries))
+    else:
+        order = sorted(range(len(queries)), key=queries.__getitem__)  # Visit the queries in increasing order
+
+    positions = [0] * len(queries)
+    lo = 0
+    for i in order:
+        lo = positions[i] = bisect(queries[i], lo)  # The next (larger) query cannot land before this one
+    return positions
+
+
+class SortedSearch:
+    def __init__(self, arr, key=None):
+        """
+        Constructor to initialize the sorted list to search in.
+
+        :param arr: list (or other sequence) sorted in increasing order of key
+        :param key: Optional function applied to the elements of arr before comparing them (not to the searched value)
+        """
+        self.arr = arr  # Store the list in the class instance
+        self.key = key
+
+    def bisect_left(self, x, lo=0, hi=None):
+        """
+        Method returning the first position in arr[lo:hi] where x could be inserted while keeping it sorted
+        (before any elements equal to x).
+
+        :param x: The value to search for
+        :param lo: The starting index of the range to search
+        :param hi: The end index (exclusive) of the range to search, defaults to len(arr)
+        :return: Insertion position i, with every element before i < x and every element from i on >= x
+        """
+        lo, hi = check_bounds(self.arr, lo, hi)
+        return self._bisect(x, lo, hi, False)
+
+    def bisect_right(self, x, lo=0, hi=None):
+        """
+        Method returning the last position in arr[lo:hi] where x could be inserted while keeping it sorted
+        (after any elements equal to x).
+
+        :return: Insertion position i, with every element before i <= x and every element from i on > x
+        """
+        lo, hi = check_bounds(self.arr, lo, hi)
+        return self._bisect(x, lo, hi, True)
+
+    def search(self, x, lo=0, hi=None):
+        """
+        Method returning the index of the first element equal to x, or -1 if x is not in arr[lo:hi].
+        """
+        lo, hi = check_bounds(self.arr, lo, hi)
+        index = self._bisect(x, lo, hi, False)
+        if index < hi:
+            value = self.arr[index] if self.key is None else self.key(self.arr[index])
+            if value == x:
+                return index
+        return -1
+
+    def bisect_left_many(self, queries):
+        """
+        Method returning bisect_left(x) for every x in queries, computed in one batched pass.
+        """
+        return search_many(self, queries)
+
+    def bisect_right_many(self, queries):
+        """
+        Method returning bisect_right(x) for every x in queries, computed in one batched pass.
+        """
+        return search_many(self, queries, right=True)
+
+    def _bisect(self, x, lo, hi, right):
+        """
+        Finds the bisect-left (or bisect-right if 'right') position of x in arr[lo:hi]; lo and hi are already validated.
+        """
+        raise NotImplementedError
@@ -23,50 +23,144 @@ Time Complexity of Bucket Sort:
         Bucket Sort requires extra space for the buckets created for sorting.
 
         Auxiliary space complexity: O(n + k), where `n` is the number of elements and `k` is the number of buckets.
+
+    Adaptive bucket boundaries:
+        Equal-width buckets only work for uniformly distributed data: skewed data piles into a few buckets.
+        Here the boundaries are quantiles of a random sample, so every bucket gets about n / k elements whatever
+        the distribution (only runs of one repeated value can still fill a bucket, and sorting those is cheap).
+        The number of buckets grows with sqrt(n) and each element finds its bucket with a binary search,
+        so distributing costs O(n log k) and sorting the buckets O(n log(n / k)) in total.
+
+    Parallelism:
+        Buckets are independent, so they are sorted concurrently: Python lists in a ProcessPoolExecutor
+        (sorting Python objects holds the GIL), NumPy arrays in threads (NumPy releases the GIL while sorting).
 '''
 
+import os
+import random
+from array import array
+from bisect import bisect_right
+from concurrent.futures import ProcessPoolExecutor, ThreadPoolExecutor
+from itertools import chain
+from math import isqrt
+
+try:
+    import numpy as np
+except ImportError:  # NumPy is optional: without it NumPy-backed inputs are simply not available
+    np = None
+
+# Random number generator used to draw the samples that choose the bucket boundaries
+_random = random.Random()
+
+
 class BucketSort:
-    def __init__(self, arr, num_buckets=10):
+    # Number of sample elements drawn per bucket to estimate the quantiles
+    SAMPLES_PER_BUCKET = 16
+    # Inputs smaller than this are always sorted in the current process (starting workers costs more)
+    PARALLEL_THRESHOLD = 200_000
+
+    def __init__(self, arr, num_buckets=None, workers=None):
         """
         Constructor to initialize the list that needs to be sorted and the number of buckets.
 
-        :param arr: list of elements to be sorted (assumed to be numerical)
-        :param num_buckets: number of buckets to use for sorting
+        :param arr: list, array.array or NumPy array of elements to be sorted (assumed to be numerical)
+        :param num_buckets: number of buckets to use for sorting (default: about sqrt(n))
+        :param workers: number of processes/threads sorting buckets concurrently (default: one per CPU, 1 disables it)
         """
         self.arr = arr  # Store the list in the class instance
-        self.num_buckets = num_buckets  # Set the number of buckets
+        self.num_buckets = num_buckets  # Set the number of buckets (None: scaled to the input size)
+        self.workers = workers if workers is not None else os.cpu_count() or 1
 
     def sort(self):
         """
         Method to perform Bucket Sort on the list stored in the instance.
         """
-        if not self.arr:  # If the input array is empty, return immediately
+        n = len(self.arr)
+        if n < 2:  # Nothing to sort
             return
 
-        # Create empty buckets
-        buckets = [[] for _ in range(self.num_buckets)]
-
-        # Find the maximum and minimum values to determine the range
-        min_value = min(self.arr)
-        max_value = max(self.arr)
-
-        # Calculate the range for each bucket
-        range_of_buckets = (max_value - min_value) / self.num_buckets
+        if np is not None and isinstance(self.arr, np.ndarray):
+            self.sort_numpy(self.arr)
+            return
 
-        # Distribute elements into buckets
+        # Distribute elements into buckets: element x goes to bucket i when boundaries[i - 1] <= x < boundaries[i]
+        boundaries = self.choose_boundaries(self.arr)
+        buckets = [[] for _ in range(len(boundaries) + 1)]
         for num in self.arr:
-            index = int((num - min_value) // range_of_buckets)  # Determine bucket index
-            if index == self.num_buckets:  # Handle the edge case where num is the max value
-                index -= 1
-            buckets[index].append(num)
+            buckets[bisect_right(boundaries, num)].append(num)
 
         # Sort each bucket and concatenate the results
-        sorted_array = []
-        for bucket in buckets:
-            sorted_array.extend(sorted(bucket))  # You can replace sorted() with any sorting algorithm
+        if self.workers > 1 and n >= self.PARALLEL_THRESHOLD and len(buckets) > 1:
+            with ProcessPoolExecutor(max_workers=self.workers) as pool:
+                # A few buckets per task, so each worker gets several tasks without paying per-bucket overhead
+                chunksize = max(1, len(buckets) // (4 * self.workers))
+                buckets = list(pool.map(sorted, buckets, chunksize=chunksize))
+        else:
+            for bucket in buckets:
+                bucket.sort()
 
         # Update the original array with the sorted elements
-        self.arr[:] = sorted_array
+        sorted_values = chain.from_iterable(buckets)
+        if isinstance(self.arr, array):
+            self.arr[:] = array(self.arr.typecode, sorted_values)
+        else:
+            self.arr[:] = list(sorted_values)
+
+    def bucket_count(self, n):
+        """
+        Helper function returning the number of buckets to use for n elements.
+
+        :return: The configured number of buckets, or about sqrt(n)
+        """
+        if self.num_buckets is not None:
+            return max(1, self.num_buckets)
+        return max(1, isqrt(n))
+
+    def choose_boundaries(self, values):
+        """
+        Helper function choosing the bucket boundaries as evenly spaced quantiles of a random sample.
+        Repeated boundaries are merged, so the result can have fewer than num_buckets - 1 entries
+        (an input whose elements are all equal gets a single boundary and therefore never divides by zero).
+
+        :param values: The elements to be sorted
+        :return: Sorted list of distinct boundary values
+        """
+        n = len(values)
+        num_buckets = self.bucket_count(n)
+        sample_size = min(n, num_buckets * self.SAMPLES_PER_BUCKET)
+        sample = sorted(values[_random.randrange(n)] for _ in range(sample_size))
+
+        boundaries = []
+        for i in range(1, num_buckets):
+            boundary = sample[i * sample_size // num_buckets]
+            if not boundaries or boundaries[-1] < boundary:
+                boundaries.append(boundary)
+        return boundaries
+
+    def sort_numpy(self, values):
+        """
+        Helper function sorting the NumPy array 'values' in place.
+        Elements are grouped by bucket with one vectorized searchsorted and a stable argsort,
+        then the buckets (contiguous slices of the grouped array) are sorted in threads.
+
+        :param values: NumPy array of numbers
+        """
+        boundaries = np.array(self.choose_boundaries(values), dtype=values.dtype)
+        bucket_ids = np.searchsorted(boundaries, values, side='right')
+        grouped = values[np.argsort(bucket_ids, kind='stable')]
+        counts = np.bincount(bucket_ids, minlength=len(boundaries) + 1)
+        ends = np.cumsum(counts)
+        starts = ends - counts
+        slices = [grouped[start:end] for start, end in zip(starts.tolist(), ends.tolist()) if end - start > 1]
+
+        if self.workers > 1 and len(values) >= self.PARALLEL_THRESHOLD:
+            with ThreadPoolExecutor(max_workers=self.workers) as pool:
+                list(pool.map(np.ndarray.sort, slices))
+        else:
+            for bucket in slices:
+                bucket.sort()
+
+        values[...] = grouped
 
     def get_sorted_array(self):
         """
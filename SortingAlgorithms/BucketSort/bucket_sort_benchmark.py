@@ -0,0 +1,71 @@
+import random
+import sys
+import time
+
+from SortingAlgorithms.BucketSort.bucket_sort import BucketSort
+
+try:
+    import numpy as np
+except ImportError:  # The NumPy rows are skipped without NumPy
+    np = None
+
+# Benchmark for the adaptive BucketSort on uniform, Zipfian and all-equal floating-point data.
+# Each input is sorted serially (workers=1), with one worker per CPU, with the built-in sorted(),
+# and, when NumPy is installed, as a NumPy array (threads) next to np.sort.
+# With a single CPU, workers defaults to 1 and the 'processes' and NumPy rows run serially too.
+# Run from the repository root:
+#   python -m SortingAlgorithms.BucketSort.bucket_sort_benchmark [num_elements]
+
+NUM_ELEMENTS = 1_000_000
+ZIPF_EXPONENT = 1.2
+ZIPF_DISTINCT_VALUES = 100_000
+SEED = 7
+
+
+def zipf_values(rng, num_elements):
+    # Value k (1 <= k <= ZIPF_DISTINCT_VALUES) is drawn with probability proportional to 1 / k ** ZIPF_EXPONENT
+    cum_weights = []
+    total = 0.0
+    for k in range(1, ZIPF_DISTINCT_VALUES + 1):
+        total += 1 / k ** ZIPF_EXPONENT
+        cum_weights.append(total)
+    return [float(k) for k in rng.choices(range(1, ZIPF_DISTINCT_VALUES + 1), cum_weights=cum_weights, k=num_elements)]
+
+
+def bench_bucket_sort(data, workers):
+    sorter = BucketSort(data, workers=workers)
+    start = time.perf_counter()
+    sorter.sort()
+    return time.perf_counter() - start
+
+
+def bench_function(sort_function, data):
+    start = time.perf_counter()
+    sort_function(data)
+    return time.perf_counter() - start
+
+
+def run(num_elements=NUM_ELEMENTS):
+    rng = random.Random(SEED)
+    inputs = {
+        'uniform': [rng.random() for _ in range(num_elements)],
+        'zipfian': zipf_values(rng, num_elements),
+        'all-equal': [1.0] * num_elements,
+    }
+
+    print(f"{'input':<12}{'method':<26}{'elements':>11}{'time (s)':>10}")
+    for label, data in inputs.items():
+        rows = {
+            'BucketSort (serial)': lambda: bench_bucket_sort(list(data), 1),
+            'BucketSort (processes)': lambda: bench_bucket_sort(list(data), None),
+            'sorted()': lambda: bench_function(sorted, data),
+        }
+        if np is not None:
+            rows['BucketSort (NumPy)'] = lambda: bench_bucket_sort(np.array(data), None)
+            rows['np.sort'] = lambda: bench_function(np.sort, np.array(data))
+        for name, bench in rows.items():
+            print(f"{label:<12}{name:<26}{num_elements:>11,}{bench():>10.3f}")
+
+
+if __name__ == '__main__':
+    run(int(sys.argv[1]) if len(sys.argv) > 1 else NUM_ELEMENTS)
@@ -24,30 +24,100 @@ Time Complexity of Counting Sort:
         which results in an auxiliary space complexity of O(k), where `k` is the range of the input values.
 
         Auxiliary space complexity: O(k).
+
+    Wide ranges and negative numbers:
+        Values are shifted by the minimum, so negative numbers are counted like any others.
+        When the range k is much larger than n, the count array would dominate, so the sort switches to an LSD radix sort
+        over the bytes of the shifted values: one stable pass per byte, O(d * n) time with d = ceil(log2(k) / 8)
+        and O(n) extra space.
+
+    NumPy:
+        When NumPy is installed, NumPy arrays, array.array buffers (viewed in place, not copied)
+        and large Python lists are sorted with np.bincount / np.repeat, or with one stable np.argsort per byte for the radix passes.
 '''
 
+from array import array
+
+try:
+    import numpy as np
+except ImportError:  # NumPy is optional: without it every input takes the pure-Python paths
+    np = None
+
+
 class CountingSort:
+    # Counting sort is used while the range of values is at most RANGE_FACTOR times the number of elements
+    # (or at most MIN_COUNTING_RANGE); wider ranges switch to the LSD radix sort
+    RANGE_FACTOR = 4
+    MIN_COUNTING_RANGE = 256
+    # Python lists with at least this many elements are converted to a NumPy array (when NumPy is installed)
+    NUMPY_THRESHOLD = 1024
+    # array.array typecodes holding integers (NumPy understands the same codes)
+    INTEGER_TYPECODES = 'bBhHiIlLqQ'
+
     def __init__(self, arr):
         """
         Constructor to initialize the list that needs to be sorted.
 
-        :param arr: list of non-negative integers to be sorted
+        :param arr: list, array.array or NumPy array of integers to be sorted (negative values are allowed)
         """
         self.arr = arr  # Store the list in the class instance
 
     def sort(self):
         """
         Method to perform Counting Sort on the list stored in the instance.
+        NumPy arrays and array.array buffers are sorted in place; lists get their contents replaced.
         """
-        if not self.arr:  # If the input array is empty, return immediately
+        if len(self.arr) == 0:  # If the input array is empty, return immediately
             return
 
-        max_val = max(self.arr)  # Find the maximum value in the array
-        count = [0] * (max_val + 1)  # Create a count array with a size of max_val + 1
+        if isinstance(self.arr, array) and self.arr.typecode not in self.INTEGER_TYPECODES:
+            raise ValueError("CountingSort only sorts integers")
+
+        if np is not None:
+            if isinstance(self.arr, np.ndarray):
+                self.sort_numpy(self.arr)
+                return
+            if isinstance(self.arr, array):
+                self.sort_numpy(np.frombuffer(self.arr, dtype=self.arr.typecode))  # A view on the same memory
+                return
+            if len(self.arr) >= self.NUMPY_THRESHOLD:
+                values = np.array(self.arr)
+                if values.dtype.kind in 'iu':  # Python ints that do not fit in 64 bits give an object array
+                    self.sort_numpy(values)
+                    self.arr[:] = values.tolist()
+                    return
+
+        low, high = min(self.arr), max(self.arr)
+        if self.use_counting(high - low + 1):
+            output = self.counting_sort(low, high)
+        else:
+            output = self.radix_sort(low, high)
+
+        # Copy the sorted elements back to the original array
+        if isinstance(self.arr, array):
+            self.arr[:] = array(self.arr.typecode, output)
+        else:
+            self.arr[:] = output
+
+    def use_counting(self, value_range):
+        """
+        Helper function deciding between counting sort and radix sort for 'value_range' distinct possible values.
+
+        :return: True if a count array of that size is affordable
+        """
+        return value_range <= max(self.MIN_COUNTING_RANGE, self.RANGE_FACTOR * len(self.arr))
+
+    def counting_sort(self, low, high):
+        """
+        Helper function performing the stable counting sort on values between 'low' and 'high'.
+
+        :return: New list with the sorted elements
+        """
+        count = [0] * (high - low + 1)  # One counter per possible value, shifted so that 'low' maps to 0
 
         # Count each element's occurrences
         for num in self.arr:
-            count[num] += 1
+            count[num - low] += 1
 
         # Update the count array to reflect positions
         for i in range(1, len(count)):
@@ -58,11 +128,60 @@ class CountingSort:
 
         # Build the output array using the count array
         for num in reversed(self.arr):  # Traverse the input array in reverse for stability
-            output[count[num] - 1] = num
-            count[num] -= 1  # Decrease count for the current number
+            output[count[num - low] - 1] = num
+            count[num - low] -= 1  # Decrease count for the current number
 
-        # Copy the sorted elements back to the original array
-        self.arr[:] = output
+        return output
+
+    def radix_sort(self, low, high):
+        """
+        Helper function performing an LSD radix sort over the bytes of the values shifted by 'low'.
+        Each pass distributes the values into 256 buckets by one byte, least significant byte first;
+        the passes are stable, so after the last one the values are fully sorted.
+
+        :return: New list with the sorted elements
+        """
+        values = [num - low for num in self.arr]  # Non-negative offsets
+        span = high - low
+        shift = 0
+        while span >> shift:
+            buckets = [[] for _ in range(256)]
+            for value in values:
+                buckets[(value >> shift) & 0xFF].append(value)
+            values = [value for bucket in buckets for value in bucket]
+            shift += 8
+        return [value + low for value in values]
+
+    def sort_numpy(self, values):
+        """
+        Helper function sorting the integer NumPy array 'values' in place.
+        The values are shifted by the minimum with 64-bit wraparound arithmetic, which is exact because
+        the range of any 64-bit integer array fits in an unsigned 64-bit integer.
+
+        :param values: NumPy array of integers
+        """
+        if values.dtype.kind not in 'iu':
+            raise ValueError("CountingSort only sorts integers")
+
+        low, high = int(values.min()), int(values.max())
+        low_wrapped = np.int64((low + 2 ** 63) % 2 ** 64 - 2 ** 63)  # 'low' as a two's complement 64-bit integer
+        shifted = values.astype(np.int64)
+        shifted -= low_wrapped  # Offsets from the minimum (may wrap, but every offset is exact modulo 2**64)
+
+        if self.use_counting(high - low + 1):
+            # Count each value, then write every value out as many times as it occurred
+            count = np.bincount(shifted, minlength=high - low + 1)
+            output = np.repeat(np.arange(high - low + 1, dtype=np.int64), count)
+        else:
+            # LSD radix sort: one stable pass per byte of the offsets (NumPy sorts uint8 keys by counting)
+            output = shifted.view(np.uint64)
+            for shift in range(0, (high - low).bit_length(), 8):
+                digits = ((output >> np.uint64(shift)) & np.uint64(0xFF)).astype(np.uint8)
+                output = output[np.argsort(digits, kind='stable')]
+            output = output.view(np.int64)
+
+        output += low_wrapped  # Undo the shift (wrapping back for unsigned 64-bit values above the int64 range)
+        np.copyto(values, output, casting='unsafe')
 
     def get_sorted_array(self):
         """
@@ -0,0 +1,179 @@
+'''
+Time Complexity of Hybrid Sort (Introsort):
+
+    Best Case:
+        Every partition splits its range roughly in half. Sorted, reverse-sorted and many-duplicate inputs
+        all fall in this case thanks to the median-of-three / ninther pivots and the Hoare partition,
+        which splits runs of equal elements evenly.
+
+        Best-case time complexity: O(n log n).
+
+    Average Case:
+        For random input the pivots are close to the median, the partition tree has O(log n) levels,
+        and each level does O(n) work.
+
+        Average-case time complexity: O(n log n).
+
+    Worst Case:
+        Inputs crafted to defeat the pivot rule would make Quick Sort quadratic, but once a range has been
+        partitioned more than 2 * log2(n) times it is finished with Heap Sort instead.
+
+        Worst-case time complexity: O(n log n).
+
+    Space Complexity of Hybrid Sort:
+        The array is sorted in place. Ranges still to be sorted wait on an explicit stack, and the smaller side
+        of each partition is always handled first, so the stack never holds more than O(log n) ranges.
+        There is no recursion, so the size of the input is not limited by Python's recursion limit.
+
+        Worst-case space complexity: O(log n).
+'''
+
+from SortingAlgorithms.InsertionSort.insertion_sort import InsertionSort
+
+
+class HybridSort:
+    # Ranges with at most this many elements are finished with Insertion Sort
+    INSERTION_CUTOFF = 16
+    # Ranges with more than this many elements use the ninther (median of three medians of three) as pivot
+    NINTHER_THRESHOLD = 128
+
+    def __init__(self, arr):
+        """
+        Constructor to initialize the list that needs to be sorted.
+
+        :param arr: list of elements to be sorted
+        """
+        self.arr = arr  # Store the list in the class instance
+        self.insertion_sort = InsertionSort(arr)  # Shares the list, used to finish small ranges
+
+    def median_of_three(self, a, b, c):
+        """
+        Helper function returning whichever of the indices a, b and c holds the median of their three values.
+
+        :return: Index of the median value
+        """
+        arr = self.arr
+        if arr[a] < arr[b]:
+            if arr[b] < arr[c]:
+                return b
+            return c if arr[a] < arr[c] else a
+        if arr[a] < arr[c]:
+            return a
+        return c if arr[b] < arr[c] else b
+
+    def choose_pivot(self, low, high):
+        """
+        Helper function picking the pivot index for arr[low..high]:
+        the median of the first, middle and last elements, or Tukey's ninther for large ranges.
+
+        :return: Index of the pivot element
+        """
+        mid = (low + high) // 2
+        if high - low + 1 <= self.NINTHER_THRESHOLD:
+            return self.median_of_three(low, mid, high)
+        step = (high - low + 1) // 8
+        return self.median_of_three(
+            self.median_of_three(low, low + step, low + 2 * step),
+            self.median_of_three(mid - step, mid, mid + step),
+            self.median_of_three(high - 2 * step, high - step, high),
+        )
+
+    def partition(self, low, high):
+        """
+        Helper function to partition arr[low..high] around the chosen pivot value (Hoare's scheme).
+        Afterwards every element of arr[low..p] is <= pivot and every element of arr[p+1..high] is >= pivot.
+        Elements equal to the pivot stop both scans, so long runs of duplicates are split evenly.
+
+        :param low: The starting index of the subarray
+        :param high: The ending index of the subarray
+        :return: The split index p, with low <= p < high
+        """
+        arr = self.arr
+        pivot_index = self.choose_pivot(low, high)
+        mid = (low + high) // 2
+        arr[pivot_index], arr[mid] = arr[mid], arr[pivot_index]  # Keep the pivot away from the last position
+        pivot = arr[mid]
+
+        i = low - 1
+        j = high + 1
+        while True:
+            i += 1
+            while arr[i] < pivot:  # Find an element on the left that belongs on the right
+                i += 1
+            j -= 1
+            while pivot < arr[j]:  # Find an element on the right that belongs on the left
+                j -= 1
+            if i >= j:
+                return j
+            arr[i], arr[j] = arr[j], arr[i]  # Swap the two misplaced elements
+
+    def heap_sort(self, low, high):
+        """
+        Helper function to Heap Sort arr[low..high] in place.
+        Used when a range has been partitioned too many times (bad pivots), so the worst case stays O(n log n).
+
+        :param low: The starting index of the subarray
+        :param high: The ending index of the subarray
+        """
+        arr = self.arr
+        n = high - low + 1
+
+        def sift_down(root, end):
+            # Move arr[low + root] down until both children are smaller (heap of size 'end')
+            value = arr[low + root]
+            child = 2 * root + 1
+            while child < end:
+                if child + 1 < end and arr[low + child] < arr[low + child + 1]:
+                    child += 1  # Pick the larger child
+                if not value < arr[low + child]:
+                    break
+                arr[low + root] = arr[low + child]
+                root = child
+                child = 2 * root + 1
+            arr[low + root] = value
+
+        # Build a max-heap, then repeatedly move the maximum to the end of the range
+        for root in range(n // 2 - 1, -1, -1):
+            sift_down(root, n)
+        for end in range(n - 1, 0, -1):
+            arr[low], arr[low + end] = arr[low + end], arr[low]
+            sift_down(0, end)
+
+    def sort(self):
+        """
+        Method to perform the Hybrid Sort on the list stored in the instance.
+        Quick Sort partitions large ranges, Heap Sort takes over ranges whose partitions keep coming out lopsided,
+        and Insertion Sort finishes the small ranges. Ranges are kept on an explicit stack instead of recursing.
+        """
+        n = len(self.arr)
+        if n < 2:
+            return
+
+        # Stack of (low, high, depth_limit) ranges still to be sorted
+        stack = [(0, n - 1, 2 * n.bit_length())]
+        while stack:
+            low, high, depth_limit = stack.pop()
+            while high - low + 1 > self.INSERTION_CUTOFF:
+                if depth_limit == 0:
+                    self.heap_sort(low, high)  # Too many partitions: give up on Quick Sort for this range
+                    break
+                depth_limit -= 1
+                p = self.partition(low, high)
+                # Push the larger side and keep working on the smaller one, bounding the stack at O(log n)
+                if p - low < high - p:
+                    stack.append((p + 1, high, depth_limit))
+                    high = p
+                else:
+                    stack.append((low, p, depth_limit))
+                    low = p + 1
+            else:
+                if low < high:
+                    self.insertion_sort.sort(low, high)
+
+    def get_sorted_array(self):
+        """
+        Method to return the sorted array.
+
+        :return: Sorted list
+        """
+        return self.arr
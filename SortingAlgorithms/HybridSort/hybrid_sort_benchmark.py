@@ -0,0 +1,79 @@
+import random
+import sys
+import time
+
+from SortingAlgorithms.HybridSort.hybrid_sort import HybridSort
+from SortingAlgorithms.MergeSort.merge_sort import MergeSort
+from SortingAlgorithms.QuickSort.quick_sort import QuickSort
+
+# Benchmark for HybridSort against QuickSort, MergeSort and the built-in sorted() on
+# random, sorted, reversed and many-duplicate inputs. Every sorter gets its own copy of the input.
+# QuickSort always pivots on the last element, so it is quadratic and recurses once per element on
+# the sorted, reversed and many-duplicate inputs. Those runs are capped at QUICKSORT_DEGENERATE_LIMIT
+# elements and are reported as "RecursionError" when they overflow Python's recursion limit.
+# Run from the repository root:
+#   python -m SortingAlgorithms.HybridSort.hybrid_sort_benchmark [num_elements]
+
+NUM_ELEMENTS = 200_000
+QUICKSORT_DEGENERATE_LIMIT = 5_000
+NUM_DISTINCT_DUPLICATES = 10
+SEED = 7
+
+
+def run_hybrid(arr):
+    sorter = HybridSort(arr)
+    sorter.sort()
+    return sorter.get_sorted_array()
+
+
+def run_quick(arr):
+    sorter = QuickSort(arr)
+    sorter.sort()
+    return sorter.get_sorted_array()
+
+
+def run_merge(arr):
+    return MergeSort(arr).get_sorted_array()
+
+
+SORTERS = {
+    'HybridSort': run_hybrid,
+    'QuickSort': run_quick,
+    'MergeSort': run_merge,
+    'sorted()': sorted,
+}
+
+
+def bench(sort_function, data):
+    arr = list(data)
+    start = time.perf_counter()
+    result = sort_function(arr)
+    elapsed = time.perf_counter() - start
+    if result != sorted(data):
+        raise AssertionError(f"{sort_function.__name__} returned an unsorted result")
+    return elapsed
+
+
+def run(num_elements=NUM_ELEMENTS):
+    rng = random.Random(SEED)
+    random_data = [rng.random() for _ in range(num_elements)]
+    inputs = {
+        'random': random_data,
+        'sorted': sorted(random_data),
+        'reversed': sorted(random_data, reverse=True),
+        'many-duplicates': [rng.randrange(NUM_DISTINCT_DUPLICATES) for _ in range(num_elements)],
+    }
+
+    print(f"{'input':<18}{'sorter':<12}{'elements':>11}{'time (s)':>16}")
+    for label, data in inputs.items():
+        for name, sort_function in SORTERS.items():
+            sample = data[:QUICKSORT_DEGENERATE_LIMIT] if name == 'QuickSort' and label != 'random' else data
+            try:
+                result = f"{bench(sort_function, sample):.3f}"
+            except RecursionError:
+                result = "RecursionError"
+            print(f"{label:<18}{name:<12}{len(sample):>11,}{result:>16}")
+
+
+if __name__ == '__main__':
+    run(int(sys.argv[1]) if len(sys.argv) > 1 else NUM_ELEMENTS)
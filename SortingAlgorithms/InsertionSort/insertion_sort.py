@@ -35,24 +35,32 @@ class InsertionSort:
         """
         self.arr = arr  # Store the list in the class instance
 
-    def sort(self):
+    def sort(self, low=None, high=None):
         """
         Method to perform the Insertion Sort on the list stored in the instance.
+        Only the slice arr[low..high] (both inclusive) is sorted when bounds are given,
+        which lets hybrid sorts hand their small partitions to this class.
+
+        :param low: The starting index of the subarray to sort
+        :param high: The ending index of the subarray to sort
         """
-        n = len(self.arr)  # Get the number of elements in the list
+        # A missing bound defaults to the start or the end of the array
+        low = 0 if low is None else low
+        high = len(self.arr) - 1 if high is None else high
+        arr = self.arr
 
         # Traverse from the second element to the last
-        for i in range(1, n):
-            key = self.arr[i]  # Element to be inserted in the sorted sublist
+        for i in range(low + 1, high + 1):
+            key = arr[i]  # Element to be inserted in the sorted sublist
             j = i - 1
 
             # Shift elements of the sorted sublist that are greater than the key to one position ahead
-            while j >= 0 and self.arr[j] > key:
-                self.arr[j + 1] = self.arr[j]  # Move element to the right
+            while j >= low and arr[j] > key:
+                arr[j + 1] = arr[j]  # Move element to the right
                 j -= 1
 
             # Insert the key into its correct position
-            self.arr[j + 1] = key
+            arr[j + 1] = key
 
     def get_sorted_array(self):
         """
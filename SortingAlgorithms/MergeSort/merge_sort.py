@@ -24,9 +24,21 @@ Time Complexity of Merge Sort:
         for temporary subarrays during the merge step.
 
         Worst-case space complexity: O(n).
+
+        sort() slices the array at every level and builds a new merged list for every merge.
+        sort_in_place() merges bottom-up inside the array itself and reuses a single auxiliary buffer
+        of n/2 slots (plus the list of keys when key= is given); its bulk moves only add short-lived slices.
 '''
 
+from bisect import bisect_left, bisect_right
+
+
 class MergeSort:
+    # sort_in_place() first sorts blocks of this many elements with binary insertion sort
+    MIN_RUN = 32
+    # After this many consecutive wins by the same run, a merge switches to galloping (bulk copies)
+    MIN_GALLOP = 7
+
     def __init__(self, arr):
         """
         Constructor to initialize the list that needs to be sorted.
@@ -46,14 +58,14 @@ class MergeSort:
         merged = []
         i = j = 0
 
-        # Merge the two sorted arrays
+        # Merge the two sorted arrays (on ties the left element goes first, which keeps the sort stable)
         while i < len(left) and j < len(right):
-            if left[i] < right[j]:
-                merged.append(left[i])
-                i += 1
-            else:
+            if right[j] < left[i]:
                 merged.append(right[j])
                 j += 1
+            else:
+                merged.append(left[i])
+                i += 1
 
         # If any elements remain in the left subarray, append them
         merged.extend(left[i:])
@@ -86,6 +98,147 @@ class MergeSort:
         # Merge the sorted halves
         return self.merge(left, right)
 
+    def sort_in_place(self, key=None, reverse=False):
+        """
+        Method to perform a stable bottom-up Merge Sort directly on the list stored in the instance.
+        Blocks of MIN_RUN elements are sorted with binary insertion sort, then runs of doubling width are merged.
+        Instead of a new list per level and per merge, all merges share one auxiliary buffer allocated up front,
+        and long stretches that are already in order are skipped or copied in bulk (galloping).
+        The bulk moves (insertion-sort shifts and galloping copies) go through temporary slices, so the sort is not
+        allocation-free, but those lists are short-lived and never larger than the run being moved.
+
+        :param key: Optional function computing the comparison key of each element (called once per element)
+        :param reverse: Sort in descending order, still keeping equal elements in their original order
+        :return: The sorted list (the same list object as self.arr)
+        """
+        arr = self.arr
+        n = len(arr)
+        if n < 2:
+            return arr
+
+        # Like list.sort(): reversing before and after a stable ascending sort gives a stable descending sort
+        if reverse:
+            arr.reverse()
+
+        if key is None:
+            keys, values = arr, None  # The elements are their own keys
+        else:
+            keys, values = [key(item) for item in arr], arr  # Keys are computed once and moved along with the values
+
+        # The right run of every merge has at most n // 2 elements, and only the right run is copied out
+        key_buffer = [None] * (n // 2)
+        value_buffer = [None] * (n // 2) if values is not None else None
+
+        # Sort each block of MIN_RUN elements with binary insertion sort
+        for start in range(0, n, self.MIN_RUN):
+            end = min(start + self.MIN_RUN, n)
+            for i in range(start + 1, end):
+                item_key = keys[i]
+                pos = bisect_right(keys, item_key, start, i)  # After any equal keys, to stay stable
+                if pos < i:
+                    keys[pos + 1:i + 1] = keys[pos:i]  # Shift the larger elements one slot right
+                    keys[pos] = item_key
+                    if values is not None:
+                        item = values[i]
+                        values[pos + 1:i + 1] = values[pos:i]
+                        values[pos] = item
+
+        # Merge pairs of neighbouring runs, doubling the run width on every pass
+        width = self.MIN_RUN
+        while width < n:
+            for low in range(0, n - width, 2 * width):
+                self.merge_runs(keys, values, key_buffer, value_buffer, low, low + width, min(low + 2 * width, n))
+            width *= 2
+
+        if reverse:
+            arr.reverse()
+        return arr
+
+    def merge_runs(self, keys, values, key_buffer, value_buffer, low, mid, high):
+        """
+        Helper function to merge the sorted runs keys[low:mid] and keys[mid:high] in place (moving values alongside).
+        The right run is copied into the buffer and the merge fills the array from the back.
+
+        :param keys: The list of comparison keys
+        :param values: The list of elements moved alongside the keys, or None if the elements are the keys
+        :param key_buffer: Auxiliary buffer for keys, at least as long as the right run
+        :param value_buffer: Auxiliary buffer for values (None if values is None)
+        :param low: The starting index of the left run
+        :param mid: The starting index of the right run
+        :param high: The end index (exclusive) of the right run
+        """
+        if not keys[mid] < keys[mid - 1]:
+            return  # The two runs are already in order
+
+        # Gallop over the prefix of the left run and the suffix of the right run that are already in place
+        low = bisect_right(keys, keys[mid], low, mid)
+        high = bisect_left(keys, keys[mid - 1], mid, high)
+
+        # Copy the right run into the buffer element by element (a slice would allocate a temporary list)
+        size = high - mid
+        for t in range(size):
+            key_buffer[t] = keys[mid + t]
+        if values is not None:
+            for t in range(size):
+                value_buffer[t] = values[mid + t]
+
+        i = mid - 1  # Last unmerged element of the left run (still in the array)
+        j = size - 1  # Last unmerged element of the right run (in the buffer)
+        k = high - 1  # Next slot to fill, from the back
+        left_wins = right_wins = 0
+        min_gallop = self.MIN_GALLOP
+        while i >= low and j >= 0:
+            if key_buffer[j] < keys[i]:
+                # The left element is larger: it goes last
+                keys[k] = keys[i]
+                if values is not None:
+                    values[k] = values[i]
+                i -= 1
+                left_wins += 1
+                right_wins = 0
+                if left_wins >= min_gallop and i >= low:
+                    # Move every remaining left element larger than the buffered one in one bulk copy
+                    start = bisect_right(keys, key_buffer[j], low, i + 1)
+                    count = i + 1 - start
+                    k -= 1
+                    if count:
+                        keys[k - count + 1:k + 1] = keys[start:i + 1]
+                        if values is not None:
+                            values[k - count + 1:k + 1] = values[start:i + 1]
+                        i -= count
+                        k -= count
+                    left_wins = 0
+                    continue
+            else:
+                # Ties take the right element first, which keeps equal elements in their original order
+                keys[k] = key_buffer[j]
+                if values is not None:
+                    values[k] = value_buffer[j]
+                j -= 1
+                right_wins += 1
+                left_wins = 0
+                if right_wins >= min_gallop and j >= 0:
+                    # Move every remaining buffered element not smaller than the left one in one bulk copy
+                    start = bisect_left(key_buffer, keys[i], 0, j + 1)
+                    count = j + 1 - start
+                    k -= 1
+                    if count:
+                        keys[k - count + 1:k + 1] = key_buffer[start:j + 1]
+                        if values is not None:
+                            values[k - count + 1:k + 1] = value_buffer[start:j + 1]
+                        j -= count
+                        k -= count
+                    right_wins = 0
+                    continue
+            k -= 1
+
+        # Whatever is left of the right run goes to the front; leftovers of the left run are already in place
+        for t in range(j + 1):
+            keys[low + t] = key_buffer[t]
+        if values is not None:
+            for t in range(j + 1):
+                values[low + t] = value_buffer[t]
+
     def get_sorted_array(self):
         """
         Method to return the sorted array.
@@ -0,0 +1,76 @@
+import random
+import sys
+import time
+import tracemalloc
+
+from SortingAlgorithms.MergeSort.merge_sort import MergeSort
+
+# Benchmark comparing the recursive MergeSort.sort() (slices and new merged lists at every level)
+# with the bottom-up MergeSort.sort_in_place() (one shared buffer) on random integers.
+# Wall time is measured in one run and the peak traced memory in a second run, because tracemalloc
+# slows allocation-heavy code down a lot. Peak memory excludes the input list itself.
+# Sorting 10M integers in pure Python takes minutes per run; pass a smaller size for a quick check.
+# Run from the repository root:
+#   python -m SortingAlgorithms.MergeSort.merge_sort_benchmark [num_elements]
+
+NUM_ELEMENTS = 10_000_000
+SEED = 7
+
+
+def run_recursive(arr):
+    return MergeSort(arr).sort()
+
+
+def run_in_place(arr):
+    return MergeSort(arr).sort_in_place()
+
+
+def run_in_place_key(arr):
+    return MergeSort(arr).sort_in_place(key=abs)
+
+
+def run_in_place_reverse(arr):
+    return MergeSort(arr).sort_in_place(reverse=True)
+
+
+SORTERS = {
+    'sort()': run_recursive,
+    'sort_in_place()': run_in_place,
+    'sort_in_place(key=abs)': run_in_place_key,
+    'sort_in_place(reverse)': run_in_place_reverse,
+}
+
+
+def measure_time(sort_function, data):
+    arr = list(data)
+    start = time.perf_counter()
+    sort_function(arr)
+    return time.perf_counter() - start
+
+
+def measure_peak(sort_function, data):
+    arr = list(data)
+    tracemalloc.start()
+    sort_function(arr)
+    _, peak = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    return peak
+
+
+def run(num_elements=NUM_ELEMENTS):
+    rng = random.Random(SEED)
+    inputs = {
+        'random': [rng.randrange(-num_elements, num_elements) for _ in range(num_elements)],
+    }
+    inputs['sorted'] = sorted(inputs['random'])
+
+    print(f"{'input':<10}{'method':<25}{'elements':>12}{'time (s)':>10}{'peak (MB)':>11}")
+    for label, data in inputs.items():
+        for name, sort_function in SORTERS.items():
+            elapsed = measure_time(sort_function, data)
+            peak = measure_peak(sort_function, data) / 2 ** 20
+            print(f"{label:<10}{name:<25}{num_elements:>12,}{elapsed:>10.2f}{peak:>11.1f}")
+
+
+if __name__ == '__main__':
+    run(int(sys.argv[1]) if len(sys.argv) > 1 else NUM_ELEMENTS)